@@ -11,12 +11,13 @@ import argparse
 from yaml import safe_dump
 from fosslight_util.set_log import init_log
 from fosslight_util.spdx_licenses import get_spdx_licenses_json, get_license_from_nick
-from fosslight_util.output_format import check_output_format
-from fosslight_util.exclude import excluding_files
 from datetime import datetime
 from fosslight_prechecker._precheck import precheck_for_project, precheck_for_files, dump_error_msg, \
                                            get_path_to_find, DEFAULT_EXCLUDE_EXTENSION_FILES
-from fosslight_prechecker._result import get_total_file_list
+from fosslight_prechecker._result import get_total_file_list, check_output_format
+from fosslight_prechecker._exclude import PathExcludeIndex, get_exclude_index
+from fosslight_prechecker._cache import LintCache
+from fosslight_prechecker._analysis import get_scan_options
 from fosslight_prechecker._add_header import add_header, reuse_parser
 from reuse._comment import EXTENSION_COMMENT_STYLE_MAP_LOWERCASE
 from reuse.project import Project
@@ -257,6 +258,9 @@ def is_exclude_dir(dir_path: str) -> Optional[bool]:
 
 
 def get_spdx_license_list():
+    if spdx_licenses:
+        # Already loaded
+        return
     try:
         success, error_msg, licenses = get_spdx_licenses_json()
         if success is False:
@@ -272,45 +276,20 @@ def get_spdx_license_list():
         dump_error_msg(f"Error access to get_spdx_licenses_json : {ex}")
 
 
-def add_content(
-    target_path: str = "",
+def add_missing_content(
+    path_to_find: str,
+    file_to_check_list: List[str],
+    _check_only_file_mode: bool,
+    exclude_index: PathExcludeIndex,
     input_license: str = "",
     input_copyright: str = "",
     input_dl_url: str = "",
-    output_path: str = "",
-    need_log_file: bool = True,
-    exclude_path: list = []
+    cache: Optional[LintCache] = None,
+    jobs: int = 0
 ) -> None:
-    global _result_log
-    _check_only_file_mode = False
-    file_to_check_list = []
-    missing_license = []
-
-    path_to_find, file_to_check_list, _check_only_file_mode = get_path_to_find(target_path, _check_only_file_mode)
-
-    _, _, output_path, _, _ = check_output_format(output_path)
-    if output_path == "":
-        output_path = os.getcwd()
-    else:
-        output_path = os.path.abspath(output_path)
-
-    user_exclude_path = excluding_files(exclude_path, path_to_find)
-    abs_path_to_exclude = [os.path.abspath(path) for path in user_exclude_path]
-
-    now = datetime.now().strftime('%y%m%d_%H%M')
-    logger, _result_log = init_log(os.path.join(output_path, f"fosslight_log_pre_{now}.txt"),
-                                   need_log_file, logging.INFO, logging.DEBUG, PKG_NAME, path_to_find)
-
-    if not os.path.isdir(path_to_find):
-        logger.error(f"(-p option) Check the path to find : {path_to_find}")
-        sys.exit(1)
-
-    # Get SPDX License List
-    get_spdx_license_list()
-
     if _check_only_file_mode:
         main_parser = reuse_parser()
-        missing_license_list, missing_copyright_list, project = precheck_for_files(path_to_find, file_to_check_list)
+        missing_license_list, missing_copyright_list, project = precheck_for_files(path_to_find, file_to_check_list, cache, jobs)
 
         if input_license == "" and input_copyright == "" and input_dl_url == "":
             input_copyright = input_copyright_while_running()
@@ -337,10 +316,10 @@ def add_content(
             add_dl_url_into_file(main_parser, project, path_to_find, input_dl_url, file_to_check_list)
     else:
         # Get missing license / copyright file list
-        missing_license, missing_copyright, _, project, prj_report = precheck_for_project(path_to_find, abs_path_to_exclude)
+        missing_license, missing_copyright, _, project, prj_report = precheck_for_project(path_to_find, exclude_index, cache, jobs)
 
         # Get total files except excluded file
-        total_files_excluded = get_total_file_list(path_to_find, prj_report, DEFAULT_EXCLUDE_EXTENSION_FILES, abs_path_to_exclude)
+        total_files_excluded = get_total_file_list(path_to_find, prj_report, DEFAULT_EXCLUDE_EXTENSION_FILES, exclude_index)
         skip_files = sorted(set(total_files_excluded) - set(missing_license) - set(missing_copyright))
         logger.info(f"\n# File list that have both license and copyright : {len(skip_files)} / {len(total_files_excluded)}")
 
@@ -351,7 +330,7 @@ def add_content(
         missing_copyright = [file for file in missing_copyright if os.path.splitext(file)[1].lower() in EXTENSION_COMMENT_STYLE_MAP_LOWERCASE]
 
         # Check license and copyright of each file
-        precheck_for_files(path_to_find, skip_files)
+        precheck_for_files(path_to_find, skip_files, cache, jobs)
 
         # Set missing license and copyright
         set_missing_license_copyright(missing_license,
@@ -362,4 +341,52 @@ def add_content(
                                       input_copyright,
                                       total_files_excluded,
                                       input_dl_url)
+
+
+def add_content(
+    target_path: str = "",
+    input_license: str = "",
+    input_copyright: str = "",
+    input_dl_url: str = "",
+    output_path: str = "",
+    need_log_file: bool = True,
+    exclude_path: list = [],
+    cache_dir: str = "",
+    jobs: int = 0
+) -> None:
+    global _result_log
+    _check_only_file_mode = False
+    file_to_check_list = []
+
+    path_to_find, file_to_check_list, _check_only_file_mode = get_path_to_find(target_path, _check_only_file_mode)
+
+    _, _, output_path, _, _ = check_output_format(output_path)
+    if output_path == "":
+        output_path = os.getcwd()
+    else:
+        output_path = os.path.abspath(output_path)
+
+    exclude_index = get_exclude_index(exclude_path, path_to_find)
+
+    now = datetime.now().strftime('%y%m%d_%H%M')
+    logger, _result_log = init_log(os.path.join(output_path, f"fosslight_log_pre_{now}.txt"),
+                                   need_log_file, logging.INFO, logging.DEBUG, PKG_NAME, path_to_find)
+
+    if not os.path.isdir(path_to_find):
+        logger.error(f"(-p option) Check the path to find : {path_to_find}")
+        sys.exit(1)
+
+    # Get SPDX License List
+    get_spdx_license_list()
+
+    cache = None
+    if cache_dir:
+        cache = LintCache(cache_dir, options=get_scan_options())
+        cache.load()
+
+    add_missing_content(path_to_find, file_to_check_list, _check_only_file_mode, exclude_index,
+                        input_license, input_copyright, input_dl_url, cache, jobs)
+
+    if cache:
+        cache.save()
     save_result_log()
@@ -19,6 +19,7 @@ import sys
 import re
 import fosslight_util.constant as constant
 from os import PathLike
+from functools import lru_cache
 from gettext import gettext as _
 from pathlib import Path
 from typing import NamedTuple, Optional, Set
@@ -103,8 +104,11 @@ def get_loader():
     return loader
 
 
-_ENV = Environment(loader=get_loader(), autoescape=select_autoescape([]), trim_blocks=True)
-DEFAULT_TEMPLATE = _ENV.get_template("default_template.jinja2")
+@lru_cache(maxsize=None)
+def get_default_template() -> Template:
+    # Loaded when a header is added, not when the module is imported
+    env = Environment(loader=get_loader(), autoescape=select_autoescape([]), trim_blocks=True)
+    return env.get_template("default_template.jinja2")
 
 
 def extract_spdx_info(text: str) -> SpdxInfo:
@@ -157,7 +161,7 @@ def _create_new_header(
         information.
     """
     if template is None:
-        template = DEFAULT_TEMPLATE
+        template = get_default_template()
         logger.warning(f"Using default template: {template}")
     if style is None:
         style = PythonCommentStyle
@@ -216,7 +220,7 @@ def create_header(
         information.
     """
     if template is None:
-        template = DEFAULT_TEMPLATE
+        template = get_default_template()
     if style is None:
         style = PythonCommentStyle
 
@@ -0,0 +1,347 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+import io
+import os
+import re
+import sys
+import mmap
+import time
+import logging
+import fosslight_util.constant as constant
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from boolean.boolean import ParseError
+from debian.copyright import Copyright, Error as DebianError
+from license_expression import ExpressionError
+from reuse._util import _LICENSING, _copyright_from_dep5, _determine_license_path, decoded_text_from_binary, extract_spdx_info
+from reuse.project import Project
+from fosslight_prechecker._constant import DEFAULT_SCAN_BYTES
+from fosslight_prechecker._cache import FileInfo, LintCache
+from fosslight_prechecker._exclude import FileExcludeSet
+from fosslight_prechecker._profile import get_profiler, profile_phase
+
+ANALYSIS_CHUNK_SIZE = 256
+MIN_FILES_FOR_PROCESS_POOL = 64
+# Start of an SPDX tag or a copyright notice, to skip decoding the whole file if there is none
+_TAG_PATTERN = re.compile(rb"SPDX-|Copyright|\xc2\xa9")
+# Bytes read after the leading bytes to scan, to find the end of the line they end in
+_LINE_END_MAX_BYTES = 1024
+
+logger = logging.getLogger(constant.LOGGER_NAME)
+
+
+def get_scan_options(scan_bytes: int = DEFAULT_SCAN_BYTES, full_scan: bool = False) -> str:
+    return f"scan {scan_bytes} bytes to the end of the line" + (", full scan" if full_scan else "")
+
+
+def _decode_leading_bytes(head: bytes, scan_bytes: int) -> str:
+    # Decode the leading scan_bytes of head(read with _LINE_END_MAX_BYTES more bytes), to the end of the line
+    # they end in. A line which doesn't end in the more bytes is dropped,
+    # not to take a part of a tag(ex. 'Apache-' of 'Apache-2.0') as the whole.
+    text = head
+    if len(head) > scan_bytes:
+        line_end = head.find(b"\n", scan_bytes - 1)
+        if line_end >= 0:
+            text = head[:line_end + 1]
+        elif len(head) > scan_bytes + _LINE_END_MAX_BYTES:
+            text = head[:head.rfind(b"\n", 0, scan_bytes) + 1]
+    return text.decode("utf-8", errors="replace").replace("\r\n", "\n")
+
+
+def _read_whole_file_with_tags(fp) -> str:
+    # Return the decoded contents only if there is any tag in the file
+    if not os.fstat(fp.fileno()).st_size:
+        return ""
+    with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if not _TAG_PATTERN.search(mm):
+            return ""
+        return mm[:].decode("utf-8", errors="replace").replace("\r\n", "\n")
+
+
+def _to_file_info(spdx_info) -> FileInfo:
+    file_info = FileInfo()
+    file_info.licenses = [(str(expression), list(_LICENSING.license_keys(expression)))
+                          for expression in spdx_info.spdx_expressions]
+    file_info.copyright_lines = sorted(spdx_info.copyright_lines)
+    return file_info
+
+
+def extract_file_info(path: Path, scan_bytes: int = DEFAULT_SCAN_BYTES, full_scan: bool = False) -> FileInfo:
+    # Same as the file part of Project.spdx_info_of, but only the leading scan_bytes are scanned.
+    # With full_scan, the whole file is scanned if the license or copyright is not found in them.
+    with path.open("rb") as fp:
+        try:
+            spdx_info = extract_spdx_info(_decode_leading_bytes(fp.read(scan_bytes + _LINE_END_MAX_BYTES + 1), scan_bytes))
+            if full_scan and not (spdx_info.spdx_expressions and spdx_info.copyright_lines):
+                text = _read_whole_file_with_tags(fp)
+                if text:
+                    spdx_info = extract_spdx_info(text)
+        except (ExpressionError, ParseError):
+            logger.error(f"'{path}' holds an SPDX expression that cannot be parsed, skipping the file")
+            return FileInfo()
+    return _to_file_info(spdx_info)
+
+
+def extract_file_info_from_contents(
+    name: str,
+    contents: bytes,
+    scan_bytes: int = DEFAULT_SCAN_BYTES,
+    full_scan: bool = False
+) -> FileInfo:
+    # Same as extract_file_info, for the contents already read such as a staged blob
+    try:
+        spdx_info = extract_spdx_info(_decode_leading_bytes(contents[:scan_bytes + _LINE_END_MAX_BYTES + 1], scan_bytes))
+        if full_scan and not (spdx_info.spdx_expressions and spdx_info.copyright_lines) \
+           and len(contents) > scan_bytes and _TAG_PATTERN.search(contents):
+            spdx_info = extract_spdx_info(decoded_text_from_binary(io.BytesIO(contents)))
+    except (ExpressionError, ParseError):
+        logger.error(f"'{name}' holds an SPDX expression that cannot be parsed, skipping the file")
+        return FileInfo()
+    return _to_file_info(spdx_info)
+
+
+def parse_dep5(contents: bytes) -> Optional[Copyright]:
+    # Same as Project._copyright, for .reuse/dep5 not read from the working tree
+    try:
+        return Copyright(io.StringIO(contents.decode("utf-8"))) or None
+    except DebianError:
+        logger.error(".reuse/dep5 has syntax errors")
+    except UnicodeError:
+        logger.error(".reuse/dep5 could not be parsed as utf-8")
+    return None
+
+
+def _extract_file_info_safely(
+    path: Path,
+    scan_bytes: int = DEFAULT_SCAN_BYTES,
+    full_scan: bool = False
+) -> Tuple[Path, Optional[FileInfo], Optional[Exception], float]:
+    # With the seconds taken to analyze the file, for --profile
+    start = time.perf_counter()
+    try:
+        return path, extract_file_info(path, scan_bytes, full_scan), None, time.perf_counter() - start
+    except Exception as ex:
+        return path, None, ex, time.perf_counter() - start
+
+
+class FileRecord:
+    # License identifiers and copyright of a file, which is all the result needs instead of FileReport of reuse.
+    # The identifiers and the copyright are interned, since most files of a project have the same ones.
+    __slots__ = ("licenses", "copyright")
+
+    def __init__(self, licenses: Tuple[str, ...] = (), copyright: str = ""):
+        self.licenses = licenses
+        self.copyright = copyright
+
+
+class LintReport:
+    # Records of the analyzed files by the path relative to the path to find, instead of ProjectReport of reuse
+    def __init__(self):
+        self.records: Dict[str, FileRecord] = {}
+        self.read_errors: Set[str] = set()
+        # Files with license and copyright in the folders unchanged from the previous run(DirIndex), not in the records
+        self.reused_file_count = 0
+        self.reused_licenses: Set[str] = set()
+
+    @property
+    def files_without_licenses(self) -> List[str]:
+        return [rel_path for rel_path, record in self.records.items() if not record.licenses]
+
+    @property
+    def files_without_copyright(self) -> List[str]:
+        return [rel_path for rel_path, record in self.records.items() if not record.copyright]
+
+    @property
+    def used_licenses(self) -> Set[str]:
+        return {identifier for record in self.records.values() for identifier in record.licenses} | self.reused_licenses
+
+
+def merge_licenses_and_copyright(
+    file_info: FileInfo,
+    license_path: Path,
+    dep5: Optional[Copyright] = None,
+    excluded: bool = False
+) -> Tuple[List[str], str]:
+    # License identifiers and copyright of the file with the ones of .reuse/dep5,
+    # where license_path is the file having the information(or its .license file) relative to the root
+    licenses = dict(file_info.licenses)
+    copyright_lines = set(file_info.copyright_lines)
+    if excluded:
+        # Takes precedence over .reuse/dep5 of the project
+        licenses.setdefault("-", ["-"])
+        copyright_lines.add("-")
+    elif dep5:
+        dep5_result = _copyright_from_dep5(license_path, dep5)
+        for expression in dep5_result.spdx_expressions:
+            licenses.setdefault(str(expression), list(_LICENSING.license_keys(expression)))
+        copyright_lines.update(dep5_result.copyright_lines)
+
+    identifiers = [identifier for identifiers_in_expression in licenses.values() for identifier in identifiers_in_expression]
+    return identifiers, "\n".join(sorted(copyright_lines))
+
+
+def _get_licenses_and_copyright(
+    project: Project,
+    path: Path,
+    file_info: FileInfo,
+    exclude_set: Optional[FileExcludeSet] = None
+) -> Tuple[List[str], str]:
+    license_path = project.relative_from_root(_determine_license_path(path))
+    excluded = bool(exclude_set) and exclude_set.is_excluded(str(license_path))
+    return merge_licenses_and_copyright(file_info, license_path, None if excluded else project._copyright, excluded)
+
+
+def build_file_record(
+    project: Project,
+    path: Path,
+    file_info: FileInfo,
+    exclude_set: Optional[FileExcludeSet] = None
+) -> FileRecord:
+    return make_file_record(*_get_licenses_and_copyright(project, path, file_info, exclude_set))
+
+
+def make_file_record(licenses: List[str], copyright: str) -> FileRecord:
+    return FileRecord(tuple(sys.intern(identifier) for identifier in licenses), sys.intern(copyright))
+
+
+def _extract_file_infos_in_batch(
+    paths: List[Path],
+    scan_bytes: int = DEFAULT_SCAN_BYTES,
+    full_scan: bool = False
+) -> List[Tuple[Path, Optional[FileInfo], Optional[Exception], float]]:
+    return [_extract_file_info_safely(path, scan_bytes, full_scan) for path in paths]
+
+
+def get_jobs(jobs: int = 0) -> int:
+    if jobs is None or jobs <= 0:
+        jobs = os.cpu_count() or 1
+    return jobs
+
+
+def iter_file_infos(
+    paths: List[Path],
+    cache: Optional[LintCache] = None,
+    jobs: int = 0,
+    scan_bytes: int = DEFAULT_SCAN_BYTES,
+    full_scan: bool = False,
+    executor: Optional[Executor] = None,
+    git_objects: Optional[Dict[Path, str]] = None
+) -> Iterator[Tuple[Path, Optional[FileInfo], Optional[Exception]]]:
+    # Yield (path, SPDX information, error) of the files as soon as each one is available.
+    # Files in the cache come first, the others are split into batches and analyzed by a process pool,
+    # which is the given executor if it is shared with other runs.
+    # git_objects are the objects in the git index of the files unchanged from it, to find them in the cache without reading.
+    git_objects = git_objects or {}
+    paths_to_extract = []
+    for path in dict.fromkeys(paths):
+        if cache:
+            try:
+                git_object = git_objects.get(path)
+                file_info = cache.get_file_info_by_object(git_object) if git_object else cache.get_file_info(path)
+                if file_info is not None:
+                    yield path, file_info, None
+                    continue
+            except OSError:
+                pass
+        paths_to_extract.append(path)
+
+    extract_in_batch = partial(_extract_file_infos_in_batch, scan_bytes=scan_bytes, full_scan=full_scan)
+    jobs = get_jobs(jobs)
+    if (executor or jobs > 1) and len(paths_to_extract) >= MIN_FILES_FOR_PROCESS_POOL:
+        chunk_size = max(1, min(ANALYSIS_CHUNK_SIZE, len(paths_to_extract) // (jobs * 4)))
+        batches = [paths_to_extract[i:i + chunk_size] for i in range(0, len(paths_to_extract), chunk_size)]
+        if executor:
+            for batch_result in executor.map(extract_in_batch, batches):
+                yield from _handle_batch_result(batch_result, cache, git_objects)
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                for batch_result in executor.map(extract_in_batch, batches):
+                    yield from _handle_batch_result(batch_result, cache, git_objects)
+    else:
+        for i in range(0, len(paths_to_extract), ANALYSIS_CHUNK_SIZE):
+            yield from _handle_batch_result(extract_in_batch(paths_to_extract[i:i + ANALYSIS_CHUNK_SIZE]), cache, git_objects)
+
+
+def _handle_batch_result(
+    results: List[Tuple[Path, Optional[FileInfo], Optional[Exception], float]],
+    cache: Optional[LintCache],
+    git_objects: Dict[Path, str]
+) -> List[Tuple[Path, Optional[FileInfo], Optional[Exception]]]:
+    # Put the results to the cache and the profile
+    file_infos = []
+    profiler = get_profiler()
+    for path, file_info, error, seconds in results:
+        if profiler.timing:
+            profiler.add_file(path, seconds)
+        if cache and not error:
+            try:
+                cache.put_file_info(path, file_info, git_object=git_objects.get(path, ""))
+            except OSError:
+                pass
+        file_infos.append((path, file_info, error))
+    return file_infos
+
+
+def extract_file_infos(
+    paths: List[Path],
+    cache: Optional[LintCache] = None,
+    jobs: int = 0,
+    scan_bytes: int = DEFAULT_SCAN_BYTES,
+    full_scan: bool = False,
+    executor: Optional[Executor] = None,
+    git_objects: Optional[Dict[Path, str]] = None
+) -> Tuple[Dict[Path, FileInfo], Dict[Path, Exception]]:
+    # Extract the SPDX information of the files, from the cache if possible.
+    file_infos = {}
+    read_errors = {}
+    for path, file_info, error in iter_file_infos(paths, cache, jobs, scan_bytes, full_scan, executor, git_objects):
+        if error:
+            read_errors[path] = error
+        else:
+            file_infos[path] = file_info
+    return file_infos, read_errors
+
+
+def generate_project_report(
+    project: Project,
+    files: List[str],
+    cache: Optional[LintCache] = None,
+    jobs: int = 0,
+    exclude_set: Optional[FileExcludeSet] = None,
+    scan_bytes: int = DEFAULT_SCAN_BYTES,
+    full_scan: bool = False,
+    executor: Optional[Executor] = None,
+    git_objects: Optional[Dict[str, str]] = None
+) -> LintReport:
+    # Same as ProjectReport.generate, but only for the files found by the walker
+    # so that the tree is not walked again by reuse, and only with what the result needs.
+    # git_objects(relative path -> object in the git index) are of the files unchanged from the git index.
+    project_report = LintReport()
+
+    # Relative path(as Path normalizes it) -> path
+    file_paths = {str(Path(file)): project.root / file for file in files}
+    license_paths = {path: _determine_license_path(path) for path in file_paths.values()}
+    license_objects = {}
+    if git_objects:
+        for rel_path, path in file_paths.items():
+            license_rel_path = rel_path if license_paths[path] == path else f"{rel_path}.license"
+            if license_rel_path in git_objects:
+                license_objects[license_paths[path]] = git_objects[license_rel_path]
+    with profile_phase("analysis"):
+        file_infos, read_errors = extract_file_infos(list(license_paths.values()), cache, jobs, scan_bytes, full_scan,
+                                                     executor, license_objects)
+
+    with profile_phase("file reports"):
+        for rel_path, path in file_paths.items():
+            license_path = license_paths[path]
+            if license_path in read_errors:
+                logger.debug(f"Could not read '{path}': {read_errors[license_path]}")
+                project_report.read_errors.add(rel_path)
+                continue
+            project_report.records[rel_path] = build_file_record(project, path, file_infos[license_path], exclude_set)
+
+    return project_report
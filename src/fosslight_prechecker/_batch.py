@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+import os
+import io
+import sys
+import yaml
+import logging
+import fosslight_util.constant as constant
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List
+from fosslight_util.set_log import init_log
+from reuse.project import Project
+from fosslight_prechecker._constant import PKG_NAME
+from fosslight_prechecker._cache import LintCache
+from fosslight_prechecker._analysis import get_jobs, get_scan_options, DEFAULT_SCAN_BYTES
+from fosslight_prechecker._result import ResultItem, create_result_file, write_result_file, EX_IOERR
+from fosslight_prechecker._linter import Linter, get_result_log
+
+logger = logging.getLogger(constant.LOGGER_NAME)
+
+
+def get_roots(target_path: str, roots_file: str = "") -> List[str]:
+    # Folders from the comma separated '-p' and the roots file, which has a folder in each line('#' for comments)
+    roots = [path for path in target_path.split(",") if path]
+    if roots_file:
+        with open(roots_file, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    roots.append(line)
+    return list(dict.fromkeys(roots))
+
+
+def is_batch(target_path: str, roots_file: str = "") -> bool:
+    return bool(roots_file) or len([path for path in target_path.split(",") if os.path.isdir(path)]) > 1
+
+
+def _get_result_files(roots: List[str], result_file: str, output_extension: str) -> Dict[str, str]:
+    # <result file name>_<folder name><extension> for each root, numbered if the folder names are the same
+    output_path = os.path.dirname(result_file)
+    prefix = os.path.splitext(os.path.basename(result_file))[0]
+    result_files = {}
+    used_names = set()
+    for root in roots:
+        name = os.path.basename(os.path.abspath(root)) or "root"
+        unique_name = name
+        number = 2
+        while unique_name in used_names:
+            unique_name = f"{name}_{number}"
+            number += 1
+        used_names.add(unique_name)
+        result_files[root] = os.path.join(output_path, f"{prefix}_{unique_name}{output_extension or '.yaml'}")
+    return result_files
+
+
+def _lint_root(linter: Linter, root: str, result_file: str, output_extension: str, since: str) -> dict:
+    try:
+        result_item, exit_code = linter.lint(root, since=since)
+    except Exception as ex:
+        # Not to stop linting the other folders
+        result_item, exit_code = ResultItem(), 1
+        result_item.execution_error = [f"Error prechecker lint: {ex}"]
+    project = Project(root) if output_extension == ".html" and exit_code == 0 else None
+    success, exit_code = write_result_file(result_file, output_extension, exit_code, result_item,
+                                           get_result_log(root, linter.exclude_path), project, root, False)
+
+    root_summary = {"Path": root, "Compliant": result_item.compliant_result or "N/A"}
+    if result_item._count_total_files != "":
+        root_summary["Files without license / total"] = f"{result_item._count_without_lic} / {result_item._count_total_files}"
+        root_summary["Files without copyright / total"] = f"{result_item._count_without_cop} / {result_item._count_total_files}"
+    root_summary["Result file"] = result_file if success else ""
+    if result_item.execution_error:
+        root_summary["Execution Error"] = result_item.execution_error
+    return {"summary": root_summary, "exit_code": exit_code}
+
+
+def write_batch_summary(summary_file: str, root_summaries: List[dict]) -> bool:
+    compliant = len([root_summary for root_summary in root_summaries if root_summary["Compliant"] == "OK"])
+    failed = len([root_summary for root_summary in root_summaries if root_summary.get("Execution Error")])
+    summary = {"Checking copyright/license writing rules of several paths": {
+        "Compliant paths / total": f"{compliant} / {len(root_summaries)}",
+        "Paths with execution error": failed,
+        "Paths": root_summaries
+    }}
+    logger.info(yaml.safe_dump(summary, allow_unicode=True, sort_keys=False))
+    try:
+        os.makedirs(os.path.dirname(summary_file), exist_ok=True)
+        with io.open(summary_file, 'w', encoding='utf8') as outfile:
+            yaml.dump(summary, outfile, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    except Exception as ex:
+        logger.error(f"Error_to_write_summary: {ex}")
+        return False
+    return True
+
+
+def run_lint_batch(
+    target_path: str,
+    roots_file: str,
+    disable: bool,
+    output_file_name: str,
+    format: str = '',
+    need_log_file: bool = True,
+    exclude_path: list = [],
+    cache_dir: str = "",
+    jobs: int = 0,
+    since: str = "",
+    scan_bytes: int = DEFAULT_SCAN_BYTES,
+    full_scan: bool = False
+) -> None:
+    # Lint several folders in one run. The folders share the process pool and the cache,
+    # and each folder has its own result file besides the summary of all folders.
+    global logger
+
+    start_time = datetime.now().strftime('%y%m%d_%H%M')
+    result_file, output_path, output_extension = create_result_file(output_file_name, format, start_time)
+    logger, _ = init_log(os.path.join(output_path, f"fosslight_log_pre_{start_time}.txt"),
+                         need_log_file, logging.INFO, logging.DEBUG, PKG_NAME, roots_file or target_path, exclude_path)
+    try:
+        roots = get_roots(target_path, roots_file)
+    except OSError as ex:
+        logger.error(f"(--roots option) Can't read the file : {ex}")
+        sys.exit(1)
+    if output_extension == ".ndjson":
+        logger.error("(-f option) ndjson is not supported for several paths")
+        sys.exit(1)
+    if not roots:
+        logger.error("(--roots option) There is no path to check")
+        sys.exit(1)
+
+    cache = None
+    if cache_dir:
+        cache = LintCache(cache_dir, options=get_scan_options(scan_bytes, full_scan))
+        cache.load()
+
+    result_files = _get_result_files(roots, result_file, output_extension)
+    jobs = get_jobs(jobs)
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    linter = Linter(disable, exclude_path, cache, jobs, scan_bytes, full_scan, executor)
+    root_summaries = []
+    exit_code = 0
+    try:
+        # The folders are walked by threads while the files are analyzed by the shared process pool
+        with ThreadPoolExecutor(max_workers=min(len(roots), jobs)) as threads:
+            futures = [threads.submit(_lint_root, linter, root, result_files[root], output_extension, since) for root in roots]
+            for count, future in enumerate(futures, 1):
+                root_result = future.result()
+                root_summaries.append(root_result["summary"])
+                exit_code = exit_code or root_result["exit_code"]
+                logger.info(f"[{count}/{len(roots)}] {root_result['summary']['Path']} : "
+                            f"{root_result['summary']['Compliant']}")
+    finally:
+        if executor:
+            executor.shutdown()
+
+    if cache:
+        cache.save()
+        logger.debug(f"Lint cache: {cache.hits} hit(s), {cache.misses} miss(es), {cache.entry_count} entries in {cache.cache_file}")
+
+    summary_file = os.path.join(output_path, f"{os.path.splitext(os.path.basename(result_file))[0]}_summary.yaml")
+    if write_batch_summary(summary_file, root_summaries):
+        logger.warning(f"Created file name: {summary_file}\n")
+    else:
+        exit_code = exit_code or EX_IOERR
+    sys.exit(exit_code)
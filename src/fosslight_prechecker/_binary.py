@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+import os
+from typing import Dict, Optional, Tuple
+from binaryornot.helpers import is_binary_string
+from fosslight_prechecker._constant import DEFAULT_EXCLUDE_EXTENSION
+from fosslight_prechecker._cache import LintCache
+from fosslight_prechecker._profile import profile_phase
+
+CHUNK_SIZE = 1024  # Same as binaryornot
+BINARY_EXTENSIONS = {"pyc"} | (set(DEFAULT_EXCLUDE_EXTENSION) - {"json"})
+TEXT_EXTENSIONS = {"c", "cc", "cpp", "cxx", "h", "hh", "hpp", "hxx", "m", "mm", "java", "kt", "kts", "scala", "groovy",
+                   "gradle", "cs", "go", "rs", "swift", "dart", "py", "rb", "pl", "pm", "php", "lua", "r", "js", "jsx",
+                   "mjs", "cjs", "ts", "tsx", "vue", "css", "scss", "less", "html", "htm", "xml", "yaml", "yml", "toml",
+                   "ini", "cfg", "conf", "properties", "md", "rst", "txt", "sh", "bash", "zsh", "bat", "cmd", "ps1",
+                   "cmake", "mk", "mak", "am", "in", "sql", "proto", "s", "asm"}
+_BINARY_MAGIC = (b"\x7fELF", b"\x89PNG", b"\xff\xd8\xff", b"PK\x03\x04", b"\x1f\x8b", b"\xca\xfe\xba\xbe",
+                 b"\xfe\xed\xfa\xce", b"\xfe\xed\xfa\xcf", b"\xce\xfa\xed\xfe", b"\xcf\xfa\xed\xfe")
+_PRINTABLE_ASCII = bytes(range(32, 127)) + b"\n\r\t\f\b"
+_PRINTABLE_HIGH_ASCII = bytes(range(127, 256))
+
+# (device, inode or path, size, mtime) -> binary or not, so that a file is classified once.
+# The processes running many lints(serve, watch, Linter, several roots) keep it, so it is cleared when full.
+BINARY_MEMO_MAX_ENTRIES = 65536
+_binary_by_stat: Dict[Tuple, bool] = {}
+
+
+def is_binary_chunk(chunk: bytes) -> bool:
+    # Same result as binaryornot's is_binary_string, which is called only when chardet is needed.
+    if not chunk:
+        return False
+    if chunk.startswith(_BINARY_MAGIC):
+        return True
+    nontext_ratio1 = len(chunk.translate(None, _PRINTABLE_ASCII)) / len(chunk)
+    nontext_ratio2 = len(chunk.translate(None, _PRINTABLE_HIGH_ASCII)) / len(chunk)
+    is_likely_binary = (nontext_ratio1 > 0.3 and nontext_ratio2 < 0.05) or (nontext_ratio1 > 0.8 and nontext_ratio2 > 0.8)
+    if not is_likely_binary and b"\x00" not in chunk and b"\xff" not in chunk:
+        # Text whatever encoding chardet detects
+        return False
+    return is_binary_string(chunk)
+
+
+def _classify_by_extension(path: str) -> Optional[bool]:
+    extension = os.path.splitext(path)[1][1:].lower()
+    if extension in BINARY_EXTENSIONS:
+        return True
+    if extension in TEXT_EXTENSIONS:
+        return False
+    return None
+
+
+def is_binary_contents(path: str, contents: bytes) -> bool:
+    # Same as is_binary_file, for the contents not in the working tree such as a staged blob
+    binary = _classify_by_extension(path)
+    if binary is None:
+        binary = is_binary_chunk(contents[:CHUNK_SIZE])
+    return binary
+
+
+def _classify(path: str) -> bool:
+    binary = _classify_by_extension(path)
+    if binary is not None:
+        return binary
+    try:
+        with open(path, "rb") as f:
+            return is_binary_chunk(f.read(CHUNK_SIZE))
+    except OSError:
+        # Same as binaryornot, which treats an unreadable file as text
+        return False
+
+
+def is_binary_file(path: str, stat: Optional[os.stat_result] = None, cache: Optional[LintCache] = None) -> bool:
+    try:
+        if stat is None:
+            stat = os.stat(path)
+    except OSError:
+        return _classify(path)
+
+    key = (stat.st_dev, stat.st_ino or os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    binary = _binary_by_stat.get(key)
+    if binary is None and cache:
+        binary = cache.get_binary(path, stat)
+    if binary is None:
+        with profile_phase("binary detection"):
+            binary = _classify(path)
+        if cache:
+            cache.put_binary(path, binary, stat)
+    if len(_binary_by_stat) >= BINARY_MEMO_MAX_ENTRIES:
+        _binary_by_stat.clear()
+    _binary_by_stat[key] = binary
+    return binary
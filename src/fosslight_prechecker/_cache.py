@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+import os
+import json
+import zlib
+import hashlib
+import logging
+import threading
+import fosslight_util.constant as constant
+from collections import OrderedDict
+from importlib.metadata import version, PackageNotFoundError
+from pathlib import Path
+from typing import List, Optional, Tuple
+from fosslight_prechecker._constant import PKG_NAME
+
+CACHE_FILE_NAME = "lint_cache.json"
+CACHE_MAX_ENTRIES = 200000
+BUNDLE_FORMAT = "fosslight_prechecker lint cache bundle 1"
+_READ_CHUNK_SIZE = 1024 * 1024
+# Key of an imported entry, which has no path
+_HASH_KEY_PREFIX = "hash:"
+
+# Position of each value in a cache entry
+_SIZE, _MTIME, _INODE, _HASH, _BINARY, _INFO = range(6)
+
+logger = logging.getLogger(constant.LOGGER_NAME)
+
+
+def get_default_cache_dir() -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, PKG_NAME)
+
+
+def get_cache_version() -> str:
+    # Results depend on both this tool and reuse, so an upgrade of either one invalidates the cache.
+    versions = []
+    for pkg in [PKG_NAME, "reuse"]:
+        try:
+            versions.append(f"{pkg} {version(pkg)}")
+        except PackageNotFoundError:
+            versions.append(f"{pkg} unknown")
+    return ", ".join(versions)
+
+
+def get_content_hash(path: str) -> str:
+    # Same value as the git blob object id of the file
+    file_sha1 = hashlib.sha1()
+    file_sha1.update(f"blob {os.path.getsize(path)}\0".encode())
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_READ_CHUNK_SIZE), b""):
+            file_sha1.update(chunk)
+    return file_sha1.hexdigest()
+
+
+class FileInfo:
+    # SPDX information written in a file (not including .reuse/dep5)
+    def __init__(self, licenses: List[Tuple[str, List[str]]] = None, copyright_lines: List[str] = None):
+        # (SPDX expression, license identifiers in the expression)
+        self.licenses = licenses or []
+        self.copyright_lines = copyright_lines or []
+
+    def to_list(self) -> list:
+        return [[[expression, identifiers] for expression, identifiers in self.licenses], self.copyright_lines]
+
+    @classmethod
+    def from_list(cls, value: list) -> "FileInfo":
+        licenses, copyright_lines = value
+        return cls([(expression, identifiers) for expression, identifiers in licenses], copyright_lines)
+
+
+class LintCache:
+    # On-disk cache of per-file lint results keyed by absolute path.
+    # An entry is valid while the stat of the file is unchanged. Otherwise the content hash is compared,
+    # which also finds the result of identical content in other paths (ex. a fresh checkout).
+    # The content hash is the git blob object id, so a file unchanged from the git index is found by its object
+    # without even a stat.
+    # It can be shared by the threads of a process.
+    def __init__(self, cache_dir: str = "", max_entries: int = CACHE_MAX_ENTRIES, options: str = ""):
+        self.cache_dir = os.path.abspath(cache_dir or get_default_cache_dir())
+        self.cache_file = os.path.join(self.cache_dir, CACHE_FILE_NAME)
+        self.max_entries = max_entries
+        # Options changing the result of a file (ex. scan range) are part of the version
+        self.version = f"{get_cache_version()}, {options}" if options else get_cache_version()
+        self._entries = OrderedDict()
+        self._path_by_hash = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+
+    @property
+    def entry_count(self) -> int:
+        return len(self._entries)
+
+    def load(self) -> None:
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                cache_data = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as ex:
+            logger.warning(f"Ignore the broken lint cache({self.cache_file}): {ex}")
+            return
+
+        if cache_data.get("version") != self.version:
+            logger.info(f"Lint cache is made by another version({cache_data.get('version')}), it will be rebuilt.")
+            return
+        self._entries = OrderedDict(cache_data.get("entries", []))
+        for key, entry in self._entries.items():
+            if entry[_HASH] and entry[_INFO] is not None:
+                self._path_by_hash[entry[_HASH]] = key
+
+    def save(self) -> None:
+        with self._lock:
+            # Least recently used entries are dropped first
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            entries = list(self._entries.items())
+        try:
+            Path(self.cache_dir).mkdir(parents=True, exist_ok=True)
+            temp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump({"version": self.version, "entries": entries}, f, separators=(",", ":"))
+            os.replace(temp_file, self.cache_file)
+        except Exception as ex:
+            logger.warning(f"Failed to save lint cache({self.cache_file}): {ex}")
+
+    def export_bundle(self, bundle_file: str) -> int:
+        # Write the results by the content hash to a single file, which is imported to the cache of another machine.
+        # The paths and the stat are left out since they are valid only in this machine.
+        # A header line of JSON with the version and the checksum is followed by the compressed JSON of the results.
+        with self._lock:
+            results = {entry[_HASH]: entry[_INFO] for entry in self._entries.values() if entry[_HASH] and entry[_INFO] is not None}
+        payload = zlib.compress(json.dumps(list(results.items()), separators=(",", ":")).encode("utf-8"), 9)
+        header = {"format": BUNDLE_FORMAT, "version": self.version, "entries": len(results),
+                  "sha256": hashlib.sha256(payload).hexdigest()}
+        Path(os.path.dirname(os.path.abspath(bundle_file))).mkdir(parents=True, exist_ok=True)
+        temp_file = f"{bundle_file}.{os.getpid()}.tmp"
+        with open(temp_file, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            f.write(payload)
+        os.replace(temp_file, bundle_file)
+        return len(results)
+
+    def import_bundle(self, bundle_file: str) -> int:
+        # Add the results of the bundle at once, which are found by the content hash(or the git object) of files.
+        # Raise ValueError if the bundle is broken or made by another version.
+        with open(bundle_file, "rb") as f:
+            header_line = f.readline()
+            payload = f.read()
+        try:
+            header = json.loads(header_line)
+        except ValueError:
+            raise ValueError("Not a lint cache bundle")
+        if not isinstance(header, dict) or header.get("format") != BUNDLE_FORMAT:
+            raise ValueError("Not a lint cache bundle")
+        if header.get("version") != self.version:
+            raise ValueError(f"The bundle is made by another version({header.get('version')})")
+        if hashlib.sha256(payload).hexdigest() != header.get("sha256"):
+            raise ValueError("The checksum of the bundle doesn't match")
+        results = json.loads(zlib.decompress(payload))
+
+        imported = 0
+        with self._lock:
+            for content_hash, file_info in results:
+                same_content = self._entries.get(self._path_by_hash.get(content_hash, ""))
+                if same_content and same_content[_HASH] == content_hash and same_content[_INFO] is not None:
+                    continue
+                key = f"{_HASH_KEY_PREFIX}{content_hash}"
+                self._entries[key] = [0, 0, 0, content_hash, None, file_info]
+                self._path_by_hash[content_hash] = key
+                imported += 1
+        return imported
+
+    def _get_entry(self, path: str, stat: Optional[os.stat_result] = None) -> Tuple[str, list]:
+        # Return the entry of the path, which is reset if the file has been changed. Called with the lock held.
+        key = os.path.normcase(os.path.abspath(path))
+        if stat is None:
+            stat = os.stat(path)
+        entry = self._entries.get(key)
+        if entry is None or entry[_SIZE] != stat.st_size or entry[_MTIME] != stat.st_mtime_ns or entry[_INODE] != stat.st_ino:
+            entry = [stat.st_size, stat.st_mtime_ns, stat.st_ino, "", None, None]
+            self._entries[key] = entry
+        else:
+            self._entries.move_to_end(key)
+        return key, entry
+
+    def _get_hash(self, path: str, entry: list) -> str:
+        # The file is read without the lock
+        if not entry[_HASH]:
+            content_hash = get_content_hash(path)
+            with self._lock:
+                entry[_HASH] = content_hash
+        return entry[_HASH]
+
+    def get_binary(self, path: str, stat: Optional[os.stat_result] = None) -> Optional[bool]:
+        with self._lock:
+            _, entry = self._get_entry(path, stat)
+            return entry[_BINARY]
+
+    def put_binary(self, path: str, binary: bool, stat: Optional[os.stat_result] = None) -> None:
+        with self._lock:
+            _, entry = self._get_entry(path, stat)
+            entry[_BINARY] = binary
+
+    def get_file_info(self, path: str, stat: Optional[os.stat_result] = None) -> Optional[FileInfo]:
+        with self._lock:
+            key, entry = self._get_entry(path, stat)
+            file_info = entry[_INFO]
+        content_hash = self._get_hash(path, entry) if file_info is None else ""
+        with self._lock:
+            if file_info is None:
+                same_content = self._entries.get(self._path_by_hash.get(content_hash, ""))
+                if same_content and same_content[_HASH] == content_hash and same_content[_INFO] is not None:
+                    entry[_INFO] = file_info = same_content[_INFO]
+                    self._path_by_hash[content_hash] = key
+            if file_info is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return FileInfo.from_list(file_info)
+
+    def get_file_info_by_object(self, git_object: str) -> Optional[FileInfo]:
+        # Result of the contents of the git blob object, for a file unchanged from the git index
+        with self._lock:
+            key = self._path_by_hash.get(git_object, "")
+            entry = self._entries.get(key)
+            if entry is None or entry[_HASH] != git_object or entry[_INFO] is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            file_info = entry[_INFO]
+        return FileInfo.from_list(file_info)
+
+    def put_file_info(
+        self,
+        path: str,
+        file_info: FileInfo,
+        stat: Optional[os.stat_result] = None,
+        git_object: str = ""
+    ) -> None:
+        # git_object is the object in the git index if the file is unchanged from it, not to read the file again
+        with self._lock:
+            key, entry = self._get_entry(path, stat)
+            if git_object:
+                entry[_HASH] = git_object
+        content_hash = self._get_hash(path, entry)
+        with self._lock:
+            entry[_INFO] = file_info.to_list()
+            self._path_by_hash[content_hash] = key
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+import os
+import sys
+import logging
+import fosslight_util.constant as constant
+from datetime import datetime
+from typing import List
+from fosslight_util.set_log import init_log
+from fosslight_prechecker._constant import PKG_NAME, DEFAULT_SCAN_BYTES
+from fosslight_prechecker._cache import LintCache
+from fosslight_prechecker._analysis import get_scan_options
+
+CACHE_ACTIONS = ["export", "import"]
+
+logger = logging.getLogger(constant.LOGGER_NAME)
+
+
+def run_cache(
+    arguments: List[str],
+    cache_dir: str = "",
+    scan_bytes: int = DEFAULT_SCAN_BYTES,
+    full_scan: bool = False,
+    need_log_file: bool = True
+) -> None:
+    # 'export <file>' writes the lint cache to a bundle, which 'import <file>' adds to the lint cache of another
+    # machine(ex. the agents of CI). --scan-bytes and --full-scan must be the same as the ones of the lint.
+    global logger
+
+    start_time = datetime.now().strftime('%y%m%d_%H%M')
+    logger, _ = init_log(os.path.join(os.getcwd(), f"fosslight_log_pre_{start_time}.txt"),
+                         need_log_file, logging.INFO, logging.DEBUG, PKG_NAME)
+    if len(arguments) != 2 or arguments[0] not in CACHE_ACTIONS:
+        logger.error("(cache mode) Usage: fosslight_prechecker cache export <file> | cache import <file>")
+        sys.exit(1)
+    action, bundle_file = arguments
+
+    cache = LintCache(cache_dir, options=get_scan_options(scan_bytes, full_scan))
+    cache.load()
+    if action == "export":
+        try:
+            count = cache.export_bundle(bundle_file)
+        except Exception as ex:
+            logger.error(f"Failed to export the lint cache({cache.cache_file}): {ex}")
+            sys.exit(1)
+        logger.warning(f"Exported {count} results of {cache.cache_file} to {bundle_file}")
+    else:
+        try:
+            count = cache.import_bundle(bundle_file)
+        except Exception as ex:
+            logger.error(f"Failed to import {bundle_file}: {ex}")
+            sys.exit(1)
+        cache.save()
+        logger.warning(f"Imported {count} results of {bundle_file} to {cache.cache_file}")
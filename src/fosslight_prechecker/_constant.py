@@ -9,6 +9,9 @@ DEFAULT_EXCLUDE_EXTENSION = ["jar", "png", "exe", "so", "a", "dll", "jpeg", "jpg
 OSS_PKG_INFO_FILES = [r"oss-pkg-info[\s\S]*.ya?ml", r"oss-package[\s\S]*.info", r"sbom(-|_)info[\s\S]*.ya?ml",
                       r"requirement(s)?.txt", "package.json", "pom.xml", "build.gradle", "podfile.lock", "go.mod",
                       "cartfile.resolved", "pubspec.yaml", "package.resolved", "packages.config", "project.assets.json"]
+# Same as _HEADER_BYTES of reuse, here not to import reuse to parse the arguments
+DEFAULT_SCAN_BYTES = 4096
+DEFAULT_PORT = 8719
 HTML_RESULT_EXPAND_LIMIT = 10
 HTML_RESULT_PRINT_LIMIT = 100
 
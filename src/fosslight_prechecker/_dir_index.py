@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+import os
+import json
+import hashlib
+import logging
+import fosslight_util.constant as constant
+from collections import defaultdict
+from itertools import chain
+from pathlib import Path
+from typing import Dict, Iterable, List, Set
+from fosslight_prechecker._cache import LintCache, get_content_hash
+from fosslight_prechecker._git import GitFileStatus
+from fosslight_prechecker._analysis import LintReport, make_file_record
+
+DIR_INDEX_FOLDER = "dir_index"
+# Changed when the entries are made differently, so that the indexes of the previous format are not used
+DIR_INDEX_FORMAT = 2
+
+# Position of each value in a folder entry, all about the files right in the folder:
+# fingerprint, number of the files with license and copyright, their licenses,
+# files missing license or copyright -> [licenses, copyright], OSS package info files,
+# and the ones of the missing files and the OSS package info files that are excluded
+_FINGERPRINT, _COMPLETE, _LICENSES, _MISSING, _OSS_PKG_INFO, _EXCLUDED = range(6)
+
+logger = logging.getLogger(constant.LOGGER_NAME)
+
+
+def _get_depth(rel_dir: str) -> int:
+    return rel_dir.count(os.sep) + 1 if rel_dir else 0
+
+
+def _get_parents(rel_path: str) -> Iterable[str]:
+    # Parent folders of a relative path up to "", the path to find
+    while rel_path:
+        rel_path = os.path.dirname(rel_path)
+        yield rel_path
+
+
+def get_dir_index_options(path: str, turn_on_exclude_config: bool, exclude_path: List[str]) -> str:
+    # Options changing the results of the files in a folder besides its files. .reuse/dep5 applies to all folders.
+    try:
+        dep5_hash = get_content_hash(os.path.join(path, ".reuse", "dep5"))
+    except OSError:
+        dep5_hash = ""
+    return f"exclude config {turn_on_exclude_config}, exclude path {sorted(exclude_path)}, dep5 {dep5_hash}"
+
+
+def get_dir_fingerprints(git_status: GitFileStatus, ignored: Iterable[str], salt: str) -> Dict[str, str]:
+    # Fingerprint of each folder(relative path, "" for the path) from the objects of its files in the git index
+    # and the fingerprints of its sub folders, like a git tree object.
+    # Folders having a file that git doesn't know as unchanged(modified, untracked, ignored, submodule) and
+    # their parents have no fingerprint, since their files must be walked.
+    files = defaultdict(list)
+    for rel_path, git_object in git_status.objects.items():
+        rel_dir, name = os.path.split(rel_path)
+        files[rel_dir].append(f"{name}\0{git_object}")
+
+    dirty = set()
+    unknown_files = chain(git_status.tracked - git_status.objects.keys(), git_status.untracked, git_status.untracked_dirs,
+                          git_status.submodules, ignored)
+    for rel_path in unknown_files:
+        for rel_dir in _get_parents(rel_path):
+            if rel_dir in dirty:
+                break
+            dirty.add(rel_dir)
+
+    all_dirs = set()
+    sub_dirs = defaultdict(list)
+    for rel_dir in list(files):
+        while rel_dir not in all_dirs:
+            all_dirs.add(rel_dir)
+            if not rel_dir:
+                break
+            parent = os.path.dirname(rel_dir)
+            sub_dirs[parent].append(rel_dir)
+            rel_dir = parent
+
+    fingerprints = {}
+    # Sub folders first
+    for rel_dir in sorted(all_dirs - dirty, key=_get_depth, reverse=True):
+        dir_hash = hashlib.sha1(salt.encode())
+        for entry in sorted(files.get(rel_dir, [])):
+            dir_hash.update(f"\0{entry}".encode(errors="surrogateescape"))
+        for child in sorted(sub_dirs.get(rel_dir, [])):
+            dir_hash.update(f"\0{os.path.basename(child)}/\0{fingerprints[child]}".encode(errors="surrogateescape"))
+        fingerprints[rel_dir] = dir_hash.hexdigest()
+    return fingerprints
+
+
+class DirIndex:
+    # Results of the folders of a path by their fingerprints, saved next to the lint cache.
+    # When the fingerprint of a folder is the same as the previous run, no file in it or in its sub folders is changed,
+    # so the walker skips the whole folder and the results of its files are taken from the index.
+    def __init__(self, cache: LintCache, path: str, options: str = ""):
+        self.path = os.path.abspath(path)
+        path_hash = hashlib.sha1(os.fsencode(self.path)).hexdigest()
+        self.index_file = os.path.join(cache.cache_dir, DIR_INDEX_FOLDER, f"{path_hash}.json")
+        self.version = f"{cache.version}, index format {DIR_INDEX_FORMAT}, {options}"
+        self._dirs = {}
+        # Fingerprints of the folders of this run
+        self.fingerprints = {}
+        # Top folders skipped by the walker
+        self.reused_dirs = []
+        self._reused_set = set()
+
+    def load(self) -> None:
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                index_data = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as ex:
+            logger.warning(f"Ignore the broken folder index({self.index_file}): {ex}")
+            return
+        if index_data.get("version") == self.version and index_data.get("path") == self.path:
+            self._dirs = index_data.get("dirs", {})
+
+    def save(self) -> None:
+        try:
+            Path(os.path.dirname(self.index_file)).mkdir(parents=True, exist_ok=True)
+            temp_file = f"{self.index_file}.{os.getpid()}.tmp"
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump({"version": self.version, "path": self.path, "dirs": self._dirs}, f, separators=(",", ":"))
+            os.replace(temp_file, self.index_file)
+        except Exception as ex:
+            logger.warning(f"Failed to save the folder index({self.index_file}): {ex}")
+
+    def find_unchanged_dirs(self, fingerprints: Dict[str, str]) -> Set[str]:
+        # Top folders whose fingerprint is the same as the previous run
+        self.fingerprints = fingerprints
+        unchanged_dirs = {rel_dir for rel_dir, fingerprint in fingerprints.items()
+                          if rel_dir in self._dirs and self._dirs[rel_dir][_FINGERPRINT] == fingerprint}
+        self.reused_dirs = sorted(rel_dir for rel_dir in unchanged_dirs
+                                  if not any(parent in unchanged_dirs for parent in _get_parents(rel_dir)))
+        self._reused_set = set(self.reused_dirs)
+        return self._reused_set
+
+    def _in_reused_dirs(self, rel_dir: str) -> bool:
+        return rel_dir in self._reused_set or any(parent in self._reused_set for parent in _get_parents(rel_dir))
+
+    def restore(self, report: LintReport, oss_pkg_info: List[str], exclude_files: List[str]) -> None:
+        # Add the results of the files in the skipped folders as the walker and the analysis would do
+        if not self.reused_dirs:
+            return
+        for rel_dir, entry in self._dirs.items():
+            if not self._in_reused_dirs(rel_dir):
+                continue
+            report.reused_file_count += entry[_COMPLETE]
+            report.reused_licenses.update(entry[_LICENSES])
+            for name, (licenses, copyright) in entry[_MISSING].items():
+                report.records[os.path.join(rel_dir, name)] = make_file_record(licenses, copyright)
+            oss_pkg_info.extend(os.path.join(rel_dir, name) for name in entry[_OSS_PKG_INFO])
+            exclude_files.extend(os.path.join(rel_dir, name) for name in entry[_EXCLUDED])
+        logger.debug(f"Unchanged folders from the previous run: {len(self.reused_dirs)}")
+
+    def update(self, report: LintReport, oss_pkg_info: List[str], exclude_files: Iterable[str]) -> None:
+        # Entries of the folders with a fingerprint from the result of this run, which is of the whole path
+        dirs = {}
+        for rel_dir, fingerprint in self.fingerprints.items():
+            if self._in_reused_dirs(rel_dir):
+                if rel_dir in self._dirs:
+                    dirs[rel_dir] = self._dirs[rel_dir]
+            else:
+                dirs[rel_dir] = [fingerprint, 0, set(), {}, [], []]
+        exclude_files = set(exclude_files)
+
+        for rel_path, record in report.records.items():
+            rel_dir, name = os.path.split(rel_path)
+            entry = dirs.get(rel_dir)
+            if entry is None or self._in_reused_dirs(rel_dir):
+                continue
+            if not record.licenses or not record.copyright:
+                entry[_MISSING][name] = [list(record.licenses), record.copyright]
+                if rel_path in exclude_files:
+                    entry[_EXCLUDED].append(name)
+            else:
+                # Licenses of the excluded files are detected too, but they are not in the total
+                entry[_LICENSES].update(record.licenses)
+                if rel_path not in exclude_files:
+                    entry[_COMPLETE] += 1
+        for rel_path in oss_pkg_info:
+            rel_dir, name = os.path.split(rel_path)
+            entry = dirs.get(rel_dir)
+            if entry is None or self._in_reused_dirs(rel_dir):
+                continue
+            entry[_OSS_PKG_INFO].append(name)
+            if rel_path in exclude_files and name not in entry[_EXCLUDED]:
+                entry[_EXCLUDED].append(name)
+        # Files that couldn't be read are analyzed again
+        for rel_path in report.read_errors:
+            for rel_dir in _get_parents(rel_path):
+                dirs.pop(rel_dir, None)
+
+        for entry in dirs.values():
+            if isinstance(entry[_LICENSES], set):
+                entry[_LICENSES] = sorted(entry[_LICENSES])
+        self._dirs = dirs
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+import os
+from typing import Iterable, List, Optional, Tuple
+from fosslight_util.exclude import excluding_files
+
+_EXCLUDED = ""  # Key marking a node whose path is excluded (never a valid path component)
+# Top level folders excluded from the analysis (venv*/*, node_modules*/*, .*/*)
+DEFAULT_EXCLUDE_FOLDER_PREFIXES = ("venv", "node_modules", ".")
+
+
+def is_default_exclude_dir(name: str, top_level: bool) -> bool:
+    return top_level and name.startswith(DEFAULT_EXCLUDE_FOLDER_PREFIXES)
+
+
+def _split_path(path: str) -> list:
+    path = os.path.normcase(os.path.abspath(path))
+    return [part for part in path.split(os.sep) if part]
+
+
+class PathExcludeIndex:
+    # Component trie over normalized absolute paths.
+    # A path is excluded when it or one of its parent directories was added.
+    def __init__(self, paths: Iterable[str] = ()):
+        self._root = {}
+        self._count = 0
+        for path in paths:
+            self.add(path)
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, path: str) -> None:
+        node = self._root
+        for part in _split_path(path):
+            if _EXCLUDED in node:
+                # A parent directory is already excluded
+                return
+            node = node.setdefault(part, {})
+        if _EXCLUDED not in node:
+            # Paths below it are not needed any more
+            self._count -= self._count_excluded(node)
+            node.clear()
+            node[_EXCLUDED] = True
+            self._count += 1
+
+    @staticmethod
+    def _count_excluded(node: dict) -> int:
+        return sum(1 if key == _EXCLUDED else PathExcludeIndex._count_excluded(child) for key, child in node.items())
+
+    def is_excluded(self, path: str) -> bool:
+        if not self._count:
+            return False
+        node = self._root
+        for part in _split_path(path):
+            node = node.get(part)
+            if node is None:
+                return False
+            if _EXCLUDED in node:
+                return True
+        return False
+
+    def node_of(self, path: str) -> Optional[dict]:
+        # Trie node of a directory that is not excluded, or None if nothing below it is excluded.
+        node = self._root
+        for part in _split_path(path):
+            node = node.get(part)
+            if node is None or _EXCLUDED in node:
+                return None
+        return node
+
+    @staticmethod
+    def match_child(node: Optional[dict], name: str) -> Tuple[bool, Optional[dict]]:
+        # Look up a directory entry from the node of its parent directory while walking.
+        # Returns whether the entry is excluded and the node to use for its children.
+        if not node:
+            return False, None
+        child = node.get(os.path.normcase(name))
+        if child is None:
+            return False, None
+        return _EXCLUDED in child, child
+
+
+class FileExcludeSet:
+    # Files excluded from the analysis, as paths relative to the project root.
+    # They are reported with 'License: -' and 'Copyright: -' like an entry of .reuse/dep5.
+    # Excluded folders are not in the set, since the walker doesn't descend into them.
+    def __init__(self, files: Iterable[str] = ()):
+        self._files = {os.path.normpath(file) for file in files}
+
+    def is_excluded(self, rel_path: str) -> bool:
+        return rel_path in self._files
+
+
+def get_exclude_index(exclude_path: List[str], path_to_find: str) -> PathExcludeIndex:
+    # excluding_files walks the whole path, so it is called only if there is any pattern
+    if not exclude_path:
+        return PathExcludeIndex()
+    # The matched paths are relative to the path to check, not to the current folder
+    return PathExcludeIndex(os.path.abspath(os.path.join(path_to_find, path)) for path in excluding_files(exclude_path, path_to_find))
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+import os
+import logging
+import threading
+import subprocess
+import fosslight_util.constant as constant
+from typing import Dict, Iterator, List, Optional, Tuple
+
+_GITLINK_MODE = "160000"
+_SYMLINK_MODE = "120000"
+# Object names of the empty blob in SHA-1 and SHA-256 repositories
+EMPTY_BLOB_OBJECTS = {"e69de29bb2d1d6434b8b29ae775ad8c2e48c5391",
+                      "473a0f4c3be8a93681a267e3b1e9a7dcda1185436fe141f7749120a303721813"}
+
+logger = logging.getLogger(constant.LOGGER_NAME)
+
+
+class GitFileStatus:
+    # Git state of the files under a path, relative to the path.
+    # Files that are not listed in any of them are ignored by git.
+    def __init__(self):
+        self.tracked = set()
+        self.untracked = set()
+        self.untracked_dirs = set()
+        self.submodules = set()
+        # Relative path -> object in the index, of the tracked files unchanged from the index
+        self.objects = {}
+
+    def is_excluded(self, rel_path: str) -> bool:
+        # Untracked and ignored files are excluded, except the files in submodules which git doesn't list
+        if rel_path in self.tracked:
+            return False
+        return not (self.submodules and self._in_dirs(rel_path, self.submodules))
+
+    @staticmethod
+    def _in_dirs(rel_path: str, dirs: set) -> bool:
+        parent = os.path.dirname(rel_path)
+        while parent:
+            if parent in dirs:
+                return True
+            parent = os.path.dirname(parent)
+        return False
+
+
+def get_git_file_status(path: str, with_objects: bool = False) -> Optional[GitFileStatus]:
+    # Classify all files under the path with a single 'git ls-files' call.
+    # Tracked entries are printed as "<tag> <mode> <object> <stage>\t<file>" and untracked ones as "? <file>".
+    # With with_objects, git also compares the stat of the tracked files with the index as 'git status' does,
+    # printing the changed ones again with the tag "C", and the objects of the unchanged ones are kept.
+    cmd = ['git', '-C', path, 'ls-files', '-z', '-t', '-s', '-c', '-o', '--exclude-standard'] + (['-m'] if with_objects else [])
+    try:
+        cmd_result = subprocess.check_output(cmd, stderr=subprocess.PIPE)
+    except subprocess.CalledProcessError as ex:
+        error_msg = ex.stderr.decode(errors='replace').strip()
+        if "not a git repository" in error_msg:
+            logger.debug(f"{path} is not in a git repository")
+        else:
+            logger.warning(f"Error to get git related files : {error_msg}")
+        return None
+    except Exception as ex:
+        logger.warning(f"Error to get git related files : {ex}")
+        return None
+
+    git_status = GitFileStatus()
+    changed_files = set()
+    for line in cmd_result.split(b'\0'):
+        if not line:
+            continue
+        line = os.fsdecode(line)
+        if line.startswith("? "):
+            file_name = line[2:]
+            if file_name.endswith("/"):
+                # Nested repository that isn't a submodule
+                git_status.untracked_dirs.add(os.path.normpath(file_name))
+            else:
+                git_status.untracked.add(os.path.normpath(file_name))
+            continue
+        info, _, file_name = line.partition("\t")
+        file_name = os.path.normpath(file_name)
+        tag, mode, index_object, stage = info.split(" ")
+        if tag == "C":
+            changed_files.add(file_name)
+        elif mode == _GITLINK_MODE:
+            git_status.submodules.add(file_name)
+        else:
+            git_status.tracked.add(file_name)
+            if with_objects and tag == "H" and stage == "0":
+                git_status.objects[file_name] = index_object
+    for file_name in changed_files:
+        git_status.objects.pop(file_name, None)
+    return git_status
+
+
+def get_staged_files(path: str) -> Dict[str, str]:
+    # Files added or modified in the index, relative to path -> object name of the staged blob.
+    # Entries are printed as ":<old mode> <new mode> <old object> <new object> <status>\0<file>\0".
+    # Symbolic links and submodules are not files to check, so they are left out.
+    cmd = ['git', '-C', path, 'diff', '--cached', '--raw', '-z', '--no-abbrev', '--no-renames', '--relative',
+           '--diff-filter=ACMT', '--']
+    cmd_result = subprocess.check_output(cmd, stderr=subprocess.PIPE)
+    staged_files = {}
+    fields = cmd_result.split(b'\0')
+    for info, file_name in zip(fields[0::2], fields[1::2]):
+        _, new_mode, _, new_object, _ = os.fsdecode(info).split(" ")
+        if new_mode not in [_GITLINK_MODE, _SYMLINK_MODE]:
+            staged_files[os.path.normpath(os.fsdecode(file_name))] = new_object
+    return staged_files
+
+
+def get_tree_files(path: str, rev: str) -> Dict[str, str]:
+    # Files of the tree-ish under path, relative to path -> object name of the blob.
+    # Entries are printed as "<mode> <type> <object>\t<file>\0", and symbolic links and submodules are left out.
+    cmd = ['git', '-C', path, 'ls-tree', '-r', '-z', '--end-of-options', rev]
+    cmd_result = subprocess.check_output(cmd, stderr=subprocess.PIPE)
+    tree_files = {}
+    for line in cmd_result.split(b'\0'):
+        if not line:
+            continue
+        info, _, file_name = line.partition(b'\t')
+        mode, object_type, tree_object = os.fsdecode(info).split(" ")
+        if object_type == "blob" and mode != _SYMLINK_MODE:
+            tree_files[os.path.normpath(os.fsdecode(file_name))] = tree_object
+    return tree_files
+
+
+def _write_object_names(stdin, names: List[str]) -> None:
+    try:
+        for name in names:
+            stdin.write(os.fsencode(name) + b"\n")
+        stdin.close()
+    except OSError:
+        # git exited, which the reader finds out
+        pass
+
+
+def iter_objects(path: str, names: List[str]) -> Iterator[Tuple[str, Optional[bytes]]]:
+    # Yield (name, contents) of the blobs from a single 'git cat-file --batch' pipe, in the order of the names.
+    # A name is an object or ":./<file>" for the file staged in the index, relative to path.
+    # The contents are None if there is no such blob.
+    process = subprocess.Popen(['git', '-C', path, 'cat-file', '--batch'], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                               stderr=subprocess.DEVNULL)
+    # Written by a thread not to block on the pipe while the contents are not read yet
+    writer = threading.Thread(target=_write_object_names, args=(process.stdin, names), daemon=True)
+    writer.start()
+    try:
+        for name in names:
+            # "<object> <type> <size>\n<contents>\n", or "<name> missing\n"
+            header = process.stdout.readline()
+            if not header:
+                raise OSError(f"git cat-file exited with {process.wait()}")
+            fields = header.split()
+            if len(fields) != 3 or not fields[2].isdigit():
+                yield name, None
+                continue
+            contents = process.stdout.read(int(fields[2]) + 1)[:-1]
+            yield name, contents if fields[1] == b"blob" else None
+    finally:
+        # git exits when all names are read, or on writing to the closed pipe if the caller stops early
+        process.stdout.close()
+        process.wait()
+        writer.join()
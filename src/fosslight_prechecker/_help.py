@@ -24,12 +24,16 @@ _HELP_MESSAGE_PRECHECKER = """
     add                    Add missing license, copyright, and download location
     convert                Convert sbom-info.yaml to FOSSLight-Report.xlsx
     download               Download license text specified in sbom-info.yaml
+    serve                  Keep running and answer lint and add requests in JSON
+    cache                  Export the lint cache to a file or import it (ex: for CI)
 
     ⚙️  General Options
     ────────────────────────────────────────────────────────────────────
     -p <path>              Path to check (default: current directory)
     -o <file>              Output file name
-    -f <format>            Result format (yaml, xml, html)
+    -f <format>            Result format (yaml, xml, html, ndjson)
+                           (ndjson: a line for each file, with 'sbom_info' if
+                           sbom-info.yaml gives its missing license or copyright)
     -e <pattern>           Exclude paths from checking (files and directories)
                            (only works with 'lint' mode)
                            ⚠️  IMPORTANT: Always wrap in quotes to avoid shell expansion
@@ -37,6 +41,8 @@ _HELP_MESSAGE_PRECHECKER = """
     -h                     Show this help message
     -v                     Show version information
     -i                     Don't write log file and show progress bar
+    -j, --jobs <num>       Number of processes to analyze files ('lint', 'add' mode)
+                           (default: number of CPUs, 1: no multiprocessing)
     --notice               Print the open source license notice text
 
     🔍 Mode-Specific Options
@@ -44,6 +50,30 @@ _HELP_MESSAGE_PRECHECKER = """
     lint mode:
       -n                   Don't exclude venv*, node_modules, .*/, and
                            FOSSLight Scanner results from analysis
+      --cache [dir]        Reuse the result of unchanged files and folders from
+                           the previous run
+                           (default dir: ~/.cache/fosslight_prechecker)
+      --since <ref>        Analyze only the files added or modified since
+                           the merge base of <ref> and HEAD
+      --scan-bytes <num>   Number of leading bytes to find license and copyright
+                           in each file (default: 4096)
+      --full-scan          Scan the whole file when license or copyright is not
+                           found in the leading bytes
+      --roots <file>       Check the paths listed in the file, one in each line,
+                           with a result file for each path and a summary
+                           (Several folders in '-p' separated by ',' as well)
+      --staged             Check the contents staged for the next commit instead of
+                           the working tree (only the staged ones of the files
+                           in '-p' if given), reading them from the git index
+      --rev <tree-ish>     Check the files of a commit or a tag (ex: v1.0.0)
+                           without checking it out, reading them from git
+      --watch              Keep running and update the result whenever files
+                           are changed, analyzing only the changed files
+      --profile [num]      Add the time of each phase and the <num> slowest files
+                           (default: 10) to the result and write them to
+                           <result file>_profile.json
+      --report-memory      Add the peak memory of each phase to the result and
+                           <result file>_profile.json (slower while measuring)
 
     add mode:
       -l <license>         Add license name in SPDX format (ex: "Apache-2.0")
@@ -53,6 +83,23 @@ _HELP_MESSAGE_PRECHECKER = """
     download mode:
       -l <license>         License to be representative license
 
+    serve mode:
+      --port <num>         Port of localhost to listen on (default: 8719)
+      --socket <file>      Listen on the Unix socket file instead of the port
+      --allow-add          Answer the add requests, which modify the files
+                           (--cache, -j, --scan-bytes and --full-scan also apply)
+                           Requests: POST /lint {"path", "files", "since", "exclude_path", "disable"}
+                                     POST /add {"path", "files", "license", "copyright", "dl_url"}
+                                     GET /status
+                           POST requests need 'Content-Type: application/json'
+                           and are refused from the origins other than localhost
+
+    cache mode:
+      export <file>        Write the lint cache to a single file
+      import <file>        Add the results in the file to the lint cache
+                           (--cache <dir> for the cache other than the default,
+                           --scan-bytes and --full-scan same as the ones of lint)
+
     💡 Examples
     ────────────────────────────────────────────────────────────────────
     # Lint current directory (check compliance)
@@ -61,6 +108,9 @@ _HELP_MESSAGE_PRECHECKER = """
     # Lint specific path with exclusions
     fosslight_prechecker lint -p /path/to/source -e "test/" "node_modules/"
 
+    # Lint several folders at once
+    fosslight_prechecker lint -p repo1,repo2,repo3 -o results/
+
     # Add license and copyright to a file
     fosslight_prechecker add -p test.py -l "GPL-3.0-only" -c "2019-2021 LG Electronics Inc."
 
@@ -72,6 +122,15 @@ _HELP_MESSAGE_PRECHECKER = """
 
     # Download license text
     fosslight_prechecker download -l "MIT"
+
+    # Serve lint requests and lint a directory through the server
+    fosslight_prechecker serve --cache
+    curl -H "Content-Type: application/json" -d '{"path": "/path/to/source"}' http://127.0.0.1:8719/lint
+
+    # Share the lint cache between CI jobs
+    fosslight_prechecker cache import lint_cache.bundle
+    fosslight_prechecker lint --cache
+    fosslight_prechecker cache export lint_cache.bundle
     """
 
 
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+import os
+import sys
+import logging
+import fosslight_util.constant as constant
+from concurrent.futures import Executor
+from importlib.metadata import version, PackageNotFoundError
+from typing import List, Optional, Tuple
+from fosslight_util.set_log import get_os_version
+from fosslight_prechecker._constant import PKG_NAME
+from fosslight_prechecker._cache import LintCache
+from fosslight_prechecker._analysis import LintReport, DEFAULT_SCAN_BYTES
+from fosslight_prechecker._exclude import get_exclude_index
+from fosslight_prechecker._profile import Profiler, use_profiler
+from fosslight_prechecker._result import ResultItem, result_for_summary
+from fosslight_prechecker._precheck import LintState, get_changed_files, precheck_for_files, precheck_for_project
+
+logger = logging.getLogger(constant.LOGGER_NAME)
+
+
+def get_result_log(path_to_find: str, exclude_path: List[str]) -> dict:
+    # Same items as the result log of init_log, without setting up the logger
+    try:
+        tool_info = f"{PKG_NAME} v{version(PKG_NAME)}"
+    except PackageNotFoundError:
+        tool_info = PKG_NAME
+    result_log = {
+        "Tool Info": tool_info,
+        "Python version": sys.version_info[0],
+        "OS": get_os_version(),
+        "Path to analyze": path_to_find
+    }
+    if exclude_path:
+        result_log["Path to exclude"] = ", ".join(exclude_path)
+    return result_log
+
+
+class Linter:
+    # Same as the lint mode, but the state of each run is kept in the run and the result is returned instead of exiting.
+    # So it can be called many times in a process and from several threads, which can share a LintCache
+    # and a process pool(executor) to analyze files. With profile(number of the slowest files to show), the time
+    # of the phases and the files of each run is measured by its own profiler and given in the result.
+    def __init__(
+        self,
+        disable: bool = False,
+        exclude_path: Optional[List[str]] = None,
+        cache: Optional[LintCache] = None,
+        jobs: int = 0,
+        scan_bytes: int = DEFAULT_SCAN_BYTES,
+        full_scan: bool = False,
+        executor: Optional[Executor] = None,
+        profile: int = 0
+    ):
+        self.disable = disable
+        self.exclude_path = exclude_path or []
+        self.cache = cache
+        self.jobs = jobs
+        self.scan_bytes = scan_bytes
+        self.full_scan = full_scan
+        self.executor = executor
+        self.profile = profile
+
+    def _failed_result(self, path_to_find: str, state: LintState) -> Tuple[ResultItem, int]:
+        result_item = ResultItem()
+        result_item._path_to_analyze = path_to_find
+        result_item.execution_error = state.error_items
+        return result_item, 1
+
+    def lint(self, path_to_find: str, files: Optional[List[str]] = None, since: str = "") -> Tuple[ResultItem, int]:
+        # Return the result and the exit code of the lint mode.
+        # If files(relative to path_to_find) are given, only those files are checked like '-p' with files.
+        state = LintState(not self.disable, exit_on_error=False)
+        if not os.path.isdir(path_to_find):
+            state.dump_error_msg(f"(-p option) Check the path to find : {path_to_find}", True)
+            return self._failed_result(path_to_find, state)
+        if files and since:
+            state.dump_error_msg("(--since option) Can't be used with files to check", True)
+            return self._failed_result(path_to_find, state)
+        result_log = get_result_log(path_to_find, self.exclude_path)
+        check_only_file_mode = bool(files)
+        oss_pkg_info = []
+        report = LintReport()
+        scope = ""
+        # Each run has its own profiler, since a Linter can be used from several threads
+        run_profiler = Profiler()
+        if self.profile:
+            run_profiler.enable(self.profile)
+
+        with use_profiler(run_profiler):
+            exclude_index = get_exclude_index(self.exclude_path, path_to_find)
+            if check_only_file_mode:
+                license_missing_files, copyright_missing_files, _ = precheck_for_files(path_to_find, files, self.cache,
+                                                                                       self.jobs, self.scan_bytes,
+                                                                                       self.full_scan, state)
+            else:
+                files_to_check = None
+                if since:
+                    files_to_check = get_changed_files(path_to_find, since, state)
+                    scope = f"partial, changed since {since}"
+                if state.failed:
+                    return self._failed_result(path_to_find, state)
+                license_missing_files, copyright_missing_files, oss_pkg_info, _, report = \
+                    precheck_for_project(path_to_find, exclude_index, self.cache, self.jobs, files_to_check,
+                                         self.scan_bytes, self.full_scan, state, self.executor)
+            if state.failed:
+                return self._failed_result(path_to_find, state)
+
+            result_item = result_for_summary(path_to_find,
+                                             oss_pkg_info,
+                                             license_missing_files,
+                                             copyright_missing_files,
+                                             report,
+                                             result_log,
+                                             check_only_file_mode,
+                                             files or [],
+                                             state.error_items,
+                                             state.exclude_files,
+                                             exclude_index,
+                                             scope)
+        if self.profile:
+            result_item._profile = run_profiler.get_result()
+        return result_item, 0
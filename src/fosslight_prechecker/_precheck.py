@@ -5,286 +5,611 @@
 import os
 import sys
 import shutil
+import tempfile
+import contextlib
 import logging
 import locale
 import platform
-import re
 import subprocess
 from datetime import datetime
-from typing import Tuple, List
-from binaryornot.check import is_binary
+from pathlib import Path
+from collections import defaultdict
+from concurrent.futures import Executor
+from typing import Dict, Iterator, Tuple, List, Optional
 import fosslight_util.constant as constant
 from fosslight_util.set_log import init_log
 from fosslight_util.timer_thread import TimerThread
-from fosslight_util.exclude import excluding_files
-from reuse import report
+from reuse._util import _determine_license_path
 from reuse.project import Project
-from reuse.report import ProjectReport
-from reuse.vcs import VCSStrategyGit
-from fosslight_prechecker._result import write_result_file, create_result_file, result_for_summary, ResultItem
-from fosslight_prechecker._constant import DEFAULT_EXCLUDE_EXTENSION, OSS_PKG_INFO_FILES, PKG_NAME
+from fosslight_util.parsing_yaml import find_sbom_yaml_files
+from fosslight_prechecker._result import write_result_file, write_result_ndjson, create_result_file, result_for_summary, \
+    exclude_file_in_yaml, ResultItem
+from fosslight_prechecker._constant import DEFAULT_EXCLUDE_EXTENSION, PKG_NAME
+from fosslight_prechecker._walker import collect_files, collect_tree_files, get_ignored_paths, is_ignored_by_name, walk_path, EXCLUDED_BINARY, \
+    EXCLUDED_FOLDER, OSS_PKG_INFO_PATTERN
+from fosslight_prechecker._exclude import FileExcludeSet, PathExcludeIndex, get_exclude_index
+from fosslight_prechecker._analysis import build_file_record, extract_file_infos, generate_project_report, get_scan_options, \
+    iter_file_infos, extract_file_info_from_contents, make_file_record, merge_licenses_and_copyright, parse_dep5, \
+    LintReport, DEFAULT_SCAN_BYTES
+from fosslight_prechecker._cache import FileInfo, LintCache
+from fosslight_prechecker._git import get_git_file_status, get_staged_files, get_tree_files, iter_objects, EMPTY_BLOB_OBJECTS
+from fosslight_prechecker._binary import is_binary_file, is_binary_contents
+from fosslight_prechecker._dir_index import DirIndex, get_dir_fingerprints, get_dir_index_options
+from fosslight_prechecker._watch import WatchedProject, create_watcher
+from fosslight_prechecker._profile import get_profiler, profiler, profile_phase
 
 is_windows = platform.system() == 'Windows'
-REUSE_CONFIG_FILE = ".reuse/dep5"
-DEFAULT_EXCLUDE_EXTENSION_FILES = []  # Exclude files from reuse
-_turn_on_exclude_config = True
 _check_only_file_mode = False
-error_items = []
 _start_time = ""
 _result_log = {}
+EXCLUDED_UNREADABLE = "unreadable file"
 
 logger = logging.getLogger(constant.LOGGER_NAME)
 
 
-def exclude_untracked_files(path: str) -> None:
-    try:
-        cmd_result = subprocess.check_output(['git', 'ls-files', '-o'], universal_newlines=True)
-        cmd_result = cmd_result.split('\n')
-        cmd_result.remove('')
-        if not path.endswith(f"{os.sep}"):
-            path += f"{os.sep}"
-        cmd_result = [file.replace(path, '', 1) for file in cmd_result]
-        DEFAULT_EXCLUDE_EXTENSION_FILES.extend(cmd_result)
-    except Exception as ex:
-        logger.warning(f"Error to get git untracked files : {ex}")
-
+class LintState:
+    # Files excluded from reuse and errors of a run, so that runs with their own state don't affect each other
+    # Without exit_on_error, an error ending the run sets failed instead of exiting and the run returns early(Linter)
+    def __init__(self, turn_on_exclude_config: bool = True, exit_on_error: bool = True):
+        self.exclude_files = []
+        self.error_items = []
+        self.turn_on_exclude_config = turn_on_exclude_config
+        self.exit_on_error = exit_on_error
+        self.failed = False
 
-def exclude_gitignore_files(path: str) -> None:
-    try:
-        root_path = VCSStrategyGit.find_root(os.getcwd())
-        if root_path:
-            if os.path.isfile(os.path.join(root_path, '.gitignore')):
-                cmd_result = subprocess.check_output(['git',
-                                                      'ls-files',
-                                                      '-ci',
-                                                      '--exclude-from=.gitignore'],
-                                                     universal_newlines=True)
-                cmd_result = cmd_result.split('\n')
-                cmd_result.remove('')
-                if not path.endswith(f"{os.sep}"):
-                    path += f"{os.sep}"
-                cmd_result = [file.replace(path, '', 1) for file in cmd_result]
-                DEFAULT_EXCLUDE_EXTENSION_FILES.extend(cmd_result)
-    except Exception as ex:
-        logger.warning(f"Error to get git ignored files : {ex}")
+    def dump_error_msg(self, error_msg: str, exit=False) -> None:
+        self.error_items.append(error_msg)
+        if exit:
+            logger.error(error_msg)
+            self.failed = True
+            if self.exit_on_error:
+                sys.exit(1)
 
 
-def exclude_git_related_files(path: str) -> None:
-    try:
-        # Change currnt path for git command
-        current_path = os.getcwd()
-        os.chdir(path)
+# State of the command line run
+_default_state = LintState()
+DEFAULT_EXCLUDE_EXTENSION_FILES = _default_state.exclude_files  # Exclude files from reuse
+error_items = _default_state.error_items
 
-        # Exclude untracked files
-        exclude_untracked_files(path)
-        # Exclude ignore files
-        exclude_gitignore_files(path)
 
-        # Restore path
-        os.chdir(current_path)
+def get_changed_files(path: str, since: str, state: Optional[LintState] = None) -> List[str]:
+    # Files added or modified since the merge base of the ref and HEAD, relative to path
+    state = state or _default_state
+    changed_files = []
+    try:
+        with profile_phase("git"):
+            cmd_result = subprocess.check_output(['git', '-C', path, 'diff', '--name-only', '-z', '--relative',
+                                                  '--diff-filter=ACMRT', '--merge-base', '--end-of-options', since, '--'],
+                                                 stderr=subprocess.PIPE)
+        changed_files = [os.path.normpath(os.fsdecode(file)) for file in cmd_result.split(b'\0') if file]
+    except subprocess.CalledProcessError as ex:
+        state.dump_error_msg(f"Error to get changed files since {since}: {ex.stderr.decode(errors='replace').strip()}", True)
     except Exception as ex:
-        logger.warning(f"Error to get git related files : {ex}")
-
-
-def find_oss_pkg_info_and_exclude_file(path: str, abs_path_to_exclude: List) -> List[str]:
+        state.dump_error_msg(f"Error to get changed files since {since}: {ex}", True)
+    return changed_files
+
+
+def find_oss_pkg_info_and_exclude_file(
+    path: str,
+    exclude_index: PathExcludeIndex,
+    project: Project,
+    cache: Optional[LintCache] = None,
+    files_to_check: Optional[List[str]] = None,
+    state: Optional[LintState] = None,
+    dir_index: Optional[DirIndex] = None
+) -> Tuple[List[str], List[str], Dict[str, str]]:
+    # Also return the objects in the git index of the files unchanged from it, to find them in the cache.
+    # With dir_index, the folders unchanged from its previous run are not walked.
+    state = state or _default_state
     oss_pkg_info = []
-    git_present = shutil.which("git")
+    files_to_analyze = []
+    git_status = None
+    git_objects = {}
+    skip_dirs = None
+
+    if (state.turn_on_exclude_config or cache) and shutil.which("git"):
+        with profile_phase("git"):
+            git_status = get_git_file_status(path, with_objects=bool(cache))
+        if git_status:
+            git_objects = git_status.objects
+            if dir_index is not None and files_to_check is None:
+                # Folders with an ignored file are walked, since git doesn't know whether the file is changed
+                ignored = get_ignored_paths(project)
+                if ignored is not None:
+                    skip_dirs = dir_index.find_unchanged_dirs(get_dir_fingerprints(git_status, ignored, dir_index.version))
+        if not state.turn_on_exclude_config:
+            # Only for the objects
+            git_status = None
 
-    if _turn_on_exclude_config and git_present and VCSStrategyGit.in_repo(path):
-        exclude_git_related_files(path)
+    try:
+        with profile_phase("walk"):
+            if files_to_check is None:
+                inventory = walk_path(path, exclude_index, project, state.turn_on_exclude_config, cache, git_status, skip_dirs)
+            else:
+                inventory = collect_files(path, files_to_check, exclude_index, project, state.turn_on_exclude_config, cache,
+                                          git_status)
+        oss_pkg_info = inventory.oss_pkg_info
+        files_to_analyze = inventory.files_to_analyze
+        state.exclude_files.extend(inventory.exclude_files)
+        if inventory.exclude_dirs:
+            logger.debug(f"Excluded folders: {', '.join(sorted(set(inventory.exclude_dirs)))}")
+    except Exception as ex:
+        state.dump_error_msg(f"Error_FIND_OSS_PKG : {ex}")
+        if dir_index is not None:
+            # Nothing to save from this run
+            dir_index.find_unchanged_dirs({})
+
+    return oss_pkg_info, files_to_analyze, git_objects
+
+
+def precheck_for_files(
+    path: str,
+    files: List[str],
+    cache: Optional[LintCache] = None,
+    jobs: int = 0,
+    scan_bytes: int = DEFAULT_SCAN_BYTES,
+    full_scan: bool = False,
+    state: Optional[LintState] = None
+) -> Tuple[List[str], List[str], Project]:
+    state = state or _default_state
+    missing_license_list = []
+    missing_copyright_list = []
+    prj = None
 
     try:
-        for root, dirs, files in os.walk(path):
-            if os.path.abspath(root) in abs_path_to_exclude:
-                continue
-            for dir in dirs:
-                # For hidden folders
-                dir_path = os.path.join(root, dir)
-                dir_abs_path = os.path.abspath(dir_path)
-                if any(os.path.commonpath([dir_abs_path, exclude_path]) == exclude_path for exclude_path in abs_path_to_exclude):
-                    continue
-                if dir.startswith("."):
-                    all_files_in_dir = [os.path.join(root, dir, file)
-                                        for file in os.listdir(os.path.join(root, dir))
-                                        if os.path.isfile(os.path.join(root, dir, file))]
-                    all_files_rel_path = [os.path.relpath(file, path) for file in all_files_in_dir]
-                    DEFAULT_EXCLUDE_EXTENSION_FILES.extend(all_files_rel_path)
-
-            for file in files:
-                file_path = os.path.join(root, file)
-                file_abs_path = os.path.abspath(file_path)
-                if any(os.path.commonpath([file_abs_path, exclude_path]) == exclude_path for exclude_path in abs_path_to_exclude):
-                    continue
-                file_lower_case = file.lower()
-                file_rel_path = os.path.relpath(file_path, path)
-
-                if any(re.search(re_oss_pkg_pattern, file_lower_case) for re_oss_pkg_pattern in OSS_PKG_INFO_FILES) \
-                   or file_lower_case.startswith("module_license_"):
-                    oss_pkg_info.append(file_rel_path)
-                # Exclude hidden files
-                elif _turn_on_exclude_config and file.startswith('.'):
-                    DEFAULT_EXCLUDE_EXTENSION_FILES.append(file_rel_path)
-                elif is_binary(file_path):
-                    DEFAULT_EXCLUDE_EXTENSION_FILES.append(file_rel_path)
+        with profile_phase("project setup"):
+            prj = Project(path)
+
+        files_to_analyze = []
+        for file in files:
+            try:
+                file_abs_path = os.path.join(path, file)
+                extension = file.split(".")[-1]
+                if not os.path.isfile(file_abs_path) or extension in DEFAULT_EXCLUDE_EXTENSION \
+                   or is_binary_file(file_abs_path, cache=cache):
+                    if is_windows:
+                        file = file.replace(os.sep, '/')
+                    state.exclude_files.append(file)
                 else:
-                    extension = file_lower_case.split(".")[-1]
-                    if extension in DEFAULT_EXCLUDE_EXTENSION:
-                        DEFAULT_EXCLUDE_EXTENSION_FILES.append(file_rel_path)
-    except Exception as ex:
-        dump_error_msg(f"Error_FIND_OSS_PKG : {ex}")
+                    files_to_analyze.append(file)
+            except Exception as ex:
+                state.dump_error_msg(f"Error - precheck_for_files to read : {ex}", True)
+                return missing_license_list, missing_copyright_list, prj
+
+        file_paths = {file: Path(os.path.join(path, file)) for file in files_to_analyze}
+        with profile_phase("analysis"):
+            file_infos, read_errors = extract_file_infos([_determine_license_path(file_path) for file_path in file_paths.values()],
+                                                         cache, jobs, scan_bytes, full_scan)
+        for file, file_abs_path in file_paths.items():
+            try:
+                license_path = _determine_license_path(file_abs_path)
+                if license_path in read_errors:
+                    raise read_errors[license_path]
+                logger.info(f"# {file}")
+                record = build_file_record(prj, file_abs_path, file_infos[license_path])
 
-    return oss_pkg_info
+                logger.info(f"* License: {', '.join(record.licenses)}")
+                logger.info(f"* Copyright: {record.copyright}\n")
 
+                if not record.licenses:
+                    missing_license_list.append(file)
+                if not record.copyright:
+                    missing_copyright_list.append(file)
 
-def create_reuse_dep5_file(path: str) -> Tuple[bool, str, str]:
-    # Create .reuse/dep5 for excluding directories from reuse.
-    _DEFAULT_CONFIG_PREFIX = "Format: https://www.debian.org/doc/packaging-manuals/copyright-format/1.0/\nUpstream-Name: \
-                        reuse\nUpstream-Contact: Carmen Bianca Bakker <carmenbianca@fsfe.org>\nSource: https://github.com/fsfe/reuse-tool\n"
-    _DEFAULT_EXCLUDE_FOLDERS = ["venv*/*", "node_modules*/*", ".*/*"]
+            except Exception as ex:
+                state.dump_error_msg(f"Error - precheck_for_files to read : {ex}", True)
+                return missing_license_list, missing_copyright_list, prj
 
-    reuse_config_file = os.path.join(path, REUSE_CONFIG_FILE)
-    file_to_remove = reuse_config_file
-    dir_to_remove = os.path.dirname(reuse_config_file)
-    need_rollback = False
-    str_contents = ""
+    except Exception as ex:
+        state.dump_error_msg(f"Error - precheck_for_files: {ex}", True)
 
-    try:
-        if not os.path.exists(dir_to_remove):
-            os.makedirs(dir_to_remove, exist_ok=True)
-        else:
-            dir_to_remove = ""
-        if os.path.exists(reuse_config_file):
-            file_to_remove = f"{reuse_config_file}_{_start_time}.bk"
-            shutil.copy2(reuse_config_file, file_to_remove)
-            need_rollback = True
+    return missing_license_list, missing_copyright_list, prj
 
-        DEFAULT_EXCLUDE_EXTENSION_FILES.extend(_DEFAULT_EXCLUDE_FOLDERS)
-        exclude_file_list = list(set(DEFAULT_EXCLUDE_EXTENSION_FILES))
 
-        if is_windows:
-            exclude_file_list = [file.replace(os.sep, '/') for file in exclude_file_list]
+def precheck_for_staged(
+    path: str,
+    files: Optional[List[str]] = None,
+    scan_bytes: int = DEFAULT_SCAN_BYTES,
+    full_scan: bool = False,
+    state: Optional[LintState] = None
+) -> Tuple[List[str], List[str], List[str], LintReport]:
+    # Check the contents staged in the git index instead of the working tree, which may differ from what is committed.
+    # The blobs are read by a single 'git cat-file' and analyzed in memory without Project, which walks the path.
+    # If files are given(relative to path), only the staged ones among them are checked.
+    state = state or _default_state
+    missing_license_list = []
+    missing_copyright_list = []
+    report = LintReport()
 
-        for file_to_exclude in exclude_file_list:
-            str_contents += f"\nFiles: {file_to_exclude} \nCopyright: -\nLicense: -\n"
+    try:
+        with profile_phase("git"):
+            staged_files = get_staged_files(path)
+    except subprocess.CalledProcessError as ex:
+        error_msg = ex.stderr.decode(errors='replace').strip()
+        if "--no-index" in error_msg:
+            # git diff out of a repository has no index
+            error_msg = f"{path} is not in a git repository"
+        state.dump_error_msg(f"Error to get staged files: {error_msg}", True)
+    except Exception as ex:
+        state.dump_error_msg(f"Error to get staged files: {ex}", True)
+    files_to_check = {os.path.normpath(file) for file in files} if files else None
+    staged_files = {file: staged_object for file, staged_object in staged_files.items()
+                    if (files_to_check is None or file in files_to_check) and not is_ignored_by_name(file)}
+    logger.info(f"Staged files: {len(staged_files)}")
+
+    files_to_analyze = []
+    for file in staged_files:
+        if file.split(".")[-1] in DEFAULT_EXCLUDE_EXTENSION:
+            state.exclude_files.append(file.replace(os.sep, '/') if is_windows else file)
+        else:
+            files_to_analyze.append(file)
+
+    # .reuse/dep5, then the blob and the staged .license file of each file
+    names = [":./.reuse/dep5"]
+    for file in files_to_analyze:
+        names.append(staged_files[file])
+        # A name can't have a newline in the input of 'git cat-file'
+        if "\n" not in file:
+            names.append(f":./{file.replace(os.sep, '/')}.license")
+    run_profiler = get_profiler()
+    try:
+        with profile_phase("analysis"):
+            objects = iter_objects(path, names)
+            _, dep5_contents = next(objects)
+            dep5 = parse_dep5(dep5_contents) if dep5_contents is not None else None
+            for file in files_to_analyze:
+                _, contents = next(objects)
+                license_contents = next(objects)[1] if "\n" not in file else None
+                if not contents or is_binary_contents(file, contents):
+                    state.exclude_files.append(file.replace(os.sep, '/') if is_windows else file)
+                    continue
+                license_file = file if license_contents is None else f"{file}.license"
+                file_info = extract_file_info_from_contents(license_file, contents if license_contents is None else license_contents,
+                                                            scan_bytes, full_scan)
+                if run_profiler.timing:
+                    run_profiler.add_count("analyzed files", 1)
+                    run_profiler.add_count("analyzed bytes", len(contents))
+                logger.info(f"# {file}")
+                record = make_file_record(*merge_licenses_and_copyright(file_info, Path(license_file), dep5))
+                report.records[file] = record
+
+                logger.info(f"* License: {', '.join(record.licenses)}")
+                logger.info(f"* Copyright: {record.copyright}\n")
+
+                if not record.licenses:
+                    missing_license_list.append(file)
+                if not record.copyright:
+                    missing_copyright_list.append(file)
+            objects.close()
+    except Exception as ex:
+        state.dump_error_msg(f"Error - precheck_for_staged to read : {ex}", True)
+
+    return missing_license_list, missing_copyright_list, list(staged_files), report
+
+
+def precheck_for_rev(
+    path: str,
+    rev: str,
+    exclude_index: PathExcludeIndex,
+    files: Optional[List[str]] = None,
+    scan_bytes: int = DEFAULT_SCAN_BYTES,
+    full_scan: bool = False,
+    state: Optional[LintState] = None
+) -> Tuple[List[str], List[str], List[str], LintReport, Dict[str, bytes]]:
+    # Check the files of a git tree-ish(ex, a release tag) under path without checking it out.
+    # The tree is listed by 'git ls-tree' and the blobs are streamed by a single 'git cat-file',
+    # where the same contents are read and analyzed once however many files have them.
+    # Return the OSS package info files with the missing lists and the contents of the sbom yaml files,
+    # which are parsed from the disk.
+    state = state or _default_state
+    missing_license = []
+    missing_copyright = []
+    report = LintReport()
 
-        with open(reuse_config_file, "a", encoding="utf8") as f:
-            if not need_rollback:
-                f.write(_DEFAULT_CONFIG_PREFIX)
-            f.write(str_contents)
+    try:
+        with profile_phase("git"):
+            tree_files = get_tree_files(path, rev)
+    except subprocess.CalledProcessError as ex:
+        state.dump_error_msg(f"Error to get the files of {rev}: {ex.stderr.decode(errors='replace').strip()}", True)
     except Exception as ex:
-        dump_error_msg(f"Error_Create_Dep5 : {ex}")
+        state.dump_error_msg(f"Error to get the files of {rev}: {ex}", True)
+    logger.info(f"Files of {rev}: {len(tree_files)}")
+
+    with profile_phase("walk"):
+        files_to_list = [os.path.normpath(file) for file in files] if files else list(tree_files)
+        inventory, files_to_read = collect_tree_files(path, [file for file in files_to_list if file in tree_files],
+                                                      exclude_index, state.turn_on_exclude_config)
+    files_to_read = set(files_to_read)
+    # Same as walk_path, every sbom yaml file is used to find the files it covers
+    sbom_files = {file: tree_files[file] for file in tree_files if OSS_PKG_INFO_PATTERN.search(os.path.basename(file).lower())}
+
+    # Object -> files having the contents, and .license object -> files having the .license file
+    files_by_object = defaultdict(list)
+    files_by_license_object = defaultdict(list)
+    # Reported with 'License: -' and 'Copyright: -' added as FileExcludeSet, but analyzed as the folder does
+    excluded_by_name = set(inventory.exclude_files) if state.turn_on_exclude_config else set()
+    for file in inventory.files_to_analyze:
+        if tree_files[file] in EMPTY_BLOB_OBJECTS:
+            # Empty files are not analyzed by reuse
+            continue
+        license_object = tree_files.get(f"{file}.license")
+        if license_object:
+            files_by_license_object[license_object].append(file)
+        if file in files_to_read or not license_object:
+            files_by_object[tree_files[file]].append(file)
+    inventory.files_to_analyze = None
+
+    def _add_record(file: str, file_info: FileInfo, license_file: str) -> None:
+        excluded = file in excluded_by_name or license_file in excluded_by_name
+        report.records[file] = make_file_record(*merge_licenses_and_copyright(file_info, Path(license_file), dep5, excluded))
+
+    dep5_object = tree_files.get(os.path.join(".reuse", "dep5"))
+    names = ([dep5_object] if dep5_object else []) + list(files_by_object) + list(files_by_license_object) + \
+        [sbom_object for sbom_object in dict.fromkeys(sbom_files.values())]
+    sbom_contents = {}
+    run_profiler = get_profiler()
+    try:
+        with profile_phase("analysis"):
+            objects = iter_objects(path, names)
+            dep5 = None
+            if dep5_object:
+                _, dep5_contents = next(objects)
+                dep5 = parse_dep5(dep5_contents) if dep5_contents is not None else None
+            for tree_object in list(files_by_object):
+                _, contents = next(objects)
+                contents = contents or b""
+                file_info = None
+                for file in files_by_object.pop(tree_object):
+                    if file in files_to_read and is_binary_contents(file, contents):
+                        inventory.exclude(file, EXCLUDED_BINARY)
+                        if state.turn_on_exclude_config:
+                            excluded_by_name.add(file)
+                    if f"{file}.license" in tree_files:
+                        continue
+                    if file_info is None:
+                        file_info = extract_file_info_from_contents(file, contents, scan_bytes, full_scan)
+                        if run_profiler.timing:
+                            run_profiler.add_count("analyzed files", 1)
+                            run_profiler.add_count("analyzed bytes", len(contents))
+                    _add_record(file, file_info, file)
+            for license_object in list(files_by_license_object):
+                _, contents = next(objects)
+                file_info = None
+                for file in files_by_license_object.pop(license_object):
+                    if file_info is None:
+                        file_info = extract_file_info_from_contents(f"{file}.license", contents or b"", scan_bytes, full_scan)
+                    _add_record(file, file_info, f"{file}.license")
+            contents_by_object = dict(objects)
+            sbom_contents = {file: contents_by_object[sbom_object] for file, sbom_object in sbom_files.items()
+                             if contents_by_object.get(sbom_object) is not None}
+    except Exception as ex:
+        state.dump_error_msg(f"Error - precheck_for_rev to read : {ex}", True)
 
-    return need_rollback, file_to_remove, dir_to_remove
+    state.exclude_files.extend(inventory.exclude_files)
+    if inventory.exclude_dirs:
+        logger.debug(f"Excluded folders: {', '.join(sorted(set(inventory.exclude_dirs)))}")
+    missing_license, missing_copyright = get_missing_files(report, path, exclude_index)
+    return missing_license, missing_copyright, inventory.oss_pkg_info, report, sbom_contents
 
 
-def remove_reuse_dep5_file(
-    rollback: bool,
-    file_to_remove: str,
-    temp_dir_name: str
-) -> None:
-    try:
-        if rollback:
-            _origin_file = os.path.join(os.path.dirname(file_to_remove), os.path.basename(REUSE_CONFIG_FILE))
-            shutil.copy2(file_to_remove, _origin_file)
+def precheck_for_project(
+    path_to_find: str,
+    exclude_index: PathExcludeIndex,
+    cache: Optional[LintCache] = None,
+    jobs: int = 0,
+    files_to_check: Optional[List[str]] = None,
+    scan_bytes: int = DEFAULT_SCAN_BYTES,
+    full_scan: bool = False,
+    state: Optional[LintState] = None,
+    executor: Optional[Executor] = None,
+    dir_index: Optional[DirIndex] = None
+) -> Tuple[List[str], List[str], List[str], Project, LintReport]:
+    # dir_index is updated with the result if all files are checked(files_to_check is None)
+    state = state or _default_state
+    missing_license = []
+    missing_copyright = []
 
-        os.remove(file_to_remove)
+    oss_pkg_info_files = []
+    project = None
+    report = LintReport()
 
-        if temp_dir_name != "":
-            os.rmdir(temp_dir_name)
+    try:
+        with profile_phase("project setup"):
+            project = Project(path_to_find)
+        oss_pkg_info_files, files_to_analyze, git_objects = find_oss_pkg_info_and_exclude_file(path_to_find, exclude_index,
+                                                                                               project, cache, files_to_check,
+                                                                                               state, dir_index)
+        exclude_set = FileExcludeSet(state.exclude_files) if state.turn_on_exclude_config else None
+        report = generate_project_report(project, files_to_analyze, cache, jobs, exclude_set, scan_bytes, full_scan, executor,
+                                         git_objects)
+        if dir_index is not None and files_to_check is None:
+            dir_index.restore(report, oss_pkg_info_files, state.exclude_files)
+            dir_index.update(report, oss_pkg_info_files, state.exclude_files)
+        missing_license, missing_copyright = get_missing_files(report, path_to_find, exclude_index)
 
     except Exception as ex:
-        dump_error_msg(f"Error_Remove_Dep5 : {ex}")
+        state.dump_error_msg(f"Error prechecker lint: {ex}", True)
 
+    return missing_license, missing_copyright, oss_pkg_info_files, project, report
 
-def precheck_for_files(path: str, files: List[str]) -> Tuple[List[str], List[str], Project]:
-    missing_license_list = []
-    missing_copyright_list = []
 
-    try:
-        prj = Project(path)
+def get_missing_files(report: LintReport, path_to_find: str, exclude_index: PathExcludeIndex) -> Tuple[List[str], List[str]]:
+    # File list that missing license text
+    missing_license = filter_missing_list(report.files_without_licenses, exclude_index, path_to_find)
+    # File list that missing copyright text
+    missing_copyright = filter_missing_list(report.files_without_copyright, exclude_index, path_to_find)
+    return missing_license, missing_copyright
 
-        for file in files:
-            try:
-                file_abs_path = os.path.join(path, file)
-                if not os.path.isfile(file_abs_path) or is_binary(file_abs_path):
-                    if is_windows:
-                        file = file.replace(os.sep, '/')
-                    DEFAULT_EXCLUDE_EXTENSION_FILES.append(file)
-                else:
-                    extension = file.split(".")[-1]
-                    if extension in DEFAULT_EXCLUDE_EXTENSION:
-                        if is_windows:
-                            file = file.replace(os.sep, '/')
-                        DEFAULT_EXCLUDE_EXTENSION_FILES.append(file)
-                    else:
-                        logger.info(f"# {file}")
-                        rep = report.FileReport.generate(prj, file_abs_path)
-
-                        logger.info(f"* License: {', '.join(rep.spdxfile.licenses_in_file)}")
-                        logger.info(f"* Copyright: {rep.spdxfile.copyright}\n")
-
-                        if rep.spdxfile.licenses_in_file is None or len(rep.spdxfile.licenses_in_file) == 0:
-                            missing_license_list.append(file)
-                        if rep.spdxfile.copyright is None or len(rep.spdxfile.copyright) == 0:
-                            missing_copyright_list.append(file)
 
-            except Exception as ex:
-                dump_error_msg(f"Error - precheck_for_files to read : {ex}", True)
+def _lint_record(rel_path: str, licenses: Optional[List[str]] = None, copyright: bool = False, excluded: Optional[str] = None) -> dict:
+    return {"path": rel_path, "licenses": licenses or [], "copyright": copyright, "excluded": excluded}
 
-    except Exception as ex:
-        dump_error_msg(f"Error - precheck_for_files: {ex}", True)
 
-    return missing_license_list, missing_copyright_list, prj
+def _iter_sbom_covered(path_to_find: str, missing_records: Dict[str, dict]) -> Iterator[dict]:
+    # Same coverage of the sbom yaml files as the other formats: "sbom_info" has what of the missing license and copyright
+    # is given in the yaml files, or excluded by them
+    missing_license = {rel_path for rel_path, record in missing_records.items() if not record["licenses"]}
+    missing_copyright = {rel_path for rel_path, record in missing_records.items() if not record["copyright"]}
+    with profile_phase("sbom yaml matching"):
+        still_missing_license, still_missing_copyright, _ = exclude_file_in_yaml(path_to_find, find_sbom_yaml_files(path_to_find),
+                                                                                 missing_license, missing_copyright)
+    covered_license = missing_license - set(still_missing_license)
+    covered_copyright = missing_copyright - set(still_missing_copyright)
+    for rel_path, record in missing_records.items():
+        sbom_info = [item for item, covered in (("license", covered_license), ("copyright", covered_copyright))
+                     if rel_path in covered]
+        if sbom_info:
+            record["sbom_info"] = sbom_info
+        yield record
 
 
-def precheck_for_project(path_to_find: str, abs_path_to_exclude: List) -> Tuple[List[str], List[str], List[str], Project, ProjectReport]:
-    missing_license = []
-    missing_copyright = []
-
-    oss_pkg_info_files = find_oss_pkg_info_and_exclude_file(path_to_find, abs_path_to_exclude)
-    if _turn_on_exclude_config:
-        need_rollback, temp_file_name, temp_dir_name = create_reuse_dep5_file(path_to_find)
-
-    try:
+def iter_lint_results(
+    path_to_find: str,
+    exclude_path: list = [],
+    disable: bool = False,
+    files_to_check: Optional[List[str]] = None,
+    cache: Optional[LintCache] = None,
+    jobs: int = 0,
+    scan_bytes: int = DEFAULT_SCAN_BYTES,
+    full_scan: bool = False,
+    project: Optional[Project] = None,
+    executor: Optional[Executor] = None
+) -> Iterator[dict]:
+    # Yield the result of each file as soon as it is available, without keeping the results:
+    # {"path": relative path, "licenses": license identifiers, "copyright": copyright present, "excluded": reason or None}
+    # OSS package info files have "oss_pkg_info" and, like the other formats, are not counted as missing license or copyright.
+    # If there are such files, the other files missing license or copyright are yielded at the end
+    # with "sbom_info" if the sbom yaml files cover them.
+    # If files_to_check is given, only those files(relative to path_to_find) are checked instead of walking the path.
+    exclude_index = get_exclude_index(exclude_path, path_to_find)
+    if project is None:
         project = Project(path_to_find)
-        report = ProjectReport.generate(project)
-
-        # File list that missing license text
-        missing_license = [str(sub) for sub in set(report.files_without_licenses)]
-        if not path_to_find.endswith(f"{os.sep}"):
-            path_to_find += f"{os.sep}"
-        missing_license = filter_missing_list(missing_license, abs_path_to_exclude)
-        missing_license = [sub.replace(path_to_find, '', 1) for sub in missing_license]
-
-        # File list that missing copyright text
-        missing_copyright = [str(sub) for sub in set(report.files_without_copyright)]
-        if not path_to_find.endswith(f"{os.sep}"):
-            path_to_find += f"{os.sep}"
-        missing_copyright = filter_missing_list(missing_copyright, abs_path_to_exclude)
-        missing_copyright = [sub.replace(path_to_find, '', 1) for sub in missing_copyright]
+    git_status = get_git_file_status(path_to_find) if not disable and shutil.which("git") else None
+    if files_to_check is None:
+        inventory = walk_path(path_to_find, exclude_index, project, not disable, cache, git_status)
+    else:
+        inventory = collect_files(path_to_find, files_to_check, exclude_index, project, not disable, cache, git_status)
+
+    for rel_path in dict.fromkeys(inventory.exclude_dirs):
+        yield _lint_record(rel_path, excluded=EXCLUDED_FOLDER)
+    for rel_path, reason in inventory.exclude_reasons.items():
+        yield _lint_record(rel_path, excluded=reason)
+
+    paths_by_license_path = defaultdict(list)
+    for rel_path in inventory.files_to_analyze:
+        if rel_path not in inventory.exclude_reasons:
+            path = project.root / rel_path
+            paths_by_license_path[_determine_license_path(path)].append(path)
+    # Files missing license or copyright until the sbom yaml files are matched
+    missing_records = {} if inventory.oss_pkg_info else None
+    oss_pkg_info = set(inventory.oss_pkg_info)
+    # The lists of the walk are not needed while analyzing
+    inventory = None
+
+    for license_path, file_info, error in iter_file_infos(list(paths_by_license_path), cache, jobs, scan_bytes, full_scan,
+                                                          executor):
+        for path in paths_by_license_path.pop(license_path):
+            rel_path = str(project.relative_from_root(path))
+            if error:
+                logger.debug(f"Could not read '{path}': {error}")
+                yield _lint_record(rel_path, excluded=EXCLUDED_UNREADABLE)
+                continue
+            record = build_file_record(project, path, file_info)
+            lint_record = _lint_record(rel_path, sorted(set(record.licenses)), bool(record.copyright))
+            if rel_path in oss_pkg_info:
+                lint_record["oss_pkg_info"] = True
+            elif missing_records is not None and not (lint_record["licenses"] and lint_record["copyright"]):
+                missing_records[rel_path] = lint_record
+                continue
+            yield lint_record
+    if missing_records:
+        yield from _iter_sbom_covered(path_to_find, missing_records)
+
+
+def _iter_watched_results(watched: WatchedProject) -> Iterator[dict]:
+    for rel_path in sorted(watched.exclude_dirs):
+        yield _lint_record(rel_path, excluded=EXCLUDED_FOLDER)
+    for rel_path, reason in watched.exclude_reasons.items():
+        yield _lint_record(rel_path, excluded=reason)
+    for rel_path in sorted(watched.read_errors):
+        yield _lint_record(rel_path, excluded=EXCLUDED_UNREADABLE)
+    for rel_path, record in sorted(watched.file_records.items()):
+        if rel_path not in watched.exclude_reasons:
+            yield _lint_record(rel_path, sorted(set(record.licenses)), bool(record.copyright))
+
+
+def _write_watched_result(
+    watched: WatchedProject,
+    result_file: str,
+    output_extension: str,
+    exit_code: int
+) -> Tuple[bool, int]:
+    reset_global_state()
+    DEFAULT_EXCLUDE_EXTENSION_FILES.extend(watched.exclude_reasons)
+    if output_extension == ".ndjson":
+        return write_result_ndjson(result_file, exit_code, _iter_watched_results(watched))
+
+    report = watched.get_project_report()
+    license_missing_files, copyright_missing_files = get_missing_files(report, watched.path, watched.exclude_index)
+    result_item = result_for_summary(watched.path,
+                                     list(watched.oss_pkg_info),
+                                     license_missing_files,
+                                     copyright_missing_files,
+                                     report,
+                                     _result_log,
+                                     False,
+                                     [],
+                                     error_items,
+                                     DEFAULT_EXCLUDE_EXTENSION_FILES,
+                                     watched.exclude_index)
+    return write_result_file(result_file, output_extension, exit_code, result_item, _result_log, watched.project, watched.path)
+
+
+def watch_lint(
+    path_to_find: str,
+    exclude_index: PathExcludeIndex,
+    result_file: str,
+    output_extension: str,
+    cache: Optional[LintCache] = None,
+    jobs: int = 0,
+    scan_bytes: int = DEFAULT_SCAN_BYTES,
+    full_scan: bool = False
+) -> Tuple[bool, int]:
+    # Lint the whole path once, then analyze only the changed files and write the result again until interrupted
+    watched = WatchedProject(path_to_find, exclude_index, _default_state.turn_on_exclude_config, cache, jobs, scan_bytes, full_scan)
+    watched.scan()
+    success, exit_code = _write_watched_result(watched, result_file, output_extension, 0)
+
+    watcher = create_watcher(path_to_find, watched.is_dir_watched)
+    logger.warning(f"Watching the changes of files in {path_to_find} (Press Ctrl+C to stop)")
+    try:
+        while True:
+            changes = watcher.read_changes()
+            if watched.refresh(changes):
+                logger.warning(f"Updated: {result_file} ({datetime.now().strftime('%H:%M:%S')})")
+                success, exit_code = _write_watched_result(watched, result_file, output_extension, 0)
+    except KeyboardInterrupt:
+        logger.warning("Stopped watching")
+    finally:
+        watcher.close()
+    return success, exit_code
 
-    except Exception as ex:
-        dump_error_msg(f"Error prechecker lint: {ex}", True)
 
-    if _turn_on_exclude_config:
-        remove_reuse_dep5_file(need_rollback, temp_file_name, temp_dir_name)
-    return missing_license, missing_copyright, oss_pkg_info_files, project, report
+def filter_missing_list(missing_list: List[str], exclude_index: PathExcludeIndex, path_to_find: str = "") -> List[str]:
+    # The files are relative to path_to_find
+    if not exclude_index:
+        return missing_list
+    return [file for file in missing_list if not exclude_index.is_excluded(os.path.join(path_to_find, file))]
 
 
-def filter_missing_list(missing_list: List[str], abs_path_to_exclude: List) -> List[str]:
-    filtered_list = []
-    for file in missing_list:
-        abs_path = os.path.abspath(file)
-        if not any(os.path.commonpath([abs_path, path]) == path for path in abs_path_to_exclude):
-            filtered_list.append(file)
-    return filtered_list
+def reset_global_state() -> None:
+    # For the callers running several checks in one process
+    DEFAULT_EXCLUDE_EXTENSION_FILES.clear()
+    error_items.clear()
 
 
 def dump_error_msg(error_msg: str, exit=False) -> None:
-    error_items.append(error_msg)
-    if exit:
-        logger.error(error_msg)
-        sys.exit(1)
+    _default_state.dump_error_msg(error_msg, exit)
 
 
 def init(
@@ -334,23 +659,52 @@ def get_path_to_find(target_path: str, _check_only_file_mode: bool) -> Tuple[str
     return path_to_find, file_to_check_list, _check_only_file_mode
 
 
+@contextlib.contextmanager
+def _sbom_folder(sbom_contents: Optional[Dict[str, bytes]]) -> Iterator[str]:
+    # Temporary folder with the sbom yaml files not in the working tree(--rev), since they are parsed from the disk
+    if sbom_contents is None:
+        yield ""
+        return
+    with tempfile.TemporaryDirectory(prefix="fosslight_prechecker_") as sbom_path:
+        for file, contents in sbom_contents.items():
+            file_path = os.path.join(sbom_path, file)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, "wb") as f:
+                f.write(contents)
+        yield sbom_path
+
+
 def run_lint(
     target_path: str,
     disable: bool,
     output_file_name: str,
     format: str = '',
     need_log_file: bool = True,
-    exclude_path: list = []
+    exclude_path: list = [],
+    cache_dir: str = "",
+    jobs: int = 0,
+    since: str = "",
+    scan_bytes: int = DEFAULT_SCAN_BYTES,
+    full_scan: bool = False,
+    watch: bool = False,
+    profile: int = 0,
+    report_memory: bool = False,
+    staged: bool = False,
+    rev: str = ""
 ) -> None:
-    global _turn_on_exclude_config, _check_only_file_mode, _start_time
+    global _check_only_file_mode, _start_time
 
-    abs_path_to_exclude = []
     file_to_check_list = []
     _exit_code = 0
     path_to_find = ""
-    report = ProjectReport()
+    report = LintReport()
     result_item = ResultItem()
     success = False
+    scope = ""
+    files_to_check = None
+    project = None
+    sbom_contents = None
+    dir_index = None
     _start_time = datetime.now().strftime('%y%m%d_%H%M')
 
     try:
@@ -359,49 +713,128 @@ def run_lint(
         dump_error_msg(f"Error - locale : {ex}")
 
     path_to_find, file_to_check_list, _check_only_file_mode = get_path_to_find(target_path, _check_only_file_mode)
-    user_exclude_path = excluding_files(exclude_path, path_to_find)
-    abs_path_to_exclude = [os.path.abspath(path) for path in user_exclude_path]
+    exclude_index = get_exclude_index(exclude_path, path_to_find)
 
     result_file, output_path, output_extension = create_result_file(output_file_name, format, _start_time)
     init(path_to_find, output_path, file_to_check_list, need_log_file, exclude_path)
 
     if os.path.isdir(path_to_find):
         oss_pkg_info = []
-        _turn_on_exclude_config = not disable
-
-        if need_log_file:
+        _default_state.turn_on_exclude_config = not disable
+
+        if watch and (_check_only_file_mode or since):
+            logger.error("(--watch option) Can't be used with files to check or --since")
+            sys.exit(1)
+        if since and _check_only_file_mode:
+            logger.error("(--since option) Can't be used with files to check")
+            sys.exit(1)
+        if staged and (watch or since or rev or output_extension == ".ndjson"):
+            logger.error("(--staged option) Can't be used with --watch, --since, --rev or ndjson format")
+            sys.exit(1)
+        if rev and (watch or since or output_extension == ".ndjson"):
+            logger.error("(--rev option) Can't be used with --watch, --since or ndjson format")
+            sys.exit(1)
+        if profile or report_memory:
+            if watch:
+                logger.error("(--profile, --report-memory option) Can't be used with --watch")
+                sys.exit(1)
+            profiler.enable(profile, report_memory)
+
+        if need_log_file and not watch:
             # Use ProgressBar
             timer = TimerThread()
             timer.setDaemon(True)
             timer.start()
 
-        if _check_only_file_mode:
-            license_missing_files, copyright_missing_files, project = precheck_for_files(path_to_find, file_to_check_list)
+        cache = None
+        if cache_dir:
+            cache = LintCache(cache_dir, options=get_scan_options(scan_bytes, full_scan))
+            cache.load()
+
+        if since:
+            files_to_check = get_changed_files(path_to_find, since)
+            scope = f"partial, changed since {since}"
+            logger.info(f"Files changed since {since}: {len(files_to_check)}")
+
+        if watch:
+            success, exit_code = watch_lint(path_to_find, exclude_index, result_file, output_extension, cache, jobs,
+                                            scan_bytes, full_scan)
+        elif output_extension == ".ndjson":
+            # Each result is written as soon as the file is analyzed
+            lint_results = iter_lint_results(path_to_find, exclude_path, disable or _check_only_file_mode,
+                                             file_to_check_list if _check_only_file_mode else files_to_check,
+                                             cache, jobs, scan_bytes, full_scan)
+            success, exit_code = write_result_ndjson(result_file, _exit_code, lint_results)
         else:
-            license_missing_files, copyright_missing_files, oss_pkg_info, project, report = precheck_for_project(path_to_find,
-                                                                                                                 abs_path_to_exclude)
-
-        if need_log_file:
+            if staged:
+                license_missing_files, copyright_missing_files, file_to_check_list, report = precheck_for_staged(path_to_find,
+                                                                                                                 file_to_check_list,
+                                                                                                                 scan_bytes,
+                                                                                                                 full_scan)
+                _check_only_file_mode = True
+                scope = "staged"
+            elif rev:
+                license_missing_files, copyright_missing_files, oss_pkg_info, report, sbom_contents = \
+                    precheck_for_rev(path_to_find, rev, exclude_index, file_to_check_list, scan_bytes, full_scan)
+                scope = f"rev {rev}"
+            elif _check_only_file_mode:
+                license_missing_files, copyright_missing_files, project = precheck_for_files(path_to_find, file_to_check_list, cache,
+                                                                                             jobs, scan_bytes, full_scan)
+            else:
+                if cache and files_to_check is None:
+                    dir_index = DirIndex(cache, path_to_find, get_dir_index_options(path_to_find, not disable, exclude_path))
+                    dir_index.load()
+                license_missing_files, copyright_missing_files, oss_pkg_info, project, report = precheck_for_project(path_to_find,
+                                                                                                                     exclude_index,
+                                                                                                                     cache,
+                                                                                                                     jobs,
+                                                                                                                     files_to_check,
+                                                                                                                     scan_bytes,
+                                                                                                                     full_scan,
+                                                                                                                     dir_index=dir_index)
+
+            with profile_phase("summary"), _sbom_folder(sbom_contents) as sbom_path:
+                result_item = result_for_summary(path_to_find,
+                                                 oss_pkg_info,
+                                                 license_missing_files,
+                                                 copyright_missing_files,
+                                                 report,
+                                                 _result_log,
+                                                 _check_only_file_mode,
+                                                 file_to_check_list,
+                                                 error_items,
+                                                 DEFAULT_EXCLUDE_EXTENSION_FILES,
+                                                 exclude_index,
+                                                 scope,
+                                                 sbom_path)
+
+            result_item._profile = profiler.get_result()
+            result_item._memory = profiler.get_memory_result()
+            with profile_phase("report writing"):
+                success, exit_code = write_result_file(result_file, output_extension, _exit_code,
+                                                       result_item, _result_log, project, path_to_find)
+
+        if cache:
+            cache.save()
+            if dir_index is not None:
+                dir_index.save()
+            logger.debug(f"Lint cache: {cache.hits} hit(s), {cache.misses} miss(es), {cache.entry_count} entries in {cache.cache_file}")
+
+        if need_log_file and not watch:
             timer.stop = True
 
-        result_item = result_for_summary(path_to_find,
-                                         oss_pkg_info,
-                                         license_missing_files,
-                                         copyright_missing_files,
-                                         report,
-                                         _result_log,
-                                         _check_only_file_mode,
-                                         file_to_check_list,
-                                         error_items,
-                                         DEFAULT_EXCLUDE_EXTENSION_FILES,
-                                         abs_path_to_exclude)
-
-        success, exit_code = write_result_file(result_file, output_extension, _exit_code,
-                                               result_item, _result_log, project, path_to_find)
         if success:
             logger.warning(f"Created file name: {result_file}\n")
         else:
             logger.warning("Can't make result file\n")
+        if profile or report_memory:
+            if report_memory:
+                memory = profiler.get_memory_result()
+                logger.info(f"Peak memory: {memory['peak traced MB']} MB traced, {memory['peak RSS MB']} MB RSS")
+            # Written after the result file to have the time of writing it
+            profile_file = f"{os.path.splitext(result_file)[0]}_profile.json"
+            if profiler.write_json(profile_file):
+                logger.warning(f"Created profile: {profile_file}\n")
         sys.exit(exit_code)
     else:
         logger.error(f"(-p option) Check the path to find : {target_path}")
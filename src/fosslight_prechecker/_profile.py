@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+import os
+import sys
+import json
+import time
+import heapq
+import logging
+import threading
+import tracemalloc
+import contextlib
+import fosslight_util.constant as constant
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Optional
+try:
+    import resource
+except ImportError:
+    # Windows
+    resource = None
+
+DEFAULT_PROFILE_TOP_FILES = 10
+_NOT_PROFILED = contextlib.nullcontext()
+_MB = 1024 * 1024
+
+logger = logging.getLogger(constant.LOGGER_NAME)
+
+
+class _Phase:
+    def __init__(self, profiler: "Profiler", name: str):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        if self._profiler.memory:
+            self._profiler.enter_memory_phase()
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._profiler.add_phase(self._name, time.perf_counter() - self._wall, time.process_time() - self._cpu)
+        if self._profiler.memory:
+            self._profiler.exit_memory_phase(self._name)
+        return False
+
+
+def get_peak_rss() -> int:
+    # Peak resident set size of this process in bytes, 0 if unknown
+    if resource is None:
+        return 0
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+class Profiler:
+    # Wall and CPU time of each phase, files and bytes analyzed, and the slowest files of the process.
+    # CPU time is of this process; the time of the files analyzed by worker processes is in 'analysis seconds'.
+    # With memory, the peak of the memory allocated by Python(tracemalloc) and the peak RSS during each phase.
+    def __init__(self):
+        self.enabled = False
+        self.timing = False
+        self.memory = False
+        self.top_files = DEFAULT_PROFILE_TOP_FILES
+        self._lock = threading.Lock()
+        self._start = (0.0, 0.0)
+        self._phases = {}
+        self._counts = {}
+        # Heap of (seconds, path, bytes), the slowest files
+        self._slowest_files = []
+        # Peak traced memory of the open phases, outer first
+        self._memory_stack = []
+        self._memory_phases = {}
+        self._memory_peak = 0
+
+    def enable(self, top_files: int = DEFAULT_PROFILE_TOP_FILES, memory: bool = False) -> None:
+        # top_files is 0 to measure only the memory
+        self.enabled = True
+        self.timing = bool(top_files)
+        self.memory = memory
+        self.top_files = top_files
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._start = (time.perf_counter(), time.process_time())
+
+    def _update_memory_stack(self) -> None:
+        # The peak since the last reset belongs to all open phases
+        _, peak = tracemalloc.get_traced_memory()
+        self._memory_peak = max(self._memory_peak, peak)
+        self._memory_stack = [max(phase_peak, peak) for phase_peak in self._memory_stack]
+        tracemalloc.reset_peak()
+
+    def enter_memory_phase(self) -> None:
+        with self._lock:
+            self._update_memory_stack()
+            self._memory_stack.append(tracemalloc.get_traced_memory()[0])
+
+    def exit_memory_phase(self, name: str) -> None:
+        with self._lock:
+            self._update_memory_stack()
+            peak = self._memory_stack.pop() if self._memory_stack else 0
+            phase = self._memory_phases.setdefault(name, [0, 0])
+            phase[0] = max(phase[0], peak)
+            phase[1] = max(phase[1], get_peak_rss())
+
+    def get_memory_result(self) -> dict:
+        with self._lock:
+            if not self.memory:
+                return {}
+            self._update_memory_stack()
+            return {
+                "peak traced MB": round(self._memory_peak / _MB, 1),
+                "peak RSS MB": round(get_peak_rss() / _MB, 1),
+                "phases": {name: {"peak traced MB": round(traced / _MB, 1), "peak RSS MB": round(rss / _MB, 1)}
+                           for name, (traced, rss) in self._memory_phases.items()},
+            }
+
+    def add_phase(self, name: str, wall: float, cpu: float) -> None:
+        with self._lock:
+            phase = self._phases.setdefault(name, [0.0, 0.0, 0])
+            phase[0] += wall
+            phase[1] += cpu
+            phase[2] += 1
+
+    def add_count(self, name: str, value: float) -> None:
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + value
+
+    def add_file(self, path: str, seconds: float) -> None:
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = 0
+        with self._lock:
+            self._counts["analyzed files"] = self._counts.get("analyzed files", 0) + 1
+            self._counts["analyzed bytes"] = self._counts.get("analyzed bytes", 0) + size
+            self._counts["analysis seconds"] = self._counts.get("analysis seconds", 0) + seconds
+            if len(self._slowest_files) < self.top_files:
+                heapq.heappush(self._slowest_files, (seconds, str(path), size))
+            elif self._slowest_files and seconds > self._slowest_files[0][0]:
+                heapq.heapreplace(self._slowest_files, (seconds, str(path), size))
+
+    def get_result(self) -> dict:
+        if not self.timing:
+            return {}
+        with self._lock:
+            result = {
+                "wall seconds": round(time.perf_counter() - self._start[0], 3),
+                "cpu seconds": round(time.process_time() - self._start[1], 3),
+                "phases": {name: {"wall seconds": round(wall, 3), "cpu seconds": round(cpu, 3), "calls": calls}
+                           for name, (wall, cpu, calls) in self._phases.items()},
+            }
+            result.update({name: round(value, 3) if isinstance(value, float) else value
+                           for name, value in self._counts.items()})
+            result["slowest files"] = [{"path": path, "seconds": round(seconds, 4), "bytes": size}
+                                       for seconds, path, size in sorted(self._slowest_files, reverse=True)]
+        return result
+
+    def write_json(self, json_file: str) -> bool:
+        try:
+            Path(os.path.dirname(json_file)).mkdir(parents=True, exist_ok=True)
+            result = self.get_result()
+            if self.memory:
+                result["memory"] = self.get_memory_result()
+            with open(json_file, "w", encoding="utf-8") as f:
+                json.dump(result, f, indent=2, ensure_ascii=False)
+        except Exception as ex:
+            logger.error(f"Error_to_write_profile: {ex}")
+            return False
+        return True
+
+
+profiler = Profiler()
+# Profiler of the run in the current context if not the one of the command line run(ex. Linter)
+_run_profiler: ContextVar[Optional[Profiler]] = ContextVar("run_profiler", default=None)
+
+
+def get_profiler() -> Profiler:
+    return _run_profiler.get() or profiler
+
+
+@contextlib.contextmanager
+def use_profiler(run_profiler: Profiler):
+    # Measure the run in this context with run_profiler
+    token = _run_profiler.set(run_profiler)
+    try:
+        yield run_profiler
+    finally:
+        _run_profiler.reset(token)
+
+
+def profile_phase(name: str):
+    # Context to measure a phase, which does nothing unless --profile or --report-memory is given
+    current = get_profiler()
+    if not current.enabled:
+        return _NOT_PROFILED
+    return _Phase(current, name)
@@ -6,19 +6,21 @@ import os
 import io
 import sys
 import re
+import json
 import yaml
 import fnmatch
 import xml.etree.ElementTree as ET
 import logging
 import fosslight_util.constant as constant
 from pathlib import Path
+from typing import Iterable, Tuple
 from reuse.project import Project
 from fosslight_prechecker._result_html import result_for_html
+from fosslight_prechecker._profile import profile_phase
 from fosslight_util.parsing_yaml import find_sbom_yaml_files, parsing_yml
-from fosslight_util.output_format import check_output_format
 
 
-CUSTOMIZED_FORMAT_FOR_PRECHECKER = {'html': '.html', 'xml': '.xml', 'yaml': '.yaml'}
+CUSTOMIZED_FORMAT_FOR_PRECHECKER = {'html': '.html', 'xml': '.xml', 'yaml': '.yaml', 'ndjson': '.ndjson'}
 RULE_LINK = "https://opensource.lge.com/guide/19"
 MSG_REFERENCE = "Ref. Copyright and License Writing Rules in Source Code. : " + RULE_LINK
 MSG_FOLLOW_LIC_TXT = "Follow the Copyright and License Writing Rules in Source Code. : " + RULE_LINK
@@ -46,6 +48,10 @@ class ResultItem:
         self._fl_prechecker_ver = ""
         self._log_msg = ""
         self._check_only_file_mode = False
+        self._profile = {}
+        # Relative path -> FileRecord of the files without license or copyright
+        self._file_records = {}
+        self._memory = {}
         self.execution_error = []
 
     @property
@@ -84,6 +90,10 @@ class ResultItem:
             result_tool_item["Exclude path"] = self._path_to_exclude
         result_tool_item["Python version"] = self._python_ver
         result_tool_item["fosslight_prechecker version"] = self._fl_prechecker_ver
+        if self._profile:
+            result_tool_item["Profile"] = self._profile
+        if self._memory:
+            result_tool_item["Memory"] = self._memory
         result_item["Tool Info"] = result_tool_item
         if self.execution_error:
             result_item["Execution Error"] = self.execution_error
@@ -181,8 +191,61 @@ def write_result_yaml(result_file: str, exit_code: int, result_item: ResultItem)
     return success, exit_code
 
 
+def write_result_ndjson(result_file: str, exit_code: int, lint_results: Iterable[dict]):
+    success = False
+    try:
+        output_dir = os.path.dirname(result_file)
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        count = 0
+        # Line buffered, so that each record can be read as soon as it is written
+        with open(result_file, 'w', encoding='utf-8', buffering=1) as f:
+            for record in lint_results:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                count += 1
+        logger.info(f"Lint results of {count} files and folders")
+        success = True
+    except Exception as ex:
+        logger.error(f"Error_to_write_ndjson: {ex}")
+        exit_code = EX_IOERR
+    return success, exit_code
+
+
+def check_output_format(output: str = '', format: str = '') -> Tuple[bool, str, str, str, str]:
+    # Same as check_output_format of fosslight_util with CUSTOMIZED_FORMAT_FOR_PRECHECKER.
+    # fosslight_util.output_format is not imported, since it loads the excel and spdx writers(pandas)
+    # which take most of the time to start.
+    msg = ''
+    output_path = ''
+    output_file = ''
+    output_extension = ''
+
+    if format:
+        format = format.lower()
+        if format not in CUSTOMIZED_FORMAT_FOR_PRECHECKER:
+            return False, '(-f option) Enter the supported format: ' + ', '.join(CUSTOMIZED_FORMAT_FOR_PRECHECKER), \
+                output_path, output_file, output_extension
+        output_extension = CUSTOMIZED_FORMAT_FOR_PRECHECKER[format]
+
+    if output == '':
+        return True, msg, output_path, output_file, output_extension
+    basename_file, basename_extension = '', ''
+    if not os.path.isdir(output):
+        output_path = os.path.dirname(output)
+        basename_file, basename_extension = os.path.splitext(os.path.basename(output))
+    if not basename_extension:
+        return True, msg, output, output_file, output_extension
+
+    if format and output_extension != basename_extension:
+        msg = f"(-o & -f option) Enter the same extension of output file(-o:'{output}') with format(-f:'{format}')."
+        return False, msg, output_path, output_file, output_extension
+    if not format and basename_extension not in CUSTOMIZED_FORMAT_FOR_PRECHECKER.values():
+        msg = '(-o option) Enter the supported file extension: ' + ', '.join(CUSTOMIZED_FORMAT_FOR_PRECHECKER.values())
+        return False, msg, output_path, output_file, output_extension
+    return True, msg, output_path, basename_file, basename_extension
+
+
 def create_result_file(output_file_name, format='', _start_time=""):
-    success, msg, output_path, output_file, output_extension = check_output_format(output_file_name, format, CUSTOMIZED_FORMAT_FOR_PRECHECKER)
+    success, msg, output_path, output_file, output_extension = check_output_format(output_file_name, format)
     if success:
         result_file = ""
         if output_path == "":
@@ -199,6 +262,8 @@ def create_result_file(output_file_name, format='', _start_time=""):
                 result_file = f"fosslight_lint_{_start_time}.html"
             elif output_extension == '.xml':
                 result_file = f"fosslight_lint_{_start_time}.xml"
+            elif output_extension == '.ndjson':
+                result_file = f"fosslight_lint_{_start_time}.ndjson"
             else:
                 logger.error("Not supported file extension")
 
@@ -280,13 +345,12 @@ def exclude_file_in_yaml(path_to_find, yaml_files, license_missing_files, copyri
     return license_missing_files, copyright_missing_files, abnormal_yaml_files
 
 
-def get_total_file_list(path_to_find, prj_report, exclude_files, user_exclude_files=[]):
-    if not path_to_find.endswith(f'{os.path.sep}'):
-        path_to_find += f'{os.path.sep}'
-    total_files = [str(file_report.path).replace(path_to_find, '', 1) for file_report in prj_report.file_reports
-                   if not any(os.path.commonpath([os.path.abspath(file_report.path), user_exclude_file]) == user_exclude_file
-                              for user_exclude_file in user_exclude_files)]
-    total_files_excluded = list(set(total_files) - set(exclude_files))
+def get_total_file_list(path_to_find, prj_report, exclude_files, exclude_index=None):
+    # The records are of the unique relative paths, so only the excluded files need a set
+    exclude_files = set(exclude_files)
+    total_files_excluded = [file for file in prj_report.records
+                            if file not in exclude_files
+                            and not (exclude_index and exclude_index.is_excluded(os.path.join(path_to_find, file)))]
     return total_files_excluded
 
 
@@ -311,7 +375,10 @@ def add_reason_to_file_name(oss_pkg_info_files, abnormal_yaml_files, path_to_fin
 
 
 def result_for_summary(path_to_find, oss_pkg_info_files, license_missing_files, copyright_missing_files, prj_report,
-                       _result_log, _check_only_file_mode, file_to_check_list, error_items, exclude_files, user_exclude_files):
+                       _result_log, _check_only_file_mode, file_to_check_list, error_items, exclude_files, exclude_index, scope="",
+                       sbom_path=""):
+    # sbom_path is the folder to find the sbom yaml files in, if not path_to_find
+    sbom_path = sbom_path or path_to_find
     prechecker_compliant = False
     detected_lic = []
     missing_both_files = []
@@ -321,25 +388,30 @@ def result_for_summary(path_to_find, oss_pkg_info_files, license_missing_files,
     if _check_only_file_mode:
         file_total_num = len(file_to_check_list)
     else:
-        file_total_num = len(get_total_file_list(path_to_find, prj_report, exclude_files, user_exclude_files))
+        file_total_num = len(get_total_file_list(path_to_find, prj_report, exclude_files, exclude_index)) + prj_report.reused_file_count
 
         # Get detected License
         for i, lic in enumerate(sorted(prj_report.used_licenses)):
             if lic != '-':
                 detected_lic.append(lic)
 
+    if scope:
+        # Only a part of the files are analyzed or the files are not of the working tree, so the total is not of the path
+        file_total_num = f"{file_total_num} ({scope})"
+
     if oss_pkg_info_files:
-        oss_yaml_files = find_sbom_yaml_files(path_to_find)
-        # Exclude files in yaml
-        license_missing_files, copyright_missing_files, abnormal_yaml_files \
-            = exclude_file_in_yaml(path_to_find, oss_yaml_files,
-                                   set(license_missing_files) - set(oss_pkg_info_files),
-                                   set(copyright_missing_files) - set(oss_pkg_info_files))
+        with profile_phase("sbom yaml matching"):
+            oss_yaml_files = find_sbom_yaml_files(sbom_path)
+            # Exclude files in yaml
+            license_missing_files, copyright_missing_files, abnormal_yaml_files \
+                = exclude_file_in_yaml(sbom_path, oss_yaml_files,
+                                       set(license_missing_files) - set(oss_pkg_info_files),
+                                       set(copyright_missing_files) - set(oss_pkg_info_files))
         # Subtract excluded files(untracked or ignored file)
         oss_pkg_info_files = list(set(oss_pkg_info_files) - set(exclude_files))
 
     # Add invalid format to file name
-    oss_pkg_info_files = add_reason_to_file_name(oss_pkg_info_files, abnormal_yaml_files, path_to_find)
+    oss_pkg_info_files = add_reason_to_file_name(oss_pkg_info_files, abnormal_yaml_files, sbom_path)
 
     if len(license_missing_files) == 0 and len(copyright_missing_files) == 0:
         prechecker_compliant = True
@@ -368,10 +440,13 @@ def result_for_summary(path_to_find, oss_pkg_info_files, license_missing_files,
     result_item._python_ver = _result_log["Python version"]
     result_item._check_only_file_mode = _check_only_file_mode
     result_item.execution_error = error_items
+    # For the html report, which shows the license or the copyright of the files missing the other
+    result_item._file_records = {file: prj_report.records[file]
+                                 for file in license_missing_files + copyright_missing_files if file in prj_report.records}
     return result_item
 
 
-def write_result_file(result_file, output_extension, exit_code, result_item, _result_log, project, path_to_find):
+def write_result_file(result_file, output_extension, exit_code, result_item, _result_log, project, path_to_find, print_result=True):
     success = False
     if output_extension == ".yaml" or output_extension == "":
         success, exit_code = write_result_yaml(result_file, exit_code, result_item)
@@ -382,7 +457,7 @@ def write_result_file(result_file, output_extension, exit_code, result_item, _re
     else:
         logger.info("Not supported file extension")
 
-    if success:
+    if success and print_result:
         # Print yaml result
         yaml_result = result_item.get_print_yaml()
         str_yaml_result = yaml.safe_dump(yaml_result, allow_unicode=True, sort_keys=False)
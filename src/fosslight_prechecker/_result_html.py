@@ -7,7 +7,7 @@ from reuse import report
 from reuse.project import Project
 from fosslight_prechecker._constant import HTML_FORMAT_PREFIX, HTML_CELL_PREFIX, HTML_FORMAT_SUFFIX, HTML_EXPAND_PREFIX, \
                                            HTML_COMPLIANCE_SUFFIX, HTML_RESULT_PRINT_LIMIT, HTML_RESULT_EXPAND_LIMIT, HTML_CELL_HEAD_ROW
-from typing import Any
+from typing import Any, List, Tuple
 
 
 def check_length_of_print_list(input_list: list, list_len: int) -> str:
@@ -63,6 +63,20 @@ def get_file_report(
     return file_rep
 
 
+def get_licenses_and_copyright(
+    result_item: Any,
+    project: Project,
+    path_to_find: str,
+    file: str
+) -> Tuple[List[str], str]:
+    # From the record of the lint, or from the file if there is no record(ex, checking only files)
+    record = result_item._file_records.get(file)
+    if record:
+        return list(record.licenses), record.copyright
+    file_rep = get_file_report(project, path_to_find, file)
+    return file_rep.spdxfile.licenses_in_file, file_rep.spdxfile.copyright
+
+
 def get_html_cell(
     result_item: Any,
     project: Project,
@@ -77,8 +91,8 @@ def get_html_cell(
                     </tr>"""
 
     for file in result_item._files_without_lic:
-        file_rep = get_file_report(project, path_to_find, file)
-        cop_text = file_rep.spdxfile.copyright.replace("SPDX-FileCopyrightText: ", "")
+        _, copyright = get_licenses_and_copyright(result_item, project, path_to_find, file)
+        cop_text = copyright.replace("SPDX-FileCopyrightText: ", "")
         cell_str += f"""<tr>
                         <td style="padding:5px;">{file}</td>
                         <td style="padding:5px;"></td>
@@ -86,8 +100,8 @@ def get_html_cell(
                     </tr>"""
 
     for file in result_item._files_without_cop:
-        file_rep = get_file_report(project, path_to_find, file)
-        lic_in_file = ', '.join(file_rep.spdxfile.licenses_in_file)
+        licenses, _ = get_licenses_and_copyright(result_item, project, path_to_find, file)
+        lic_in_file = ', '.join(licenses)
         cell_str += f"""<tr>
                         <td style="padding:5px;">{file}</td>
                         <td style="padding:5px;">{lic_in_file}</td>
@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+import os
+import sys
+import json
+import stat
+import signal
+import logging
+import platform
+import socketserver
+import fosslight_util.constant as constant
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit
+from fosslight_util.set_log import init_log
+from reuse.project import Project
+from fosslight_prechecker._constant import PKG_NAME, DEFAULT_PORT
+from fosslight_prechecker._cache import LintCache
+from fosslight_prechecker._analysis import get_scan_options, DEFAULT_SCAN_BYTES
+from fosslight_prechecker._exclude import get_exclude_index
+from fosslight_prechecker._precheck import LintState, iter_lint_results, get_changed_files, reset_global_state, error_items
+from fosslight_prechecker._add import add_missing_content, get_spdx_license_list
+from fosslight_prechecker._watch import get_config_signature, get_git_index_signature
+
+_LOCAL_HOSTS = ["127.0.0.1", "localhost"]
+
+logger = logging.getLogger(constant.LOGGER_NAME)
+
+
+class LintServer:
+    # Answers lint and add requests, keeping Project objects and the per-file results warm between requests.
+    def __init__(
+        self,
+        cache: LintCache,
+        jobs: int = 0,
+        scan_bytes: int = DEFAULT_SCAN_BYTES,
+        full_scan: bool = False,
+        allow_add: bool = False
+    ):
+        self.cache = cache
+        self.jobs = jobs
+        self.scan_bytes = scan_bytes
+        self.full_scan = full_scan
+        # 'add' requests modify the files, so they are answered only if allowed by the user
+        self.allow_add = allow_add
+        # Absolute path -> (signature, Project)
+        self._projects = {}
+
+    def get_project(self, path: str) -> Project:
+        # The Project is created again if the license files or the ignored files are changed
+        signature = (get_config_signature(path), get_git_index_signature(path))
+        signature_and_project = self._projects.get(path)
+        if signature_and_project and signature_and_project[0] == signature:
+            return signature_and_project[1]
+        project = Project(path)
+        self._projects[path] = (signature, project)
+        return project
+
+    @staticmethod
+    def _get_str(request: dict, key: str) -> str:
+        value = request.get(key, "")
+        if not isinstance(value, str):
+            raise ValueError(f"'{key}' has to be a string")
+        return value
+
+    @staticmethod
+    def _get_str_list(request: dict, key: str) -> Optional[List[str]]:
+        value = request.get(key)
+        if value is not None and not (isinstance(value, list) and all(isinstance(item, str) for item in value)):
+            raise ValueError(f"'{key}' has to be a list of strings")
+        return value
+
+    def _get_path_and_files(self, request: dict) -> Tuple[str, Optional[List[str]]]:
+        path = self._get_str(request, "path")
+        if not path or not os.path.isdir(path):
+            raise ValueError(f"Check the path to find : {path}")
+        # Relative to 'path'
+        files = self._get_str_list(request, "files")
+        return os.path.abspath(path), files
+
+    def lint(self, request: dict, state: LintState) -> dict:
+        path, files = self._get_path_and_files(request)
+        exclude_path = self._get_str_list(request, "exclude_path") or []
+        disable = request.get("disable", False)
+        if not isinstance(disable, bool):
+            raise ValueError("'disable' has to be true or false")
+        since = self._get_str(request, "since")
+        if since:
+            if files is not None:
+                raise ValueError("'since' can't be used with 'files'")
+            files = get_changed_files(path, since, state)
+        results = list(iter_lint_results(path, exclude_path, disable, files,
+                                         self.cache, self.jobs, self.scan_bytes, self.full_scan, self.get_project(path)))
+        analyzed = [result for result in results if not result["excluded"] and not result.get("oss_pkg_info")]
+        return {"results": results,
+                "files_without_license": sorted(result["path"] for result in analyzed
+                                                if not result["licenses"] and "license" not in result.get("sbom_info", [])),
+                "files_without_copyright": sorted(result["path"] for result in analyzed
+                                                  if not result["copyright"] and "copyright" not in result.get("sbom_info", []))}
+
+    def add(self, request: dict, state: LintState) -> dict:
+        path, files = self._get_path_and_files(request)
+        exclude_path = self._get_str_list(request, "exclude_path") or []
+        license = self._get_str(request, "license")
+        copyright = self._get_str(request, "copyright")
+        dl_url = self._get_str(request, "dl_url")
+        if not (license or copyright or dl_url):
+            # Not to ask the inputs on the console of the server
+            raise ValueError("One of 'license', 'copyright' and 'dl_url' is required")
+
+        if files:
+            # Files of 'add' mode are relative to the current directory
+            files = [os.path.join(path, file) for file in files]
+        # 'add' mode keeps its errors in the state of the command line run
+        reset_global_state()
+        # The cache is shared only if it has the results of the same scan options as 'add' mode
+        cache = self.cache if get_scan_options(self.scan_bytes, self.full_scan) == get_scan_options() else None
+        try:
+            add_missing_content(path, files or [], bool(files), get_exclude_index(exclude_path, path),
+                                license, copyright, dl_url, cache, self.jobs)
+        finally:
+            state.error_items.extend(error_items)
+        return {"errors": list(state.error_items)}
+
+    def status(self) -> dict:
+        return {"status": "ok", "projects": sorted(self._projects), "cached files": self.cache.entry_count}
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server_version = PKG_NAME
+
+    def _respond(self, code: int, body: dict) -> None:
+        content = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self) -> None:
+        if self.path == "/status":
+            self._respond(200, self.server.lint_server.status())
+        else:
+            self._respond(404, {"error": f"Not supported: {self.path}"})
+
+    @staticmethod
+    def _is_local(url: str) -> bool:
+        try:
+            return urlsplit(url).hostname in _LOCAL_HOSTS
+        except ValueError:
+            return False
+
+    def _check_request(self) -> Optional[Tuple[int, str]]:
+        # Web pages can send requests to localhost, even with the name of their own site resolved to 127.0.0.1
+        # (DNS rebinding), so the requests of other sites and the ones a page can send without CORS are refused.
+        if not isinstance(self.server, _UnixHTTPServer) and not self._is_local(f"//{self.headers.get('Host', '')}"):
+            return 403, "Host has to be 127.0.0.1 or localhost"
+        origin = self.headers.get("Origin")
+        if origin is not None and not self._is_local(origin):
+            return 403, f"Requests from other origins are not allowed: {origin}"
+        if self.headers.get_content_type() != "application/json":
+            return 415, "Content-Type has to be application/json"
+        if self.path == "/add" and not self.server.lint_server.allow_add:
+            return 403, "'add' requests are not allowed, run 'serve' with --allow-add to modify files"
+        return None
+
+    def do_POST(self) -> None:
+        lint_server = self.server.lint_server
+        handlers = {"/lint": lint_server.lint, "/add": lint_server.add}
+        if self.path not in handlers:
+            self._respond(404, {"error": f"Not supported: {self.path}"})
+            return
+        refused = self._check_request()
+        if refused:
+            self._respond(refused[0], {"error": refused[1]})
+            return
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        except ValueError as ex:
+            self._respond(400, {"error": f"Invalid json: {ex}"})
+            return
+        if not isinstance(request, dict):
+            self._respond(400, {"error": "The request has to be a json object"})
+            return
+
+        # Errors of this request only
+        state = LintState()
+        try:
+            self._respond(200, handlers[self.path](request, state))
+        except SystemExit:
+            # Errors which would end the process in the command line mode
+            self._respond(500, {"error": "; ".join(state.error_items) or f"Failed to handle {self.path}"})
+        except ValueError as ex:
+            self._respond(400, {"error": str(ex)})
+        except Exception as ex:
+            logger.debug(f"Failed to handle {self.path}: {ex}")
+            self._respond(500, {"error": str(ex)})
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"{self.command} {self.path}: " + (format % args))
+
+
+class _UnixHTTPServer(socketserver.UnixStreamServer):
+    def get_request(self):
+        request, _ = super().get_request()
+        # BaseHTTPRequestHandler expects a (host, port) address
+        return request, ("local", 0)
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    try:
+        if stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            os.remove(socket_path)
+    except FileNotFoundError:
+        pass
+
+
+def run_serve(
+    port: int = DEFAULT_PORT,
+    socket_path: str = "",
+    cache_dir: str = "",
+    jobs: int = 0,
+    scan_bytes: int = DEFAULT_SCAN_BYTES,
+    full_scan: bool = False,
+    need_log_file: bool = True,
+    allow_add: bool = False
+) -> None:
+    global logger
+
+    start_time = datetime.now().strftime('%y%m%d_%H%M')
+    logger, _ = init_log(os.path.join(os.getcwd(), f"fosslight_log_pre_{start_time}.txt"),
+                         need_log_file, logging.INFO, logging.DEBUG, PKG_NAME)
+
+    get_spdx_license_list()
+    cache = LintCache(cache_dir, options=get_scan_options(scan_bytes, full_scan))
+    if cache_dir:
+        cache.load()
+
+    try:
+        if socket_path:
+            if platform.system() == "Windows":
+                logger.error("(--socket option) Unix socket is not supported on Windows")
+                sys.exit(1)
+            _remove_stale_socket(socket_path)
+            server = _UnixHTTPServer(socket_path, _RequestHandler)
+            address = socket_path
+        else:
+            # Only for the local clients
+            server = HTTPServer(("127.0.0.1", port), _RequestHandler)
+            address = f"http://127.0.0.1:{server.server_address[1]}"
+    except OSError as ex:
+        logger.error(f"Failed to listen : {ex}")
+        sys.exit(1)
+
+    server.lint_server = LintServer(cache, jobs, scan_bytes, full_scan, allow_add)
+    # Stop in the same way on SIGTERM, to save the cache
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    logger.warning(f"Serving on {address} (POST /lint, {'POST /add, ' if allow_add else ''}GET /status)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.warning("Stopped")
+    finally:
+        server.server_close()
+        if socket_path:
+            _remove_stale_socket(socket_path)
+        if cache_dir:
+            cache.save()
@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+import os
+import re
+import logging
+import fosslight_util.constant as constant
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+from reuse import _IGNORE_DIR_PATTERNS, _IGNORE_FILE_PATTERNS, _IGNORE_MESON_PARENT_DIR_PATTERNS
+from reuse.project import Project
+from reuse.vcs import VCSStrategyGit
+from fosslight_prechecker._constant import DEFAULT_EXCLUDE_EXTENSION, OSS_PKG_INFO_FILES
+from fosslight_prechecker._exclude import PathExcludeIndex, is_default_exclude_dir
+from fosslight_prechecker._cache import LintCache
+from fosslight_prechecker._git import GitFileStatus
+from fosslight_prechecker._binary import is_binary_file
+
+OSS_PKG_INFO_PATTERN = re.compile("|".join(f"(?:{pattern})" for pattern in OSS_PKG_INFO_FILES) + "|^module_license_")
+
+EXCLUDED_BY_GIT = "untracked or ignored by git"
+EXCLUDED_HIDDEN_FILE = "hidden file"
+EXCLUDED_HIDDEN_FOLDER = "in hidden folder"
+EXCLUDED_BINARY = "binary file"
+EXCLUDED_EXTENSION = "excluded extension"
+EXCLUDED_FOLDER = "excluded folder"
+
+logger = logging.getLogger(constant.LOGGER_NAME)
+
+
+class FileInventory:
+    def __init__(self, path: str):
+        self.path = path
+        self.oss_pkg_info = []
+        self.exclude_files = []
+        # Relative path -> the first reason why the file is excluded
+        self.exclude_reasons = {}
+        # Folders excluded as a whole, whose files are not listed
+        self.exclude_dirs = []
+        # Relative paths of the files that reuse would analyze
+        self.files_to_analyze = []
+
+    def exclude(self, rel_path: str, reason: str) -> None:
+        self.exclude_files.append(rel_path)
+        self.exclude_reasons.setdefault(rel_path, reason)
+
+
+def _is_dir_visible_to_reuse(project: Project, entry: os.DirEntry, rel_path: str, parent_name: str) -> bool:
+    if any(pattern.match(entry.name) for pattern in _IGNORE_DIR_PATTERNS):
+        return False
+    if not project.include_meson_subprojects and \
+       any(pattern.match(parent_name) for pattern in _IGNORE_MESON_PARENT_DIR_PATTERNS):
+        return False
+    if project.vcs_strategy.is_ignored(project.root / rel_path):
+        return False
+    if entry.is_symlink():
+        return False
+    if not project.include_submodules and os.path.isfile(os.path.join(entry.path, ".git")):
+        logger.debug(f"ignoring '{rel_path}' because it is a submodule")
+        return False
+    return True
+
+
+def _is_file_visible_to_reuse(project: Project, entry: os.DirEntry, rel_path: str) -> bool:
+    if any(pattern.match(entry.name) for pattern in _IGNORE_FILE_PATTERNS):
+        return False
+    if project.vcs_strategy.is_ignored(project.root / rel_path):
+        return False
+    if entry.is_symlink():
+        return False
+    try:
+        if entry.stat().st_size == 0:
+            return False
+    except OSError:
+        pass
+    return True
+
+
+def _classify_file(
+    inventory: FileInventory,
+    file_name: str,
+    file_path: str,
+    rel_path: str,
+    turn_on_exclude_config: bool,
+    cache: Optional[LintCache],
+    stat: Optional[os.stat_result] = None,
+    git_status: Optional[GitFileStatus] = None
+) -> None:
+    excluded_by_git = git_status is not None and git_status.is_excluded(rel_path)
+    if not _classify_file_by_name(inventory, file_name, rel_path, turn_on_exclude_config, excluded_by_git) \
+       and is_binary_file(file_path, stat, cache):
+        inventory.exclude(rel_path, EXCLUDED_BINARY)
+
+
+def _classify_file_by_name(
+    inventory: FileInventory,
+    file_name: str,
+    rel_path: str,
+    turn_on_exclude_config: bool,
+    excluded_by_git: bool = False
+) -> bool:
+    # Return True if the file is classified without reading it, otherwise it is excluded only if binary
+    file_lower_case = file_name.lower()
+    if OSS_PKG_INFO_PATTERN.search(file_lower_case):
+        inventory.oss_pkg_info.append(rel_path)
+        if excluded_by_git:
+            inventory.exclude(rel_path, EXCLUDED_BY_GIT)
+    # Exclude untracked or ignored files
+    elif excluded_by_git:
+        inventory.exclude(rel_path, EXCLUDED_BY_GIT)
+    # Exclude hidden files
+    elif turn_on_exclude_config and file_name.startswith('.'):
+        inventory.exclude(rel_path, EXCLUDED_HIDDEN_FILE)
+    elif file_lower_case.split(".")[-1] in DEFAULT_EXCLUDE_EXTENSION:
+        inventory.exclude(rel_path, EXCLUDED_EXTENSION)
+    else:
+        return False
+    return True
+
+
+def _classify_file_in_hidden_dir(inventory: FileInventory, file_name: str, rel_path: str) -> None:
+    # Files of a hidden folder are excluded by the folder, so they are not read
+    if OSS_PKG_INFO_PATTERN.search(file_name.lower()):
+        inventory.oss_pkg_info.append(rel_path)
+    inventory.exclude(rel_path, EXCLUDED_HIDDEN_FOLDER)
+
+
+def walk_path(
+    path: str,
+    exclude_index: PathExcludeIndex,
+    project: Project,
+    turn_on_exclude_config: bool = True,
+    cache: Optional[LintCache] = None,
+    git_status: Optional[GitFileStatus] = None,
+    skip_dirs: Optional[Set[str]] = None
+) -> FileInventory:
+    # Walk the tree once with os.scandir and collect everything the lint needs:
+    # OSS package info files, files to exclude and the files reuse has to analyze.
+    # skip_dirs are the folders(relative path, "" for the path) whose results are taken from elsewhere(DirIndex).
+    inventory = FileInventory(path)
+    skip_dirs = skip_dirs or set()
+    if exclude_index.is_excluded(path) or "" in skip_dirs:
+        return inventory
+
+    # (directory to scan, relative path, visible to reuse, node in the exclude index, hidden)
+    dirs_to_walk = [(path, "", True, exclude_index.node_of(path), False)]
+    while dirs_to_walk:
+        dir_path, dir_rel_path, dir_visible, exclude_node, dir_hidden = dirs_to_walk.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError as ex:
+            logger.debug(f"Can't scan {dir_path}: {ex}")
+            continue
+
+        parent_name = os.path.basename(dir_rel_path) if dir_rel_path else project.root.name
+        sub_dirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            rel_path = os.path.join(dir_rel_path, entry.name) if dir_rel_path else entry.name
+            excluded, child_node = exclude_index.match_child(exclude_node, entry.name)
+
+            if is_dir:
+                if excluded:
+                    # Excluded directories are not descended into
+                    continue
+                if turn_on_exclude_config and is_default_exclude_dir(entry.name, not dir_rel_path):
+                    inventory.exclude_dirs.append(rel_path)
+                    continue
+                if rel_path in skip_dirs:
+                    continue
+                if not entry.is_symlink():
+                    visible = dir_visible and _is_dir_visible_to_reuse(project, entry, rel_path, parent_name)
+                    # For hidden folders, the files are classified once when the folder is scanned
+                    sub_dirs.append((entry.path, rel_path, visible, child_node, entry.name.startswith(".")))
+                continue
+
+            if excluded:
+                continue
+
+            if dir_visible and _is_file_visible_to_reuse(project, entry, rel_path):
+                inventory.files_to_analyze.append(rel_path)
+
+            if dir_hidden:
+                _classify_file_in_hidden_dir(inventory, entry.name, rel_path)
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                stat = None
+            _classify_file(inventory, entry.name, entry.path, rel_path, turn_on_exclude_config, cache, stat, git_status)
+
+        # Keep the top-down order of os.walk
+        dirs_to_walk.extend(reversed(sub_dirs))
+
+    return inventory
+
+
+def _is_visible_to_reuse(project: Project, rel_path: str) -> bool:
+    # Same rules as _is_dir_visible_to_reuse and _is_file_visible_to_reuse, for a single file
+    file_path = project.root / rel_path
+    if file_path.is_symlink() or project._is_path_ignored(file_path):
+        return False
+    for parent in list(Path(rel_path).parents)[:-1]:
+        dir_path = project.root / parent
+        if dir_path.is_symlink() or project._is_path_ignored(dir_path):
+            return False
+        if not project.include_submodules and (dir_path / ".git").is_file():
+            return False
+    try:
+        if file_path.stat().st_size == 0:
+            return False
+    except OSError:
+        pass
+    return True
+
+
+def get_ignored_paths(project: Project) -> Optional[List[str]]:
+    # Paths ignored by git as reuse sees them, a folder for all the files in it.
+    # reuse has no public API for them, so it reads the private set of VCSStrategyGit only here.
+    # Return None if the set is not there(another version of reuse).
+    if not isinstance(project.vcs_strategy, VCSStrategyGit):
+        return []
+    ignored_paths = getattr(project.vcs_strategy, "_all_ignored_files", None)
+    if not isinstance(ignored_paths, (set, frozenset, list)):
+        logger.warning("Can't get the files ignored by git from reuse, the results of the previous run are not used")
+        return None
+    return [str(ignored_path) for ignored_path in ignored_paths if str(ignored_path) != "."]
+
+
+def is_ignored_by_name(rel_path: str) -> bool:
+    # The name rules of reuse only(LICENSES/, .reuse/, *.license, ...), for a path not in the working tree
+    parts = Path(rel_path).parts
+    if any(pattern.match(parts[-1]) for pattern in _IGNORE_FILE_PATTERNS):
+        return True
+    return any(pattern.match(part) for part in parts[:-1] for pattern in _IGNORE_DIR_PATTERNS)
+
+
+def collect_files(
+    path: str,
+    files: List[str],
+    exclude_index: PathExcludeIndex,
+    project: Project,
+    turn_on_exclude_config: bool = True,
+    cache: Optional[LintCache] = None,
+    git_status: Optional[GitFileStatus] = None
+) -> FileInventory:
+    # Same as walk_path, but only for the given files(relative to path) without walking the tree
+    inventory = FileInventory(path)
+    for rel_path in dict.fromkeys(os.path.normpath(file) for file in files):
+        file_path = os.path.join(path, rel_path)
+        if not os.path.isfile(file_path) or exclude_index.is_excluded(file_path):
+            continue
+        if turn_on_exclude_config:
+            dir_parts = Path(rel_path).parent.parts
+            excluded_dir = next((i for i, name in enumerate(dir_parts) if is_default_exclude_dir(name, i == 0)), None)
+            if excluded_dir is not None:
+                inventory.exclude_dirs.append(os.path.join(*dir_parts[:excluded_dir + 1]))
+                continue
+        if _is_visible_to_reuse(project, rel_path):
+            inventory.files_to_analyze.append(rel_path)
+        if os.path.basename(os.path.dirname(rel_path)).startswith("."):
+            # For hidden folders
+            _classify_file_in_hidden_dir(inventory, os.path.basename(rel_path), rel_path)
+            continue
+        _classify_file(inventory, os.path.basename(rel_path), file_path, rel_path, turn_on_exclude_config, cache,
+                       git_status=git_status)
+    return inventory
+
+
+def collect_tree_files(
+    path: str,
+    files: List[str],
+    exclude_index: PathExcludeIndex,
+    turn_on_exclude_config: bool = True
+) -> Tuple[FileInventory, List[str]]:
+    # Same as collect_files, for the files of a git tree which are not in the working tree(relative to path).
+    # Return the inventory and the files to tell binary or not from their contents.
+    inventory = FileInventory(path)
+    files_to_read = []
+    for rel_path in files:
+        if exclude_index.is_excluded(os.path.join(path, rel_path)):
+            continue
+        dir_parts = Path(rel_path).parent.parts
+        if turn_on_exclude_config:
+            excluded_dir = next((i for i, name in enumerate(dir_parts) if is_default_exclude_dir(name, i == 0)), None)
+            if excluded_dir is not None:
+                inventory.exclude_dirs.append(os.path.join(*dir_parts[:excluded_dir + 1]))
+                continue
+        if not is_ignored_by_name(rel_path):
+            inventory.files_to_analyze.append(rel_path)
+        if dir_parts and dir_parts[-1].startswith("."):
+            # For hidden folders
+            _classify_file_in_hidden_dir(inventory, os.path.basename(rel_path), rel_path)
+        elif not _classify_file_by_name(inventory, os.path.basename(rel_path), rel_path, turn_on_exclude_config):
+            files_to_read.append(rel_path)
+    return inventory, files_to_read
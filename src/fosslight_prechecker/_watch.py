@@ -0,0 +1,379 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+import os
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+import logging
+import platform
+import shutil
+import fosslight_util.constant as constant
+from typing import Callable, Dict, Iterator, List, Optional, Set
+from reuse.project import Project
+from fosslight_prechecker._exclude import PathExcludeIndex, FileExcludeSet, is_default_exclude_dir
+from fosslight_prechecker._cache import LintCache
+from fosslight_prechecker._git import GitFileStatus, get_git_file_status
+from fosslight_prechecker._walker import FileInventory, walk_path, collect_files
+from fosslight_prechecker._analysis import generate_project_report, FileRecord, LintReport, DEFAULT_SCAN_BYTES
+
+WATCH_INTERVAL = 1.0  # seconds
+# To handle the several writes of an editor at once
+_DEBOUNCE_DELAY = 0.2
+# Files read when a Project is created. The Project is created again if one of them is changed.
+_PROJECT_SIGNATURE_FILES = [".gitignore", os.path.join(".reuse", "dep5"), "LICENSES"]
+
+# From <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | \
+    _IN_MOVE_SELF | _IN_ONLYDIR
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+logger = logging.getLogger(constant.LOGGER_NAME)
+
+
+def _get_mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _get_git_dir(path: str) -> str:
+    parent = path
+    while True:
+        git_dir = os.path.join(parent, ".git")
+        if os.path.isdir(git_dir):
+            return git_dir
+        if os.path.exists(git_dir) or os.path.dirname(parent) == parent:
+            # Worktree or submodule(.git file), or not in a git repository
+            return ""
+        parent = os.path.dirname(parent)
+
+
+def get_config_signature(path: str) -> tuple:
+    # Changed if the license files or the settings of reuse are changed
+    signature = [_get_mtime(os.path.join(path, file)) for file in _PROJECT_SIGNATURE_FILES]
+    git_dir = _get_git_dir(path)
+    if git_dir:
+        signature.append(_get_mtime(os.path.join(git_dir, "info", "exclude")))
+    return tuple(signature)
+
+
+def get_git_index_signature(path: str) -> Optional[int]:
+    # Changed if files are added to or removed from the git index
+    git_dir = _get_git_dir(path)
+    return _get_mtime(os.path.join(git_dir, "index")) if git_dir else None
+
+
+class PollingWatcher:
+    # Finds the changed files by comparing the stat of all files with the previous one.
+    def __init__(self, path: str, is_dir_watched: Callable[[str, str], bool]):
+        self.path = path
+        self._is_dir_watched = is_dir_watched
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self) -> Dict[str, tuple]:
+        snapshot = {}
+        dirs_to_scan = [""]
+        while dirs_to_scan:
+            dir_rel_path = dirs_to_scan.pop()
+            try:
+                with os.scandir(os.path.join(self.path, dir_rel_path)) as it:
+                    for entry in it:
+                        rel_path = os.path.join(dir_rel_path, entry.name) if dir_rel_path else entry.name
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if self._is_dir_watched(entry.name, rel_path):
+                                    dirs_to_scan.append(rel_path)
+                                continue
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        snapshot[rel_path] = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+            except OSError:
+                continue
+        return snapshot
+
+    def read_changes(self, timeout: float = WATCH_INTERVAL) -> Optional[Set[str]]:
+        time.sleep(timeout)
+        snapshot = self._take_snapshot()
+        changes = {rel_path for rel_path, stat in snapshot.items() if self._snapshot.get(rel_path) != stat}
+        changes.update(set(self._snapshot) - set(snapshot))
+        self._snapshot = snapshot
+        return changes
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    # Gets the changed files from the kernel, with a watch on each directory.
+    def __init__(self, path: str, is_dir_watched: Callable[[str, str], bool]):
+        self.path = path
+        self._is_dir_watched = is_dir_watched
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        # Watch descriptor -> relative path of the directory
+        self._dirs = {}
+        try:
+            self._add_tree("")
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, dir_rel_path: str) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(os.path.join(self.path, dir_rel_path)), _WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error == errno.ENOSPC:
+                raise OSError(error, "Reached the limit of inotify watches(fs.inotify.max_user_watches)")
+            # Removed in the meantime or not readable
+            return
+        self._dirs[wd] = dir_rel_path
+
+    def _add_tree(self, dir_rel_path: str) -> None:
+        dirs_to_watch = [dir_rel_path]
+        while dirs_to_watch:
+            dir_rel_path = dirs_to_watch.pop()
+            self._add_watch(dir_rel_path)
+            try:
+                with os.scandir(os.path.join(self.path, dir_rel_path)) as it:
+                    for entry in it:
+                        rel_path = os.path.join(dir_rel_path, entry.name) if dir_rel_path else entry.name
+                        if entry.is_dir(follow_symlinks=False) and self._is_dir_watched(entry.name, rel_path):
+                            dirs_to_watch.append(rel_path)
+            except OSError:
+                continue
+
+    def _remove_tree(self, dir_rel_path: str) -> None:
+        prefix = dir_rel_path + os.sep
+        for wd, rel_path in list(self._dirs.items()):
+            if rel_path == dir_rel_path or rel_path.startswith(prefix):
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._dirs[wd]
+
+    def _read_events(self) -> Iterator[tuple]:
+        while True:
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                return
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+                offset += _INOTIFY_EVENT.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                offset += length
+                yield wd, mask, name
+
+    def read_changes(self, timeout: float = WATCH_INTERVAL) -> Optional[Set[str]]:
+        # Relative paths of the changed files and directories, or None if some events are lost
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        time.sleep(_DEBOUNCE_DELAY)
+
+        changes = set()
+        for wd, mask, name in self._read_events():
+            if mask & _IN_Q_OVERFLOW:
+                return None
+            dir_rel_path = self._dirs.get(wd)
+            if dir_rel_path is None:
+                continue
+            if mask & _IN_IGNORED:
+                del self._dirs[wd]
+                continue
+            if not name:
+                # The watched directory itself is removed or moved
+                changes.add(dir_rel_path)
+                continue
+            rel_path = os.path.join(dir_rel_path, name) if dir_rel_path else name
+            if mask & _IN_ISDIR:
+                if not self._is_dir_watched(name, rel_path):
+                    continue
+                if mask & (_IN_MOVED_FROM | _IN_DELETE):
+                    self._remove_tree(rel_path)
+                elif mask & (_IN_CREATE | _IN_MOVED_TO):
+                    self._add_tree(rel_path)
+            changes.add(rel_path)
+        return changes
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(path: str, is_dir_watched: Callable[[str, str], bool]):
+    if platform.system() == "Linux":
+        try:
+            return InotifyWatcher(path, is_dir_watched)
+        except (OSError, AttributeError) as ex:
+            logger.warning(f"Can't use inotify, check the files periodically instead: {ex}")
+    return PollingWatcher(path, is_dir_watched)
+
+
+class WatchedProject:
+    # Keeps the result of each file of the path, so that only the changed files are analyzed again.
+    def __init__(
+        self,
+        path: str,
+        exclude_index: PathExcludeIndex,
+        turn_on_exclude_config: bool = True,
+        cache: Optional[LintCache] = None,
+        jobs: int = 0,
+        scan_bytes: int = DEFAULT_SCAN_BYTES,
+        full_scan: bool = False
+    ):
+        self.path = path
+        self.exclude_index = exclude_index
+        self.turn_on_exclude_config = turn_on_exclude_config
+        self.cache = cache
+        self.jobs = jobs
+        self.scan_bytes = scan_bytes
+        self.full_scan = full_scan
+        self.project = None
+        self._git_status = None
+        self._config_signature = None
+        self._git_index_signature = None
+        # Relative path -> None, a set keeping the order of the walk
+        self.oss_pkg_info = {}
+        self.exclude_dirs = set()
+        # Relative path -> reason why the file is excluded
+        self.exclude_reasons = {}
+        # Relative path -> FileRecord of the analyzed file
+        self.file_records: Dict[str, FileRecord] = {}
+        self.read_errors = set()
+
+    def is_dir_watched(self, name: str, rel_path: str) -> bool:
+        if self.exclude_index.is_excluded(os.path.join(self.path, rel_path)):
+            return False
+        if self.turn_on_exclude_config and is_default_exclude_dir(name, os.sep not in rel_path):
+            return False
+        return True
+
+    def _get_git_status(self) -> Optional[GitFileStatus]:
+        if self.turn_on_exclude_config and shutil.which("git"):
+            return get_git_file_status(self.path)
+        return None
+
+    def scan(self) -> None:
+        # Analyze the whole path
+        self._config_signature = get_config_signature(self.path)
+        self._git_index_signature = get_git_index_signature(self.path)
+        self.project = Project(self.path)
+        self._git_status = self._get_git_status()
+        self.oss_pkg_info.clear()
+        self.exclude_dirs.clear()
+        self.exclude_reasons.clear()
+        self.file_records.clear()
+        self.read_errors.clear()
+
+        inventory = walk_path(self.path, self.exclude_index, self.project, self.turn_on_exclude_config, self.cache,
+                              self._git_status)
+        self._merge(inventory)
+
+    def refresh(self, changes: Optional[Set[str]]) -> bool:
+        # Analyze the changed files again. Return False if nothing is changed.
+        if changes is None or get_config_signature(self.path) != self._config_signature:
+            self.scan()
+            return True
+
+        dirty_files = self._expand_changes(changes)
+        git_index_signature = get_git_index_signature(self.path)
+        if git_index_signature != self._git_index_signature:
+            # Tracked files are changed, and the files ignored by reuse too
+            self._git_index_signature = git_index_signature
+            self.project = Project(self.path)
+            git_status = self._get_git_status()
+            if git_status and self._git_status:
+                if git_status.submodules != self._git_status.submodules:
+                    self.scan()
+                    return True
+                dirty_files.update(git_status.tracked ^ self._git_status.tracked)
+            self._git_status = git_status
+        if not dirty_files:
+            return False
+
+        for rel_path in dirty_files:
+            self._forget(rel_path)
+        existing_files = [rel_path for rel_path in dirty_files if os.path.isfile(os.path.join(self.path, rel_path))]
+        self._merge(collect_files(self.path, existing_files, self.exclude_index, self.project,
+                                  self.turn_on_exclude_config, self.cache, self._git_status))
+        return True
+
+    def _known_files(self) -> Set[str]:
+        return set(self.oss_pkg_info) | set(self.exclude_reasons) | set(self.file_records) | self.read_errors
+
+    def _expand_changes(self, changes: Set[str]) -> Set[str]:
+        # Changed directories are replaced with the files under them, before and after the change
+        dirty_files = set()
+        known_files = None
+        for rel_path in changes:
+            abs_path = os.path.join(self.path, rel_path)
+            is_dir = os.path.isdir(abs_path) and not os.path.islink(abs_path)
+            if is_dir:
+                dirty_files.update(self._list_files(rel_path))
+            else:
+                dirty_files.add(rel_path)
+                if rel_path.endswith(".license"):
+                    # The license of the file is in the .license file
+                    dirty_files.add(rel_path[:-len(".license")])
+            if is_dir or not os.path.exists(abs_path):
+                self.exclude_dirs.discard(rel_path)
+                if known_files is None:
+                    known_files = self._known_files()
+                prefix = rel_path + os.sep
+                dirty_files.update(file for file in known_files if file.startswith(prefix))
+        return dirty_files
+
+    def _list_files(self, dir_rel_path: str) -> List[str]:
+        files = []
+        for root, dirs, file_names in os.walk(os.path.join(self.path, dir_rel_path)):
+            root_rel_path = os.path.relpath(root, self.path)
+            dirs[:] = [dir for dir in dirs if self.is_dir_watched(dir, os.path.normpath(os.path.join(root_rel_path, dir)))]
+            files.extend(os.path.normpath(os.path.join(root_rel_path, file)) for file in file_names)
+        return files
+
+    def _forget(self, rel_path: str) -> None:
+        self.oss_pkg_info.pop(rel_path, None)
+        self.exclude_reasons.pop(rel_path, None)
+        self.file_records.pop(rel_path, None)
+        self.read_errors.discard(rel_path)
+
+    def _merge(self, inventory: FileInventory) -> None:
+        self.oss_pkg_info.update(dict.fromkeys(inventory.oss_pkg_info))
+        self.exclude_dirs.update(inventory.exclude_dirs)
+        for rel_path, reason in inventory.exclude_reasons.items():
+            self.exclude_reasons.setdefault(rel_path, reason)
+
+        exclude_set = FileExcludeSet(self.exclude_reasons) if self.turn_on_exclude_config else None
+        report = generate_project_report(self.project, inventory.files_to_analyze, self.cache, self.jobs, exclude_set,
+                                         self.scan_bytes, self.full_scan)
+        self.file_records.update(report.records)
+        self.read_errors.update(report.read_errors)
+
+    def get_project_report(self) -> LintReport:
+        # Shares the records, which are not changed until the next refresh
+        project_report = LintReport()
+        project_report.records = self.file_records
+        project_report.read_errors = self.read_errors
+        return project_report
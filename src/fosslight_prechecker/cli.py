@@ -6,36 +6,61 @@ import argparse
 import sys
 import os
 from fosslight_util.help import print_package_version
-from fosslight_oss_pkg._convert import convert_report
 from fosslight_prechecker._help import print_help_msg
-from fosslight_prechecker._constant import PKG_NAME
-from fosslight_prechecker._add import add_content
-from fosslight_prechecker._precheck import run_lint
-from fosslight_prechecker._download_lic import download_license
+from fosslight_prechecker._constant import PKG_NAME, DEFAULT_SCAN_BYTES, DEFAULT_PORT
+from fosslight_prechecker._cache import get_default_cache_dir
+from fosslight_prechecker._profile import DEFAULT_PROFILE_TOP_FILES
 from importlib.metadata import files as pkg_files
 
 
-def run_main(mode: str, path, output, format, no_log, disable, copyright, license, dl_url, parser, exclude_path):
+def run_main(mode: str, path, output, format, no_log, disable, copyright, license, dl_url, parser, exclude_path, cache_dir="", jobs=0, since="",
+             scan_bytes=DEFAULT_SCAN_BYTES, full_scan=False, port=DEFAULT_PORT, socket_path="", watch=False, roots_file="",
+             profile=0, report_memory=False, staged=False, rev="", cache_args=[], allow_add=False):
     if mode not in ['add', 'download'] and (copyright != "" or license != "" or dl_url != ""):
         parser.print_help()
         sys.exit(1)
+    if mode != "cache" and cache_args:
+        parser.print_help()
+        sys.exit(1)
 
+    # Each mode imports only what it needs, since reuse, jinja2 and the writers of fosslight_util take long to load
     if mode == "lint":
-        run_lint(path, disable, output, format, no_log, exclude_path)
+        from fosslight_prechecker._batch import is_batch
+        if is_batch(path, roots_file):
+            if staged or rev or watch or profile or report_memory:
+                print("(--staged, --rev, --watch, --profile, --report-memory option) Can't be used with several paths to check")
+                sys.exit(1)
+            from fosslight_prechecker._batch import run_lint_batch
+            run_lint_batch(path, roots_file, disable, output, format, no_log, exclude_path, cache_dir, jobs, since, scan_bytes,
+                           full_scan)
+        else:
+            from fosslight_prechecker._precheck import run_lint
+            run_lint(path, disable, output, format, no_log, exclude_path, cache_dir, jobs, since, scan_bytes, full_scan, watch,
+                     profile, report_memory, staged, rev)
     elif mode == "add":
-        add_content(path, license, copyright, dl_url, output, no_log, exclude_path)
+        from fosslight_prechecker._add import add_content
+        add_content(path, license, copyright, dl_url, output, no_log, exclude_path, cache_dir, jobs)
     elif mode == "convert":
+        from fosslight_oss_pkg._convert import convert_report
         convert_report(path, output, format, no_log)
     elif mode == "download":
+        from fosslight_prechecker._download_lic import download_license
         download_license(path, license)
+    elif mode == "serve":
+        from fosslight_prechecker._serve import run_serve
+        run_serve(port, socket_path, cache_dir, jobs, scan_bytes, full_scan, no_log, allow_add)
+    elif mode == "cache":
+        from fosslight_prechecker._cache_bundle import run_cache
+        run_cache(cache_args, cache_dir, scan_bytes, full_scan, no_log)
     else:
-        print("(mode) Not supported mode. Select one of 'lint', 'add', 'convert', or 'download'")
+        print("(mode) Not supported mode. Select one of 'lint', 'add', 'convert', 'download', 'serve', or 'cache'")
 
 
 def main():
     parser = argparse.ArgumentParser(description='FOSSLight Prechecker', prog='fosslight_prechecker', add_help=False)
-    parser.add_argument('mode', nargs='?', help='lint(default) | convert | add | download',
-                        choices=['lint', 'add', 'convert', 'download'], default='lint')
+    parser.add_argument('mode', nargs='?', help='lint(default) | convert | add | download | serve | cache',
+                        choices=['lint', 'add', 'convert', 'download', 'serve', 'cache'], default='lint')
+    parser.add_argument('cache_args', nargs='*', help="export <file> | import <file>(used in only 'cache' mode)")
     parser.add_argument('-h', '--help', help='Print help message', action='store_true', dest='help')
     parser.add_argument('-i', '--ignore', help='Do not write log to file', action='store_false', dest='log')
     parser.add_argument('-v', '--version', help='Print FOSSLight Prechecker version', action='store_true', dest='version')
@@ -49,12 +74,42 @@ def main():
     parser.add_argument('-u', '--dlurl', help="Download URL to add(used in only 'add' mode)", type=str, dest='dlurl', default="")
     parser.add_argument('-e', '--exclude', help='Path to exclude from checking', nargs='*', dest='exclude_path', default=[])
     parser.add_argument('--notice', help="Show OSS notice", action='store_true', required=False)
+    parser.add_argument('--cache', help="Cache the result of each file in the directory(default: ~/.cache/fosslight_prechecker)",
+                        nargs='?', const=get_default_cache_dir(), type=str, dest='cache_dir', default="")
+    parser.add_argument('-j', '--jobs', help="Number of processes to analyze files(default: number of CPUs)",
+                        type=int, dest='jobs', default=0)
+    parser.add_argument('--since', help="Analyze only the files changed since the git ref", type=str, dest='since', default="")
+    parser.add_argument('--scan-bytes', help="Number of leading bytes of each file to find license and copyright",
+                        type=int, dest='scan_bytes', default=DEFAULT_SCAN_BYTES)
+    parser.add_argument('--full-scan', help="Scan the whole file if license or copyright is not found in the leading bytes",
+                        action='store_true', dest='full_scan', default=False)
+    parser.add_argument('--watch', help="Keep linting the changed files until interrupted(used in only 'lint' mode)",
+                        action='store_true', dest='watch', default=False)
+    parser.add_argument('--roots', help="File listing the paths to check, one in each line(used in only 'lint' mode)",
+                        type=str, dest='roots_file', default="")
+    parser.add_argument('--profile', help="Time each phase and find the slowest files(used in only 'lint' mode)",
+                        nargs='?', const=DEFAULT_PROFILE_TOP_FILES, type=int, dest='profile', default=0)
+    parser.add_argument('--report-memory', help="Report the peak memory of each phase(used in only 'lint' mode)",
+                        action='store_true', dest='report_memory', default=False)
+    parser.add_argument('--staged', help="Check the contents staged in the git index(used in only 'lint' mode)",
+                        action='store_true', dest='staged', default=False)
+    parser.add_argument('--rev', help="Check the files of the git tree-ish without checking it out(used in only 'lint' mode)",
+                        type=str, dest='rev', default="")
+    parser.add_argument('--port', help="Port of localhost to listen on(used in only 'serve' mode)", type=int, dest='port',
+                        default=DEFAULT_PORT)
+    parser.add_argument('--socket', help="Unix socket to listen on instead of the port(used in only 'serve' mode)",
+                        type=str, dest='socket_path', default="")
+    parser.add_argument('--allow-add', help="Answer the 'add' requests modifying files(used in only 'serve' mode)",
+                        action='store_true', dest='allow_add', default=False)
     try:
         args = parser.parse_args()
     except SystemExit:
         sys.exit(0)
 
-    if not args.path:
+    if args.scan_bytes <= 0:
+        parser.error(f"(--scan-bytes option) Has to be a positive number: {args.scan_bytes}")
+
+    if not args.path and not args.roots_file:
         args.path = os.getcwd()
 
     if args.help:
@@ -90,7 +145,9 @@ def main():
                 print(f"Failed to output notice file '{fpath}': {exc}", file=sys.stderr)
     else:
         run_main(args.mode, args.path, args.output, args.format,
-                 args.log, args.disable, args.copyright, args.license, args.dlurl, parser, args.exclude_path)
+                 args.log, args.disable, args.copyright, args.license, args.dlurl, parser, args.exclude_path, args.cache_dir, args.jobs,
+                 args.since, args.scan_bytes, args.full_scan, args.port, args.socket_path, args.watch, args.roots_file,
+                 args.profile, args.report_memory, args.staged, args.rev, args.cache_args, args.allow_add)
 
 
 if __name__ == "__main__":
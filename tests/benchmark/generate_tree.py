@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+# Generate a synthetic source tree to benchmark fosslight_prechecker.
+# The same options and seed always generate the same tree.
+import os
+import sys
+import random
+import argparse
+
+FILES_PER_DIR = 50
+DIRS_PER_PARENT = 10
+# Extension -> comment prefix
+SOURCE_TYPES = {"py": "#", "c": "//", "js": "//", "java": "//", "sh": "#"}
+LICENSES = ["Apache-2.0", "MIT", "GPL-2.0-only", "BSD-3-Clause", "LGPL-2.1-or-later"]
+WORDS = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel", "india", "juliet"]
+# Name -> list of (ratio, min bytes, max bytes)
+SIZE_DISTRIBUTIONS = {
+    "small": [(1.0, 200, 2048)],
+    "mixed": [(0.7, 200, 2048), (0.25, 2048, 32768), (0.05, 32768, 524288)],
+    "large": [(0.5, 32768, 131072), (0.5, 131072, 1048576)],
+}
+
+
+def _get_size(rng: random.Random, size_distribution: str) -> int:
+    if size_distribution.isdigit():
+        return int(size_distribution)
+    point = rng.random()
+    for ratio, min_size, max_size in SIZE_DISTRIBUTIONS[size_distribution]:
+        if point < ratio:
+            return rng.randint(min_size, max_size)
+        point -= ratio
+    _, min_size, max_size = SIZE_DISTRIBUTIONS[size_distribution][-1]
+    return rng.randint(min_size, max_size)
+
+
+def _get_text(rng: random.Random, size: int, comment: str) -> str:
+    lines = []
+    length = 0
+    while length < size:
+        line = f"value_{len(lines)} = {rng.randrange(10 ** 6)}  {comment} {rng.choice(WORDS)} {rng.choice(WORDS)}\n"
+        lines.append(line)
+        length += len(line)
+    return "".join(lines)[:size]
+
+
+def _get_dir(index: int) -> str:
+    # d0/s0, d0/s1, ... with FILES_PER_DIR files in each
+    dir_index = index // FILES_PER_DIR
+    return os.path.join(f"d{dir_index // DIRS_PER_PARENT}", f"s{dir_index % DIRS_PER_PARENT}")
+
+
+def _write_sbom_info(dir_path: str, files: list, index: int) -> None:
+    with open(os.path.join(dir_path, "sbom-info.yaml"), "w", encoding="utf-8") as f:
+        f.write(f"synthetic-oss-{index}:\n")
+        f.write("- version: \"1.0.0\"\n")
+        f.write("  source name or path:\n")
+        for file in files:
+            f.write(f"  - {file}\n")
+        f.write(f"  license: \"{LICENSES[index % len(LICENSES)]}\"\n")
+        f.write(f"  copyright text: \"Copyright (c) 2026 Synthetic {index}\"\n")
+        f.write(f"  download location: \"https://example.com/synthetic-oss-{index}\"\n")
+
+
+def generate_tree(
+    path: str,
+    files: int = 1000,
+    size_distribution: str = "mixed",
+    header_ratio: float = 0.7,
+    binary_ratio: float = 0.05,
+    hidden_ratio: float = 0.05,
+    oss_pkg_info_ratio: float = 0.1,
+    seed: int = 0
+) -> dict:
+    # Return the numbers of the generated files.
+    # size_distribution is one of SIZE_DISTRIBUTIONS or the size of all files in bytes.
+    # oss_pkg_info_ratio is the ratio of folders having a sbom-info.yaml for the files without header.
+    rng = random.Random(seed)
+    counts = {"files": 0, "bytes": 0, "with header": 0, "binary": 0, "hidden": 0, "in sbom-info": 0, "sbom-info": 0}
+    # Folder -> files without header
+    no_header_files = {}
+
+    for index in range(files):
+        kind = rng.random()
+        if kind < hidden_ratio:
+            rel_dir = os.path.join(f".hidden{index % 3}", _get_dir(index))
+            counts["hidden"] += 1
+        else:
+            rel_dir = _get_dir(index)
+        dir_path = os.path.join(path, rel_dir)
+        os.makedirs(dir_path, exist_ok=True)
+        size = _get_size(rng, size_distribution)
+
+        if rng.random() < binary_ratio:
+            file_name = f"f{index}.dat"
+            content = bytes(rng.getrandbits(8) for _ in range(min(size, 4096))) + b"\0" * max(size - 4096, 1)
+            with open(os.path.join(dir_path, file_name), "wb") as f:
+                f.write(content)
+            counts["binary"] += 1
+        else:
+            extension = rng.choice(list(SOURCE_TYPES))
+            comment = SOURCE_TYPES[extension]
+            file_name = f"f{index}.{extension}"
+            text = _get_text(rng, size, comment)
+            if rng.random() < header_ratio:
+                text = (f"{comment} SPDX-FileCopyrightText: Copyright (c) 2026 Synthetic Author {index % 17}\n"
+                        f"{comment} SPDX-License-Identifier: {rng.choice(LICENSES)}\n") + text
+                counts["with header"] += 1
+            elif not rel_dir.startswith("."):
+                no_header_files.setdefault(rel_dir, []).append(file_name)
+            content = text.encode("utf-8")
+            with open(os.path.join(dir_path, file_name), "wb") as f:
+                f.write(content)
+        counts["files"] += 1
+        counts["bytes"] += len(content)
+
+    rel_dirs = sorted(no_header_files)
+    for sbom_index, rel_dir in enumerate(sorted(rng.sample(rel_dirs, round(len(rel_dirs) * oss_pkg_info_ratio)))):
+        _write_sbom_info(os.path.join(path, rel_dir), no_header_files[rel_dir], sbom_index)
+        counts["sbom-info"] += 1
+        counts["in sbom-info"] += len(no_header_files[rel_dir])
+    return counts
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--files', help="Number of files", type=int, dest='files', default=1000)
+    parser.add_argument('--sizes', help=f"Size distribution({', '.join(SIZE_DISTRIBUTIONS)}) or bytes of each file",
+                        type=str, dest='size_distribution', default="mixed")
+    parser.add_argument('--header-ratio', help="Ratio of files with license and copyright", type=float,
+                        dest='header_ratio', default=0.7)
+    parser.add_argument('--binary-ratio', help="Ratio of binary files", type=float, dest='binary_ratio', default=0.05)
+    parser.add_argument('--hidden-ratio', help="Ratio of files in hidden folders", type=float, dest='hidden_ratio',
+                        default=0.05)
+    parser.add_argument('--oss-pkg-info-ratio', help="Ratio of folders with sbom-info.yaml for the files without header",
+                        type=float, dest='oss_pkg_info_ratio', default=0.1)
+    parser.add_argument('--seed', help="Seed of the random generator", type=int, dest='seed', default=0)
+
+
+def get_tree_options(args: argparse.Namespace) -> dict:
+    return {"files": args.files, "size_distribution": args.size_distribution, "header_ratio": args.header_ratio,
+            "binary_ratio": args.binary_ratio, "hidden_ratio": args.hidden_ratio,
+            "oss_pkg_info_ratio": args.oss_pkg_info_ratio, "seed": args.seed}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic source tree")
+    parser.add_argument('path', help="Folder to generate the tree in, which must be empty or not exist")
+    add_arguments(parser)
+    args = parser.parse_args()
+    if os.path.isdir(args.path) and os.listdir(args.path):
+        print(f"Not empty: {args.path}", file=sys.stderr)
+        sys.exit(1)
+    print(generate_tree(args.path, **get_tree_options(args)))
+
+
+if __name__ == "__main__":
+    main()
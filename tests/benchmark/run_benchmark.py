@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+# Benchmark the modes of fosslight_prechecker on a synthetic tree(generate_tree.py).
+# Throughput(files per second) of each scenario is compared with the baseline of the same tree options,
+# and the exit code is 1 if a scenario is slower than the baseline by more than the threshold.
+# With --memory, the peak memory of each phase(--report-memory) is measured and compared instead.
+#   python tests/benchmark/run_benchmark.py --save-baseline    # Record the baseline of this machine
+#   python tests/benchmark/run_benchmark.py --threshold 0.2    # Fail if 20% slower than the baseline
+#   python tests/benchmark/run_benchmark.py --memory --baseline memory_baseline.json --save-baseline
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+from typing import Tuple
+from generate_tree import generate_tree, add_arguments, get_tree_options
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_THRESHOLD = 0.2
+FILE_MODE_FILES = 200
+SCENARIOS = ["lint", "lint files", "html", "add", "convert"]
+# Scenarios supporting --report-memory
+MEMORY_SCENARIOS = ["lint", "lint files", "html"]
+PRECHECKER = [sys.executable, "-m", "fosslight_prechecker.cli"]
+
+
+def _run(args: list, cwd: str) -> float:
+    start = time.perf_counter()
+    result = subprocess.run(PRECHECKER + args, cwd=cwd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE)
+    seconds = time.perf_counter() - start
+    # 0 or the exit code of the lint result
+    if result.returncode not in [0, 1] or (result.returncode == 1 and args[0] != "lint"):
+        raise RuntimeError(f"Failed {' '.join(args)}: {result.stderr.decode(errors='replace')[-1000:]}")
+    return seconds
+
+
+def _get_text_files(tree: str, count: int) -> list:
+    text_files = []
+    for root, dirs, files in os.walk(tree):
+        dirs[:] = sorted(dir for dir in dirs if not dir.startswith("."))
+        for file in sorted(files):
+            if not file.endswith((".dat", ".yaml")):
+                text_files.append(os.path.relpath(os.path.join(root, file), tree))
+                if len(text_files) >= count:
+                    return text_files
+    return text_files
+
+
+def _run_lint(args: list, result_file: str, cwd: str, memory: bool) -> Tuple[float, dict]:
+    if not memory:
+        return _run(["lint"] + args + ["-o", result_file, "-i"], cwd), {}
+    seconds = _run(["lint"] + args + ["-o", result_file, "-i", "--report-memory"], cwd)
+    with open(f"{os.path.splitext(result_file)[0]}_profile.json", "r", encoding="utf-8") as f:
+        return seconds, json.load(f)["memory"]
+
+
+def _run_scenario(name: str, tree: str, work_dir: str, memory: bool = False) -> Tuple[float, dict]:
+    # Seconds and the peak memory(--report-memory) if memory is True
+    output = os.path.join(work_dir, name)
+    if name == "lint":
+        return _run_lint(["-p", tree], os.path.join(output, "result.yaml"), work_dir, memory)
+    elif name == "lint files":
+        files = ",".join(_get_text_files(tree, FILE_MODE_FILES))
+        return _run_lint(["-p", files], os.path.join(output, "result.yaml"), tree, memory)
+    elif name == "html":
+        return _run_lint(["-p", tree, "-f", "html"], os.path.join(output, "result.html"), work_dir, memory)
+    elif name == "add":
+        # 'add' modifies the files, so a copy is used, which is not included in the time
+        copied_tree = os.path.join(work_dir, "add_tree")
+        shutil.rmtree(copied_tree, ignore_errors=True)
+        shutil.copytree(tree, copied_tree)
+        return _run(["add", "-p", copied_tree, "-l", "MIT", "-c", "2026 Benchmark", "-i"], work_dir), {}
+    elif name == "convert":
+        return _run(["convert", "-p", tree, "-o", os.path.join(output, "report.xlsx"), "-i"], work_dir), {}
+    raise ValueError(f"Unknown scenario: {name}")
+
+
+def run_benchmark(tree: str, tree_options: dict, file_count: int, scenarios: list, repeat: int, memory: bool = False) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="prechecker_benchmark_") as work_dir:
+        for name in scenarios:
+            runs = [_run_scenario(name, tree, work_dir, memory) for _ in range(repeat)]
+            seconds = statistics.median(run_seconds for run_seconds, _ in runs)
+            files = min(file_count, FILE_MODE_FILES) if name == "lint files" else file_count
+            results[name] = {"seconds": round(seconds, 3), "files per second": round(files / seconds, 1)}
+            if memory:
+                # The peak memory hardly changes between the runs, so the last one is used
+                results[name].update(runs[-1][1])
+                print(f"{name:12} {results[name]['peak traced MB']:8.1f} MB traced {results[name]['peak RSS MB']:8.1f} MB RSS")
+                for phase, phase_memory in results[name]["phases"].items():
+                    print(f"  {phase:20} {phase_memory['peak traced MB']:8.1f} MB traced")
+            else:
+                print(f"{name:12} {seconds:8.3f}s {results[name]['files per second']:10.1f} files/s")
+    return {"tree options": tree_options, "memory": memory, "results": results}
+
+
+def compare_with_baseline(benchmark: dict, baseline: dict, threshold: float) -> list:
+    # Scenarios slower(or using more memory with --memory) than the baseline by more than the threshold
+    if baseline.get("tree options") != benchmark["tree options"] or baseline.get("memory", False) != benchmark["memory"]:
+        print("The baseline has different tree options, so it is not compared")
+        return []
+    regressions = []
+    for name, result in benchmark["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        if benchmark["memory"]:
+            ratio = result["peak traced MB"] / max(base["peak traced MB"], 0.1)
+            print(f"{name:12} {ratio:8.2f}x of the baseline({base['peak traced MB']} MB traced)")
+            if ratio > 1 + threshold:
+                regressions.append(name)
+        else:
+            ratio = result["files per second"] / base["files per second"]
+            print(f"{name:12} {ratio:8.2f}x of the baseline({base['files per second']} files/s)")
+            if ratio < 1 - threshold:
+                regressions.append(name)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark fosslight_prechecker on a synthetic tree")
+    add_arguments(parser)
+    parser.add_argument('--tree', help="Folder to generate the tree in(default: temporary folder)", type=str,
+                        dest='tree', default="")
+    parser.add_argument('--scenario', help=f"Scenarios to run: {', '.join(SCENARIOS)}", nargs='*', dest='scenarios',
+                        default=SCENARIOS)
+    parser.add_argument('--repeat', help="Number of runs of each scenario, the median is used", type=int,
+                        dest='repeat', default=3)
+    parser.add_argument('--baseline', help="Baseline file", type=str, dest='baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', help="Save the result as the baseline", action='store_true',
+                        dest='save_baseline', default=False)
+    parser.add_argument('--threshold', help="Allowed ratio of slowdown(or memory growth) from the baseline", type=float,
+                        dest='threshold', default=DEFAULT_THRESHOLD)
+    parser.add_argument('--memory', help=f"Measure the peak memory of each phase instead({', '.join(MEMORY_SCENARIOS)})",
+                        action='store_true', dest='memory', default=False)
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"Unknown scenario: {', '.join(sorted(unknown))}")
+    if args.memory:
+        args.scenarios = [name for name in args.scenarios if name in MEMORY_SCENARIOS]
+
+    if args.tree and os.path.isdir(args.tree) and os.listdir(args.tree):
+        parser.error(f"(--tree option) Not empty: {args.tree}")
+
+    tree_options = get_tree_options(args)
+    tree = args.tree or tempfile.mkdtemp(prefix="prechecker_tree_")
+    try:
+        counts = generate_tree(tree, **tree_options)
+        print(f"Tree: {tree} {counts}")
+        benchmark = run_benchmark(tree, tree_options, counts["files"], args.scenarios, args.repeat, args.memory)
+    finally:
+        if not args.tree:
+            shutil.rmtree(tree, ignore_errors=True)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(benchmark, f, indent=2)
+        print(f"Saved the baseline: {args.baseline}")
+    elif os.path.isfile(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare_with_baseline(benchmark, json.load(f), args.threshold)
+        if regressions:
+            print(f"{'More memory' if args.memory else 'Slower'} than the baseline by more than {args.threshold:.0%}: "
+                  f"{', '.join(regressions)}")
+            sys.exit(1)
+    else:
+        print(f"No baseline: {args.baseline}, run with --save-baseline to record it")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+# Check the time to start fosslight_prechecker: printing the version and linting a file.
+# The exit code is 1 if the median of the runs is over the target.
+#   python tests/benchmark/run_startup.py
+#   python tests/benchmark/run_startup.py --executable dist/cli    # The build of cli.spec(pyinstaller cli.spec)
+import os
+import sys
+import time
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+DEFAULT_VERSION_TARGET = 0.5
+DEFAULT_LINT_TARGET = 1.0
+# The tags are split not to be taken as the ones of this file
+SAMPLE_FILE = "# SPDX-" "FileCopyrightText: Copyright 2026 Sample\n# SPDX-" "License-Identifier: MIT\nprint(1)\n"
+
+
+def _time_command(command: list, cwd: str, repeat: int) -> float:
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run(command, cwd=cwd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE)
+        seconds.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            raise RuntimeError(f"Failed {' '.join(command)}: {result.stderr.decode(errors='replace')[-1000:]}")
+    return statistics.median(seconds)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check the start time of fosslight_prechecker")
+    parser.add_argument('--executable', help="Executable to run instead of the installed package, ex) dist/cli",
+                        type=str, dest='executable', default="")
+    parser.add_argument('--repeat', help="Number of runs, the median is used", type=int, dest='repeat', default=5)
+    parser.add_argument('--version-target', help="Seconds allowed to print the version", type=float,
+                        dest='version_target', default=DEFAULT_VERSION_TARGET)
+    parser.add_argument('--lint-target', help="Seconds allowed to lint a file", type=float, dest='lint_target',
+                        default=DEFAULT_LINT_TARGET)
+    args = parser.parse_args()
+
+    prechecker = [os.path.abspath(args.executable)] if args.executable else [sys.executable, "-m", "fosslight_prechecker.cli"]
+    over_target = []
+    with tempfile.TemporaryDirectory(prefix="prechecker_startup_") as work_dir:
+        with open(os.path.join(work_dir, "sample.py"), "w", encoding="utf-8") as f:
+            f.write(SAMPLE_FILE)
+        # A run first, not to time the compile of the bytecode or the unpacking of the executable
+        _time_command(prechecker + ["-v"], work_dir, 1)
+
+        checks = [("version", prechecker + ["-v"], args.version_target),
+                  ("lint a file", prechecker + ["lint", "-p", "sample.py", "-o", "result.yaml", "-i"], args.lint_target)]
+        for name, command, target in checks:
+            seconds = _time_command(command, work_dir, args.repeat)
+            print(f"{name:12} {seconds:6.3f}s (target: {target}s)")
+            if seconds > target:
+                over_target.append(name)
+
+    if over_target:
+        print(f"Over the target: {', '.join(over_target)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+import os
+import sys
+import shutil
+import subprocess
+import pytest
+import yaml
+
+COPYRIGHT = "# Copyright 2026 LG Electronics Inc.\n"
+
+
+def license_line(identifier: str) -> str:
+    # The tag is split not to be taken as the one of this file
+    return f"# SPDX-" f"License-Identifier: {identifier}\n"
+
+
+def write_file(root: str, rel_path: str, contents) -> None:
+    path = os.path.join(root, rel_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    mode = "wb" if isinstance(contents, bytes) else "w"
+    with open(path, mode) as f:
+        f.write(contents)
+
+
+def git(root: str, *args) -> None:
+    subprocess.check_call(["git", "-C", root, "-c", "user.email=prechecker@test", "-c", "user.name=prechecker"] + list(args),
+                          stdout=subprocess.DEVNULL)
+
+
+def _normalize(result):
+    # Result without the tool information, with the lists sorted
+    if isinstance(result, dict):
+        return {key: _normalize(value) for key, value in result.items() if key != "Tool Info"}
+    if isinstance(result, list):
+        return sorted(_normalize(value) for value in result)
+    return result
+
+
+def lint(tree: str, output: str, *args) -> dict:
+    # Result of the lint mode in another process, so that the global state of a run doesn't remain
+    cmd = [sys.executable, "-c", "from fosslight_prechecker.cli import main; main()",
+           "lint", "-p", tree, "-o", output, "-i"] + list(args)
+    subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, cwd=os.path.dirname(tree))
+    with open(output, encoding="utf-8") as f:
+        return _normalize(yaml.safe_load(f))
+
+
+@pytest.fixture
+def sample_tree(tmp_path) -> str:
+    # Git repository with files missing license or copyright and excluded files having them
+    if shutil.which("git") is None:
+        pytest.skip("git is not installed")
+    root = str(tmp_path / "tree")
+    write_file(root, "src/ok.py", COPYRIGHT + license_line("Apache-2.0"))
+    write_file(root, "src/no_notice.py", "print('no notice')\n")
+    write_file(root, "src/sub/no_copyright.py", license_line("BSD-3-Clause"))
+    # Excluded files: in a hidden folder below the top level and binary
+    write_file(root, "src/.hidden/excluded.py", COPYRIGHT + license_line("MIT"))
+    write_file(root, "src/.hidden/excluded_no_copyright.py", license_line("Zlib"))
+    write_file(root, "src/data.bin", b"\x00\x01\x02" * 100)
+    write_file(root, "docs/readme.md", COPYRIGHT + license_line("ISC"))
+    write_file(root, ".gitignore", "ignored.py\n")
+    write_file(root, "ignored.py", "print('ignored')\n")
+    git(root, "init", "-q")
+    git(root, "add", "-A")
+    git(root, "commit", "-q", "-m", "init")
+    return root
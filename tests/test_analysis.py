@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+from fosslight_prechecker._analysis import extract_file_info_from_contents
+
+SCAN_BYTES = 4096
+# The tags are split not to be taken as the ones of this file
+LICENSE_TAG = "SPDX-" "License-Identifier"
+
+
+def _contents_with_line_at(offset: int, line: str) -> bytes:
+    head = f"# {LICENSE_TAG}: MIT\n"
+    head += "#" * (offset - len(head) - 1) + "\n"
+    return (head + line + "\nprint(1)\n").encode()
+
+
+def test_line_cut_by_the_window_is_read_to_its_end():
+    contents = _contents_with_line_at(SCAN_BYTES - 13, "# Copyright 2026 LG Electronics Inc.")
+    file_info = extract_file_info_from_contents("a.py", contents, SCAN_BYTES)
+    assert file_info.copyright_lines == ["Copyright 2026 LG Electronics Inc."]
+
+
+def test_tag_cut_in_a_too_long_line_is_not_taken():
+    line = f"# {LICENSE_TAG}: Apache-2.0" + "x" * 2000
+    contents = _contents_with_line_at(SCAN_BYTES - 20, line)
+    file_info = extract_file_info_from_contents("a.py", contents, SCAN_BYTES)
+    assert [expression for expression, _ in file_info.licenses] == ["MIT"]
+
+
+def test_line_after_the_window_is_not_scanned():
+    contents = _contents_with_line_at(SCAN_BYTES, "# Copyright 2026 LG Electronics Inc.")
+    file_info = extract_file_info_from_contents("a.py", contents, SCAN_BYTES)
+    assert file_info.copyright_lines == []
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+import os
+import shutil
+import subprocess
+import pytest
+from fosslight_prechecker._cache import FileInfo, LintCache, get_content_hash
+
+FILE_INFO = FileInfo([("MIT", ["MIT"])], ["Copyright 2026 LG Electronics Inc."])
+
+
+def _write(path, contents):
+    with open(path, "w") as f:
+        f.write(contents)
+    return str(path)
+
+
+def _saved_and_loaded(cache: LintCache, **kwargs) -> LintCache:
+    cache.save()
+    loaded = LintCache(cache.cache_dir, **kwargs)
+    loaded.load()
+    return loaded
+
+
+def test_result_is_found_until_the_file_is_changed(tmp_path):
+    path = _write(tmp_path / "a.py", "print(1)\n")
+    cache = LintCache(str(tmp_path / "cache"))
+    assert cache.get_file_info(path) is None
+    cache.put_file_info(path, FILE_INFO)
+
+    loaded = _saved_and_loaded(cache)
+    assert loaded.get_file_info(path).to_list() == FILE_INFO.to_list()
+    _write(path, "print('changed')\n")
+    assert loaded.get_file_info(path) is None
+    assert (loaded.hits, loaded.misses) == (1, 1)
+
+
+def test_result_is_found_by_the_same_contents_in_another_path(tmp_path):
+    path = _write(tmp_path / "a.py", "print(1)\n")
+    cache = LintCache(str(tmp_path / "cache"))
+    cache.put_file_info(path, FILE_INFO)
+
+    loaded = _saved_and_loaded(cache)
+    copied = shutil.copy(path, tmp_path / "copied.py")
+    assert loaded.get_file_info(copied).to_list() == FILE_INFO.to_list()
+    assert loaded.get_file_info_by_object(get_content_hash(path)).to_list() == FILE_INFO.to_list()
+    assert loaded.get_file_info_by_object("0" * 40) is None
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_content_hash_is_the_git_blob_object(tmp_path):
+    path = _write(tmp_path / "a.py", "print(1)\n")
+    git_object = subprocess.check_output(["git", "hash-object", path]).decode().strip()
+    assert get_content_hash(path) == git_object
+
+
+def test_cache_of_another_version_is_not_loaded(tmp_path):
+    path = _write(tmp_path / "a.py", "print(1)\n")
+    cache = LintCache(str(tmp_path / "cache"), options="scan 4096 bytes")
+    cache.put_file_info(path, FILE_INFO)
+    loaded = _saved_and_loaded(cache, options="scan 100 bytes")
+    assert loaded.entry_count == 0
+
+
+def test_least_recently_used_entries_are_dropped(tmp_path):
+    paths = [_write(tmp_path / f"{name}.py", f"{name} = 1\n") for name in ["a", "b", "c"]]
+    cache = LintCache(str(tmp_path / "cache"), max_entries=2)
+    for path in paths:
+        cache.put_file_info(path, FILE_INFO)
+    # 'a' is used again, so 'b' is the least recently used
+    assert cache.get_file_info(paths[0]) is not None
+
+    loaded = _saved_and_loaded(cache, max_entries=2)
+    assert loaded.entry_count == 2
+    assert loaded.get_file_info(paths[1]) is None
+    assert loaded.get_file_info(paths[0]) is not None
+    assert loaded.get_file_info(paths[2]) is not None
+
+
+def test_bundle_is_imported_to_another_cache(tmp_path):
+    path = _write(tmp_path / "a.py", "print(1)\n")
+    cache = LintCache(str(tmp_path / "cache"))
+    cache.put_file_info(path, FILE_INFO)
+    bundle_file = str(tmp_path / "cache.bundle")
+    assert cache.export_bundle(bundle_file) == 1
+
+    other = LintCache(str(tmp_path / "other"))
+    assert other.import_bundle(bundle_file) == 1
+    # Imported results have no path, they are found by the contents
+    copied = shutil.copy(path, tmp_path / "copied.py")
+    assert other.get_file_info(copied).to_list() == FILE_INFO.to_list()
+    assert other.import_bundle(bundle_file) == 0
+
+
+def test_broken_bundle_or_bundle_of_another_version_is_refused(tmp_path):
+    path = _write(tmp_path / "a.py", "print(1)\n")
+    cache = LintCache(str(tmp_path / "cache"))
+    cache.put_file_info(path, FILE_INFO)
+    bundle_file = str(tmp_path / "cache.bundle")
+    cache.export_bundle(bundle_file)
+
+    with pytest.raises(ValueError, match="another version"):
+        LintCache(str(tmp_path / "other"), options="full scan").import_bundle(bundle_file)
+    with open(bundle_file, "ab") as f:
+        f.write(b"broken")
+    with pytest.raises(ValueError, match="checksum"):
+        LintCache(str(tmp_path / "other")).import_bundle(bundle_file)
+    with pytest.raises(ValueError, match="Not a lint cache bundle"):
+        LintCache(str(tmp_path / "other")).import_bundle(_write(tmp_path / "not_bundle", "text\n"))
+    assert not os.path.exists(tmp_path / "other")
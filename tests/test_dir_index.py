@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+import os
+from conftest import COPYRIGHT, git, license_line, lint, write_file
+from fosslight_prechecker._analysis import LintReport, make_file_record
+from fosslight_prechecker._cache import LintCache
+from fosslight_prechecker._dir_index import DirIndex, get_dir_fingerprints
+from fosslight_prechecker._git import GitFileStatus
+
+
+def test_cold_and_warm_runs_give_the_same_result(sample_tree, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    cold = lint(sample_tree, str(tmp_path / "cold.yaml"), "--cache", cache_dir)
+    assert os.listdir(os.path.join(cache_dir, "dir_index"))
+    warm = lint(sample_tree, str(tmp_path / "warm.yaml"), "--cache", cache_dir)
+    assert cold == warm
+    assert "MIT" in str(cold)
+
+    # A changed file is analyzed again while the other folders are reused
+    write_file(sample_tree, "src/sub/no_copyright.py", COPYRIGHT + license_line("BSD-3-Clause"))
+    git(sample_tree, "commit", "-q", "-a", "-m", "change")
+    changed = lint(sample_tree, str(tmp_path / "changed.yaml"), "--cache", cache_dir)
+    assert changed == lint(sample_tree, str(tmp_path / "changed_cold.yaml"), "--cache", str(tmp_path / "other_cache"))
+
+
+def test_restore_keeps_the_licenses_of_excluded_files(tmp_path):
+    cache = LintCache(str(tmp_path))
+    report = LintReport()
+    report.records["src/excluded.py"] = make_file_record(["MIT", "-"], "-")
+    report.records["src/ok.py"] = make_file_record(["Apache-2.0"], "Copyright")
+    report.records["src/no_notice.py"] = make_file_record([], "")
+    exclude_files = ["src/excluded.py"]
+
+    dir_index = DirIndex(cache, str(tmp_path))
+    dir_index.find_unchanged_dirs({"": "root", "src": "src"})
+    dir_index.update(report, [], exclude_files)
+    dir_index.save()
+
+    loaded = DirIndex(cache, str(tmp_path))
+    loaded.load()
+    assert loaded.find_unchanged_dirs({"": "root", "src": "src"}) == {""}
+    restored = LintReport()
+    loaded.restore(restored, [], [])
+    assert restored.used_licenses == report.used_licenses
+    # Only the files that are not excluded are in the total
+    assert restored.reused_file_count == 1
+    assert list(restored.records) == ["src/no_notice.py"]
+
+
+OBJECTS = {"a/x.py": "1", "a/b/y.py": "2", "c/z.py": "3", "top.py": "4"}
+
+
+def _git_status(objects=OBJECTS, untracked=()):
+    # Paths are relative with os.sep as the ones of get_git_file_status
+    git_status = GitFileStatus()
+    git_status.objects = {os.path.normpath(rel_path): git_object for rel_path, git_object in objects.items()}
+    git_status.tracked = set(git_status.objects)
+    git_status.untracked = {os.path.normpath(rel_path) for rel_path in untracked}
+    return git_status
+
+
+def _changed(rel_path, git_object):
+    return dict(OBJECTS, **{rel_path: git_object})
+
+
+def test_fingerprint_changes_with_the_files_below_the_folder():
+    fingerprints = get_dir_fingerprints(_git_status(), [], "salt")
+    assert set(fingerprints) == {"", "a", os.path.join("a", "b"), "c"}
+
+    changed = get_dir_fingerprints(_git_status(_changed("a/b/y.py", "5")), [], "salt")
+    assert {rel_dir for rel_dir in fingerprints if fingerprints[rel_dir] != changed[rel_dir]} == {"", "a", os.path.join("a", "b")}
+
+    # A renamed file changes the fingerprint even with the same contents
+    renamed = {"a/x.py": "1", "a/b/renamed.py": "2", "c/z.py": "3", "top.py": "4"}
+    assert get_dir_fingerprints(_git_status(renamed), [], "salt")["a"] != fingerprints["a"]
+    # Options of the run are in the salt
+    assert get_dir_fingerprints(_git_status(), [], "other")["c"] != fingerprints["c"]
+
+
+def test_folders_with_files_unknown_to_git_have_no_fingerprint():
+    fingerprints = get_dir_fingerprints(_git_status(untracked=["a/b/new.py"]), [], "salt")
+    assert set(fingerprints) == {"c"}
+    fingerprints = get_dir_fingerprints(_git_status(), [os.path.join("c", "ignored.py")], "salt")
+    assert set(fingerprints) == {"a", os.path.join("a", "b")}
+
+
+def test_only_the_top_unchanged_folders_are_reused(tmp_path):
+    cache = LintCache(str(tmp_path))
+    fingerprints = get_dir_fingerprints(_git_status(), [], "salt")
+    dir_index = DirIndex(cache, str(tmp_path))
+    dir_index.find_unchanged_dirs(fingerprints)
+    dir_index.update(LintReport(), [], [])
+    dir_index.save()
+
+    loaded = DirIndex(cache, str(tmp_path))
+    loaded.load()
+    changed = get_dir_fingerprints(_git_status(_changed("top.py", "5")), [], "salt")
+    assert loaded.find_unchanged_dirs(changed) == {"a", "c"}
+    assert loaded.reused_dirs == ["a", "c"]
+
+    # The index of other options is not used
+    other = DirIndex(cache, str(tmp_path), "other options")
+    other.load()
+    assert other.find_unchanged_dirs(fingerprints) == set()
+
+
+def test_folders_of_unreadable_files_are_not_kept(tmp_path):
+    cache = LintCache(str(tmp_path))
+    fingerprints = get_dir_fingerprints(_git_status(), [], "salt")
+    report = LintReport()
+    report.read_errors.add(os.path.join("a", "b", "y.py"))
+    dir_index = DirIndex(cache, str(tmp_path))
+    dir_index.find_unchanged_dirs(fingerprints)
+    dir_index.update(report, [], [])
+    dir_index.save()
+
+    loaded = DirIndex(cache, str(tmp_path))
+    loaded.load()
+    assert loaded.find_unchanged_dirs(fingerprints) == {"c"}
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+import os
+from fosslight_prechecker._exclude import FileExcludeSet, PathExcludeIndex, get_exclude_index, is_default_exclude_dir
+
+
+def test_paths_below_an_excluded_folder_are_excluded(tmp_path):
+    index = PathExcludeIndex([str(tmp_path / "src" / "gen")])
+    assert index.is_excluded(str(tmp_path / "src" / "gen"))
+    assert index.is_excluded(str(tmp_path / "src" / "gen" / "sub" / "a.py"))
+    assert not index.is_excluded(str(tmp_path / "src"))
+    assert not index.is_excluded(str(tmp_path / "src" / "main.py"))
+
+
+def test_path_with_an_excluded_path_as_string_prefix_is_not_excluded(tmp_path):
+    index = PathExcludeIndex([str(tmp_path / "src" / "gen"), str(tmp_path / "a.py")])
+    assert not index.is_excluded(str(tmp_path / "src" / "generated"))
+    assert not index.is_excluded(str(tmp_path / "src" / "gen.py"))
+    assert not index.is_excluded(str(tmp_path / "a.pyc"))
+
+
+def test_relative_and_not_normalized_paths_are_matched(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    index = PathExcludeIndex([os.path.join("src", "gen", "")])
+    assert index.is_excluded(str(tmp_path / "src" / "gen" / "a.py"))
+    assert index.is_excluded(os.path.join("src", "other", "..", "gen", "a.py"))
+
+
+def test_paths_below_an_excluded_folder_are_counted_once(tmp_path):
+    index = PathExcludeIndex()
+    assert not index
+    index.add(str(tmp_path / "src" / "gen" / "a.py"))
+    index.add(str(tmp_path / "src" / "gen" / "b.py"))
+    assert len(index) == 2
+    index.add(str(tmp_path / "src" / "gen"))
+    assert len(index) == 1
+    index.add(str(tmp_path / "src" / "gen" / "c.py"))
+    assert len(index) == 1
+
+
+def test_children_are_matched_from_the_node_of_the_parent(tmp_path):
+    index = PathExcludeIndex([str(tmp_path / "src" / "gen"), str(tmp_path / "src" / "sub" / "a.py")])
+    assert index.node_of(str(tmp_path / "docs")) is None
+    assert index.node_of(str(tmp_path / "src" / "gen")) is None
+    src = index.node_of(str(tmp_path / "src"))
+    assert PathExcludeIndex.match_child(src, "gen") == (True, src["gen"])
+    assert PathExcludeIndex.match_child(src, "main.py") == (False, None)
+    excluded, sub = PathExcludeIndex.match_child(src, "sub")
+    assert not excluded
+    assert PathExcludeIndex.match_child(sub, "a.py")[0]
+    assert PathExcludeIndex.match_child(None, "a.py") == (False, None)
+
+
+def test_default_exclude_folders_are_only_at_the_top_level():
+    assert is_default_exclude_dir("venv3", True)
+    assert is_default_exclude_dir("node_modules", True)
+    assert is_default_exclude_dir(".git", True)
+    assert not is_default_exclude_dir("src", True)
+    assert not is_default_exclude_dir(".hidden", False)
+
+
+def test_file_exclude_set_matches_normalized_relative_paths():
+    exclude_set = FileExcludeSet(["src/./a.py", "b.py"])
+    assert exclude_set.is_excluded(os.path.join("src", "a.py"))
+    assert exclude_set.is_excluded("b.py")
+    assert not exclude_set.is_excluded("a.py")
+
+
+def test_exclude_index_from_patterns(tmp_path):
+    for rel_path in ["src/gen/a.py", "src/main.py", "test/b.py"]:
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("print(1)\n")
+    assert not get_exclude_index([], str(tmp_path))
+    index = get_exclude_index(["src/gen", "test/"], str(tmp_path))
+    assert index.is_excluded(str(tmp_path / "src" / "gen" / "a.py"))
+    assert index.is_excluded(str(tmp_path / "test" / "b.py"))
+    assert not index.is_excluded(str(tmp_path / "src" / "main.py"))
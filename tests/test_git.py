@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+import os
+import shutil
+import subprocess
+import pytest
+from conftest import git, write_file
+from fosslight_prechecker._git import get_git_file_status, get_staged_files, get_tree_files, iter_objects
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def _hash_object(root: str, rel_path: str) -> str:
+    return subprocess.check_output(["git", "-C", root, "hash-object", rel_path]).decode().strip()
+
+
+@pytest.fixture
+def repo(tmp_path) -> str:
+    root = str(tmp_path / "repo")
+    write_file(root, "src/a.py", "print('a')\n")
+    write_file(root, "src/file with space.py", "print('space')\n")
+    write_file(root, "src/changed.py", "print('changed')\n")
+    write_file(root, ".gitignore", "ign*\n")
+    git(root, "init", "-q")
+    git(root, "add", "-A")
+    git(root, "commit", "-q", "-m", "init")
+    return root
+
+
+def test_files_are_classified_by_git(repo):
+    write_file(repo, "src/untracked.py", "print('untracked')\n")
+    write_file(repo, "ignored.py", "print('ignored')\n")
+    write_file(repo, "ign_forced.py", "print('forced')\n")
+    git(repo, "add", "-f", "ign_forced.py")
+
+    git_status = get_git_file_status(repo)
+    assert git_status.tracked == {".gitignore", "ign_forced.py", os.path.join("src", "a.py"), os.path.join("src", "changed.py"),
+                                  os.path.join("src", "file with space.py")}
+    assert git_status.untracked == {os.path.join("src", "untracked.py")}
+    assert not git_status.objects
+    assert not git_status.is_excluded(os.path.join("src", "a.py"))
+    assert git_status.is_excluded(os.path.join("src", "untracked.py"))
+    # Ignored files are not listed at all
+    assert git_status.is_excluded("ignored.py")
+
+
+def test_objects_are_kept_only_for_unchanged_files(repo):
+    write_file(repo, "src/changed.py", "print('changed again')\n")
+    git_status = get_git_file_status(repo, with_objects=True)
+    assert os.path.join("src", "changed.py") in git_status.tracked
+    assert os.path.join("src", "changed.py") not in git_status.objects
+    assert git_status.objects[os.path.join("src", "a.py")] == _hash_object(repo, "src/a.py")
+    assert git_status.objects[os.path.join("src", "file with space.py")] == _hash_object(repo, "src/file with space.py")
+
+
+def test_paths_are_relative_to_the_subfolder(repo):
+    git_status = get_git_file_status(os.path.join(repo, "src"))
+    assert git_status.tracked == {"a.py", "changed.py", "file with space.py"}
+
+
+def test_files_of_submodules_and_nested_repositories(repo):
+    # A gitlink in the index is a submodule, whose files git doesn't list
+    head = subprocess.check_output(["git", "-C", repo, "rev-parse", "HEAD"]).decode().strip()
+    git(repo, "update-index", "--add", "--cacheinfo", f"160000,{head},module")
+    write_file(repo, "module/m.py", "print('module')\n")
+    nested = os.path.join(repo, "nested")
+    write_file(nested, "n.py", "print('nested')\n")
+    git(nested, "init", "-q")
+    git(nested, "add", "-A")
+
+    git_status = get_git_file_status(repo)
+    assert git_status.submodules == {"module"}
+    assert "module" not in git_status.tracked
+    assert not git_status.is_excluded(os.path.join("module", "m.py"))
+    assert git_status.untracked_dirs == {"nested"}
+
+
+def test_status_out_of_a_repository_is_none(tmp_path):
+    assert get_git_file_status(str(tmp_path)) is None
+
+
+def test_staged_files_are_the_added_and_modified_ones(repo):
+    write_file(repo, "src/changed.py", "print('staged')\n")
+    write_file(repo, "src/new file.py", "print('new')\n")
+    os.symlink("a.py", os.path.join(repo, "src", "link.py"))
+    git(repo, "add", "-A")
+    git(repo, "rm", "-q", "--cached", "src/a.py")
+    # Not staged, so the staged contents are kept
+    write_file(repo, "src/changed.py", "print('not staged')\n")
+
+    staged_files = get_staged_files(os.path.join(repo, "src"))
+    assert set(staged_files) == {"changed.py", "new file.py"}
+    assert [contents for _, contents in iter_objects(repo, [staged_files["changed.py"]])] == [b"print('staged')\n"]
+
+
+def test_tree_files_of_a_revision(repo):
+    os.symlink("a.py", os.path.join(repo, "src", "link.py"))
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", "link")
+    git(repo, "rm", "-q", "src/changed.py")
+    git(repo, "commit", "-q", "-m", "remove")
+
+    assert set(get_tree_files(repo, "HEAD")) == {".gitignore", os.path.join("src", "a.py"), os.path.join("src", "file with space.py")}
+    tree_files = get_tree_files(os.path.join(repo, "src"), "HEAD~1")
+    assert set(tree_files) == {"a.py", "changed.py", "file with space.py"}
+    assert tree_files["a.py"] == _hash_object(repo, "src/a.py")
+
+
+def test_objects_are_read_in_the_order_of_the_names(repo):
+    write_file(repo, "src/a.py", "print('staged a')\n")
+    git(repo, "add", "src/a.py")
+    head_tree = subprocess.check_output(["git", "-C", repo, "rev-parse", "HEAD^{tree}"]).decode().strip()
+    names = [_hash_object(repo, "src/changed.py"), "0" * 40, ":./a.py", head_tree, ":./missing.py"]
+
+    objects = list(iter_objects(os.path.join(repo, "src"), names))
+    assert objects == [(names[0], b"print('changed')\n"), (names[1], None), (":./a.py", b"print('staged a')\n"),
+                       (head_tree, None), (":./missing.py", None)]
+
+
+def test_reading_objects_can_stop_early(repo):
+    names = [_hash_object(repo, "src/a.py")] * 1000
+    for _, contents in iter_objects(repo, names):
+        assert contents == b"print('a')\n"
+        break
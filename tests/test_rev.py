@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+from conftest import git, lint, write_file
+
+SUMMARY = "Checking copyright/license writing rules"
+
+
+def _without_scope(result: dict) -> dict:
+    # The totals of --rev are followed by "(rev <rev>)"
+    summary = result[SUMMARY]["Summary"]
+    for key, value in summary.items():
+        if key.endswith("/ total"):
+            summary[key] = value.split(" (")[0]
+    return result
+
+
+def test_rev_gives_the_same_result_as_the_folder(sample_tree, tmp_path):
+    folder = lint(sample_tree, str(tmp_path / "folder.yaml"))
+    assert "MIT" in folder[SUMMARY]["Summary"]["Detected Licenses"]
+
+    # The working tree is changed after the commit, which --rev doesn't see
+    write_file(sample_tree, "src/ok.py", "print('changed')\n")
+    git(sample_tree, "rm", "-q", "--cached", "src/no_notice.py")
+    rev = lint(sample_tree, str(tmp_path / "rev.yaml"), "--rev", "HEAD")
+    assert _without_scope(rev) == folder
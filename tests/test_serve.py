@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+import pytest
+from fosslight_prechecker._cache import LintCache
+from fosslight_prechecker._precheck import LintState
+from fosslight_prechecker._serve import LintServer
+
+
+@pytest.mark.parametrize("request_body, error", [
+    ({"path": 5}, "'path' has to be a string"),
+    ({"exclude_path": "out"}, "'exclude_path' has to be a list of strings"),
+    ({"files": "a.py"}, "'files' has to be a list of strings"),
+    ({"files": [1]}, "'files' has to be a list of strings"),
+    ({"disable": "yes"}, "'disable' has to be true or false"),
+    ({"since": ["main"]}, "'since' has to be a string"),
+    ({"files": ["a.py"], "since": "main"}, "'since' can't be used with 'files'"),
+])
+def test_wrong_lint_request_is_refused(tmp_path, request_body, error):
+    lint_server = LintServer(LintCache(str(tmp_path / "cache")))
+    request = {"path": str(tmp_path)}
+    request.update(request_body)
+    with pytest.raises(ValueError, match=error):
+        lint_server.lint(request, LintState())
+
+
+def test_add_request_with_wrong_types_is_refused(tmp_path):
+    lint_server = LintServer(LintCache(str(tmp_path / "cache")), allow_add=True)
+    with pytest.raises(ValueError, match="'license' has to be a string"):
+        lint_server.add({"path": str(tmp_path), "license": ["MIT"]}, LintState())
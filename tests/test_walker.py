@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 LG Electronics Inc.
+# SPDX-License-Identifier: GPL-3.0-only
+import os
+import shutil
+import pytest
+from reuse.project import Project
+from conftest import git, write_file
+import fosslight_prechecker._walker as walker
+from fosslight_prechecker._exclude import PathExcludeIndex
+
+
+def test_files_of_hidden_folders_are_classified_once(tmp_path, monkeypatch):
+    root = str(tmp_path)
+    write_file(root, "src/.hidden/data.bin", b"\x00\x01\x02")
+    write_file(root, "src/.hidden/requirements.txt", "pyyaml\n")
+    write_file(root, "src/.hidden/sub/a.py", "print('a')\n")
+    write_file(root, "src/b.py", "print('b')\n")
+    read_files = []
+    monkeypatch.setattr(walker, "is_binary_file", lambda file_path, *args: read_files.append(file_path))
+
+    inventory = walker.walk_path(root, PathExcludeIndex(), Project(root))
+    hidden_files = [os.path.join("src", ".hidden", "data.bin"), os.path.join("src", ".hidden", "requirements.txt")]
+    assert sorted(inventory.exclude_files) == hidden_files
+    assert set(inventory.exclude_reasons.values()) == {walker.EXCLUDED_HIDDEN_FOLDER}
+    assert inventory.oss_pkg_info == [os.path.join("src", ".hidden", "requirements.txt")]
+    # Only the files out of the hidden folder are read
+    assert sorted(read_files) == [os.path.join(root, "src", ".hidden", "sub", "a.py"), os.path.join(root, "src", "b.py")]
+
+    files = hidden_files + [os.path.join("src", "b.py")]
+    collected = walker.collect_files(root, files, PathExcludeIndex(), Project(root))
+    assert sorted(collected.exclude_files) == hidden_files
+    tree_inventory, files_to_read = walker.collect_tree_files(root, files, PathExcludeIndex())
+    assert sorted(tree_inventory.exclude_files) == hidden_files
+    assert files_to_read == [os.path.join("src", "b.py")]
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_ignored_paths_of_reuse(tmp_path):
+    root = str(tmp_path)
+    write_file(root, ".gitignore", "build/\nignored.py\n")
+    write_file(root, "build/out.py", "print('out')\n")
+    write_file(root, "ignored.py", "print('ignored')\n")
+    git(root, "init", "-q")
+    project = Project(root)
+    assert sorted(walker.get_ignored_paths(project)) == ["build", "ignored.py"]
+
+    # Without the set of reuse, the ignored files are unknown
+    del project.vcs_strategy._all_ignored_files
+    assert walker.get_ignored_paths(project) is None